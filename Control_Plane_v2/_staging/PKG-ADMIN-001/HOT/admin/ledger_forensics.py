@@ -83,8 +83,12 @@ def entry_matches_session(entry, session_id: str) -> bool:
 def read_all_ledgers(root: Path, session_id: str) -> dict[str, list]:
     grouped: dict[str, list] = {"ho2m": [], "ho1m": [], "governance": []}
     for source in ("ho2m", "ho1m", "governance"):
-        entries, _err = read_entries(root, source)
-        grouped[source] = [e for e in entries if entry_matches_session(e, session_id)]
+        ledger_path, _err = resolve_ledger_source(root, source)
+        if ledger_path is None or not ledger_path.exists():
+            continue
+        # Stream and filter so only this session's entries are materialized
+        ledger = LedgerClient(ledger_path=ledger_path)
+        grouped[source] = [e for e in ledger.iter_entries() if entry_matches_session(e, session_id)]
     return grouped
 
 
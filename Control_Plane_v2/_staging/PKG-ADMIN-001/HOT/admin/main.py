@@ -160,7 +160,7 @@ def _register_admin_tools(dispatcher, root: Path, runtime_config: dict | None =
         if event_type:
             entries = ledger.read_by_event_type(str(event_type))[-max_entries:]
         else:
-            entries = ledger.read_all()[-max_entries:]
+            entries = ledger.read_recent(max_entries)
         return {
             "status": "ok",
             "source": source,
@@ -1137,6 +1137,7 @@ def build_session_host_v2(
     from ho2_supervisor import HO2Config, HO2Supervisor
     from ledger_client import LedgerClient
     from llm_gateway import LLMGateway, RouterConfig
+    from response_cache import ResponseCache
     from session_host_v2 import AgentConfig as V2AgentConfig, SessionHostV2
     from shell import Shell
     from token_budgeter import BudgetConfig, TokenBudgeter
@@ -1168,10 +1169,16 @@ def build_session_host_v2(
 
     # 3. Contract loader + Tool dispatcher
     contract_loader = ContractLoader(contracts_dir=root / "HO1" / "contracts")
+    dispatch_cfg = cfg_dict.get("tool_dispatch", {})
+    if not isinstance(dispatch_cfg, dict):
+        dispatch_cfg = {}
     dispatcher = ToolDispatcher(
         plane_root=root,
         tool_configs=cfg_dict.get("tools", []),
         permissions=cfg_dict.get("permissions", {}),
+        max_workers=dispatch_cfg.get("max_workers", 0),
+        default_timeout_sec=dispatch_cfg.get("default_timeout_sec"),
+        cache_max_entries=dispatch_cfg.get("cache_max_entries", 256),
     )
     # 3b. Dev tools: dual gate check
     import os as _os
@@ -1222,7 +1229,15 @@ def build_session_host_v2(
         },
     )
 
-    # 5. LLM Gateway
+    # 5. LLM Gateway (response cache is opt-in via router.response_cache_entries)
+    response_cache = None
+    cache_entries = _to_int(router_cfg.get("response_cache_entries", 0), 0, 0)
+    if cache_entries:
+        cache_dir = router_cfg.get("response_cache_dir")
+        response_cache = ResponseCache(
+            max_entries=cache_entries,
+            store_dir=root / cache_dir if cache_dir else None,
+        )
     gateway = LLMGateway(
         ledger_client=ledger_gov,
         budgeter=budgeter,
@@ -1235,8 +1250,12 @@ def build_session_host_v2(
         ),
         dev_mode=dev_mode,
         budget_mode=budget_mode,
+        response_cache=response_cache,
     )
-    gateway.register_provider("anthropic", AnthropicProvider())
+    provider_kwargs = {}
+    if "provider_max_in_flight" in router_cfg:
+        provider_kwargs["max_in_flight"] = _to_int(router_cfg["provider_max_in_flight"], 8, 1)
+    gateway.register_provider("anthropic", AnthropicProvider(**provider_kwargs))
 
     # 6. HO1 Executor
     ho1_config = {
@@ -1277,6 +1296,8 @@ def build_session_host_v2(
         ho3_gate_session_threshold=ho3_cfg.get("gate_session_threshold", 3),
         ho3_gate_window_hours=ho3_cfg.get("gate_window_hours", 168),
         consolidation_budget=budget_cfg.get("consolidation_budget", 4000),
+        consolidation_workers=ho3_cfg.get("consolidation_workers", 0),
+        consolidation_pool_budget=budget_cfg.get("consolidation_pool_budget", 0),
         projection_budget=budget_cfg.get("projection_budget", 10000),
         projection_mode=projection_cfg.get("mode", "shadow"),
     )
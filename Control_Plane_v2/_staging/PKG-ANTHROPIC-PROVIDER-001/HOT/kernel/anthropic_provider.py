@@ -3,16 +3,27 @@
 Implements LLMProvider Protocol from provider.py. No retries — the router's
 CircuitBreaker handles that. Layer 3 application package — stdlib-only
 constraint applies to kernel (Layers 0-2) only.
+
+Each client shares one pooled httpx transport with keep-alive connections.
+At most max_in_flight requests are sent at once; further send() calls queue
+on a semaphore (send_async() calls on a separate asyncio one), and the time
+spent queued is reported as ProviderResponse.queue_wait_ms. The async client
+and its semaphore are bound to an event loop, so send_async() keeps one pair
+per running loop and drops pairs whose loop has since been closed.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import threading
+import time
 from dataclasses import dataclass
 from typing import Any, Optional
 
 import anthropic
+import httpx
 
 from provider import ProviderError, ProviderResponse
 
@@ -35,7 +46,14 @@ class AnthropicResponse(ProviderResponse):
 class AnthropicProvider:
     """Anthropic Messages API provider using the official SDK."""
 
-    def __init__(self, provider_id: str = "anthropic"):
+    def __init__(
+        self,
+        provider_id: str = "anthropic",
+        max_in_flight: int = 8,
+        max_connections: int = 16,
+        keepalive_expiry_sec: float = 30.0,
+        base_url: Optional[str] = None,
+    ):
         self.provider_id = provider_id
         api_key = os.environ.get("ANTHROPIC_API_KEY", "")
         if not api_key:
@@ -44,7 +62,24 @@ class AnthropicProvider:
                 code="AUTH_ERROR",
                 retryable=False,
             )
-        self._client = anthropic.Anthropic(api_key=api_key)
+        self._api_key = api_key
+        self._base_url = base_url
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry_sec,
+        )
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._client = anthropic.Anthropic(
+            api_key=api_key,
+            base_url=base_url,
+            http_client=anthropic.DefaultHttpxClient(limits=self._limits),
+        )
+        self._in_flight = threading.BoundedSemaphore(self._max_in_flight)
+        self._async_lock = threading.Lock()
+        self._async_transports: dict[
+            asyncio.AbstractEventLoop, tuple[anthropic.AsyncAnthropic, asyncio.Semaphore]
+        ] = {}
 
     def send(
         self,
@@ -57,6 +92,78 @@ class AnthropicProvider:
         tools: Optional[list[dict[str, Any]]] = None,
     ) -> AnthropicResponse:
         """Send a prompt to the Anthropic Messages API."""
+        kwargs = self._request_kwargs(
+            model_id, prompt, max_tokens, temperature, timeout_ms, structured_output, tools,
+        )
+        queued = time.monotonic()
+        with self._in_flight:
+            queue_wait_ms = (time.monotonic() - queued) * 1000
+            try:
+                response = self._client.messages.create(**kwargs)
+            except anthropic.APIError as e:
+                error = self._provider_error(e)
+                if error is None:
+                    raise
+                raise error from e
+        return self._to_response(response, queue_wait_ms)
+
+    async def send_async(
+        self,
+        model_id: str,
+        prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        timeout_ms: int = 30000,
+        structured_output: Optional[dict[str, Any]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> AnthropicResponse:
+        """Awaitable send() on the running loop's async client (created on first use)."""
+        kwargs = self._request_kwargs(
+            model_id, prompt, max_tokens, temperature, timeout_ms, structured_output, tools,
+        )
+        client, in_flight = self._async_transport(asyncio.get_running_loop())
+        queued = time.monotonic()
+        async with in_flight:
+            queue_wait_ms = (time.monotonic() - queued) * 1000
+            try:
+                response = await client.messages.create(**kwargs)
+            except anthropic.APIError as e:
+                error = self._provider_error(e)
+                if error is None:
+                    raise
+                raise error from e
+        return self._to_response(response, queue_wait_ms)
+
+    def _async_transport(
+        self, loop: asyncio.AbstractEventLoop,
+    ) -> tuple[anthropic.AsyncAnthropic, asyncio.Semaphore]:
+        """Return the async client and in-flight semaphore bound to loop."""
+        with self._async_lock:
+            transport = self._async_transports.get(loop)
+            if transport is None:
+                for stale in [l for l in self._async_transports if l.is_closed()]:
+                    del self._async_transports[stale]
+                transport = (
+                    anthropic.AsyncAnthropic(
+                        api_key=self._api_key,
+                        base_url=self._base_url,
+                        http_client=anthropic.DefaultAsyncHttpxClient(limits=self._limits),
+                    ),
+                    asyncio.Semaphore(self._max_in_flight),
+                )
+                self._async_transports[loop] = transport
+            return transport
+
+    @staticmethod
+    def _request_kwargs(
+        model_id: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout_ms: int,
+        structured_output: Optional[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]],
+    ) -> dict[str, Any]:
         kwargs: dict[str, Any] = {
             "model": model_id or DEFAULT_MODEL,
             "max_tokens": max_tokens,
@@ -75,42 +182,24 @@ class AnthropicProvider:
                 "input_schema": structured_output,
             }]
             kwargs["tool_choice"] = {"type": "tool", "name": "output_json"}
-
-        try:
-            response = self._client.messages.create(**kwargs)
-        except anthropic.APITimeoutError as e:
-            raise ProviderError(
-                message=str(e), code="TIMEOUT", retryable=True
-            ) from e
-        except anthropic.APIConnectionError as e:
-            raise ProviderError(
-                message=str(e), code="TIMEOUT", retryable=True
-            ) from e
-        except anthropic.AuthenticationError as e:
-            raise ProviderError(
-                message=str(e), code="AUTH_ERROR", retryable=False
-            ) from e
-        except anthropic.PermissionDeniedError as e:
-            raise ProviderError(
-                message=str(e), code="AUTH_ERROR", retryable=False
-            ) from e
-        except anthropic.BadRequestError as e:
-            raise ProviderError(
-                message=str(e), code="INVALID_REQUEST", retryable=False
-            ) from e
-        except anthropic.RateLimitError as e:
-            raise ProviderError(
-                message=str(e), code="RATE_LIMITED", retryable=True
-            ) from e
-        except anthropic.InternalServerError as e:
-            raise ProviderError(
-                message=str(e), code="SERVER_ERROR", retryable=True
-            ) from e
-        except anthropic.APIStatusError as e:
-            raise ProviderError(
-                message=str(e), code="SERVER_ERROR", retryable=True
-            ) from e
-
+        return kwargs
+
+    @staticmethod
+    def _provider_error(e: anthropic.APIError) -> Optional[ProviderError]:
+        """Map an SDK exception to ProviderError; None leaves it unmapped."""
+        if isinstance(e, (anthropic.APITimeoutError, anthropic.APIConnectionError)):
+            return ProviderError(message=str(e), code="TIMEOUT", retryable=True)
+        if isinstance(e, (anthropic.AuthenticationError, anthropic.PermissionDeniedError)):
+            return ProviderError(message=str(e), code="AUTH_ERROR", retryable=False)
+        if isinstance(e, anthropic.BadRequestError):
+            return ProviderError(message=str(e), code="INVALID_REQUEST", retryable=False)
+        if isinstance(e, anthropic.RateLimitError):
+            return ProviderError(message=str(e), code="RATE_LIMITED", retryable=True)
+        if isinstance(e, anthropic.APIStatusError):
+            return ProviderError(message=str(e), code="SERVER_ERROR", retryable=True)
+        return None
+
+    def _to_response(self, response: Any, queue_wait_ms: float = 0.0) -> AnthropicResponse:
         blocks = response.content
         text_parts = [b.text for b in blocks if b.type == "text"]
         tool_use_parts = [b for b in blocks if b.type == "tool_use"]
@@ -129,5 +218,6 @@ class AnthropicProvider:
             request_id=response.id,
             provider_id=self.provider_id,
             finish_reason=finish,
+            queue_wait_ms=queue_wait_ms,
             content_blocks=content_dicts,
         )
@@ -526,3 +526,171 @@ class TestErrors:
             provider.send(model_id="claude-sonnet-4-5-20250929", prompt="Hi")
         assert exc_info.value.code == "SERVER_ERROR"
         assert exc_info.value.retryable is True
+
+
+# ── Async send tests ─────────────────────────────────────────────────
+
+
+class TestSendAsync:
+    """send_async() shares request building and error mapping with send()."""
+
+    def test_send_async_uses_async_client(self):
+        """#32: send_async awaits AsyncAnthropic.messages.create with send()'s kwargs."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        provider = _make_provider()
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(return_value=_mock_sdk_response(content="async hi"))
+        with patch("anthropic.AsyncAnthropic", return_value=async_client):
+            resp = asyncio.run(provider.send_async(model_id="", prompt="Hi", timeout_ms=15000))
+
+        call_kwargs = async_client.messages.create.call_args[1]
+        assert call_kwargs["model"] == "claude-sonnet-4-5-20250929"
+        assert call_kwargs["timeout"] == 15.0
+        assert call_kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+        assert isinstance(resp, AnthropicResponse)
+        assert resp.content == "async hi"
+
+    def test_send_async_maps_errors(self):
+        """#33: send_async maps SDK errors exactly like send()."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        import anthropic
+
+        req = _sdk_error_request()
+        provider = _make_provider()
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(side_effect=anthropic.RateLimitError(
+            "rate limited", response=httpx.Response(429, request=req), body=None
+        ))
+
+        with patch("anthropic.AsyncAnthropic", return_value=async_client):
+            with pytest.raises(ProviderError) as exc_info:
+                asyncio.run(provider.send_async(model_id="claude-sonnet-4-5-20250929", prompt="Hi"))
+        assert exc_info.value.code == "RATE_LIMITED"
+        assert exc_info.value.retryable is True
+
+
+# ── Pooled transport / in-flight limit tests ─────────────────────────
+
+
+@pytest.fixture
+def stub_api():
+    """Local stand-in for the Messages API that records concurrency."""
+    import json
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    stats = {"active": 0, "peak": 0, "requests": 0, "connections": set()}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                stats["active"] += 1
+                stats["requests"] += 1
+                stats["peak"] = max(stats["peak"], stats["active"])
+                stats["connections"].add(self.client_address)
+            time.sleep(0.1)
+            with lock:
+                stats["active"] -= 1
+            payload = json.dumps({
+                "id": f"msg_stub_{stats['requests']}",
+                "type": "message",
+                "role": "assistant",
+                "content": [{"type": "text", "text": "stub reply"}],
+                "model": body["model"],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": 3, "output_tokens": 2},
+            }).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", stats
+    server.shutdown()
+    server.server_close()
+
+
+class TestPooledTransport:
+    """Keep-alive pool and max_in_flight, exercised against a local stub server."""
+
+    def test_send_limits_in_flight_and_reuses_connections(self, stub_api):
+        """#34: Six concurrent send() calls run two at a time over pooled connections."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        url, stats = stub_api
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            provider = AnthropicProvider(max_in_flight=2, base_url=url)
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            responses = list(pool.map(
+                lambda n: provider.send(model_id="claude-sonnet-4-5-20250929", prompt=f"hi {n}"),
+                range(6),
+            ))
+
+        assert [r.content for r in responses] == ["stub reply"] * 6
+        assert stats["requests"] == 6
+        assert stats["peak"] == 2
+        assert len(stats["connections"]) <= 2
+        assert max(r.queue_wait_ms for r in responses) >= 150.0
+
+    def test_send_async_limits_in_flight(self, stub_api):
+        """#35: send_async() queues behind the same max_in_flight bound."""
+        import asyncio
+
+        url, stats = stub_api
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            provider = AnthropicProvider(max_in_flight=2, base_url=url)
+
+        async def _run():
+            return await asyncio.gather(*(
+                provider.send_async(model_id="claude-sonnet-4-5-20250929", prompt=f"hi {n}")
+                for n in range(4)
+            ))
+
+        responses = asyncio.run(_run())
+
+        assert [r.content for r in responses] == ["stub reply"] * 4
+        assert stats["peak"] == 2
+        assert sorted(r.queue_wait_ms > 50.0 for r in responses) == [False, False, True, True]
+
+    def test_send_async_across_event_loops(self, stub_api):
+        """#36: Each asyncio.run() gets its own async client and semaphore."""
+        import asyncio
+
+        url, stats = stub_api
+        with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "sk-test"}):
+            provider = AnthropicProvider(max_in_flight=2, base_url=url)
+
+        async def _run():
+            return await asyncio.gather(*(
+                provider.send_async(model_id="claude-sonnet-4-5-20250929", prompt=f"hi {n}")
+                for n in range(3)
+            ))
+
+        first = asyncio.run(_run())
+        (first_transport,) = provider._async_transports.values()
+        second = asyncio.run(_run())
+        (second_transport,) = provider._async_transports.values()
+
+        assert [r.content for r in first + second] == ["stub reply"] * 6
+        assert stats["requests"] == 6
+        assert stats["peak"] == 2
+        assert second_transport[0] is not first_transport[0]
+        assert second_transport[1] is not first_transport[1]
@@ -2,11 +2,17 @@
 
 Scans a contracts directory for JSON files and matches by contract_id.
 Validates against an optional JSON schema before returning.
+
+Parsed contracts are kept in a contract_id index built on first use.
+Each load() re-stats only the matched file and re-parses it when its
+mtime or size changed; a miss rescans the directory for new files.
 """
 
 import json
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 
 class ContractNotFoundError(Exception):
@@ -19,9 +25,21 @@ class ContractValidationError(Exception):
     pass
 
 
+@dataclass
+class _IndexedFile:
+    """One parsed contract file and its validation outcome."""
+
+    stamp: Tuple[int, int]  # (mtime_ns, size) when parsed
+    contract: Optional[dict]  # None if unreadable or not a JSON object
+    validated: bool = False
+    error: Optional[str] = None
+
+
 class ContractLoader:
     """Loads prompt contracts from a directory of JSON files.
 
+    Returned contracts are shared cache entries; treat them as read-only.
+
     Args:
         contracts_dir: Path to directory containing contract JSON files.
         schema_path: Optional path to a JSON schema for validation.
@@ -31,6 +49,8 @@ class ContractLoader:
         self.contracts_dir = Path(contracts_dir)
         self.schema_path = Path(schema_path) if schema_path else None
         self._schema: Optional[dict] = None
+        self._files: Dict[Path, _IndexedFile] = {}
+        self._by_id: Dict[str, Path] = {}
 
         if self.schema_path and self.schema_path.exists():
             with open(self.schema_path, "r", encoding="utf-8") as f:
@@ -39,8 +59,9 @@ class ContractLoader:
     def load(self, contract_id: str) -> dict:
         """Load a prompt contract by its contract_id.
 
-        Scans all JSON files in contracts_dir, loads each, and returns
-        the first whose "contract_id" field matches the requested ID.
+        Returns the first JSON file in contracts_dir (sorted by name) whose
+        "contract_id" field matches, served from the index while the file
+        is unchanged on disk.
 
         Args:
             contract_id: The contract_id to search for.
@@ -57,24 +78,72 @@ class ContractLoader:
                 f"Contracts directory does not exist: {self.contracts_dir}"
             )
 
-        for json_file in sorted(self.contracts_dir.glob("*.json")):
+        path = self._by_id.get(contract_id)
+        if path is None or not self._is_current(path, contract_id):
+            self._rescan()
+            path = self._by_id.get(contract_id)
+        if path is None:
+            raise ContractNotFoundError(
+                f"No contract found with contract_id={contract_id} "
+                f"in {self.contracts_dir}"
+            )
+
+        indexed = self._files[path]
+        if not indexed.validated:
             try:
-                with open(json_file, "r", encoding="utf-8") as f:
-                    contract = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                continue
+                self._validate(indexed.contract, path)
+            except ContractValidationError as e:
+                indexed.error = str(e)
+            indexed.validated = True
+        if indexed.error:
+            raise ContractValidationError(indexed.error)
+        return indexed.contract
 
-            if not isinstance(contract, dict):
-                continue
+    @staticmethod
+    def _stamp(path: Path) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _is_current(self, path: Path, contract_id: str) -> bool:
+        """True if the indexed file for contract_id is unchanged on disk."""
+        indexed = self._files.get(path)
+        return (
+            indexed is not None
+            and indexed.stamp == self._stamp(path)
+            and isinstance(indexed.contract, dict)
+            and indexed.contract.get("contract_id") == contract_id
+        )
 
-            if contract.get("contract_id") == contract_id:
-                self._validate(contract, json_file)
-                return contract
+    def _rescan(self) -> None:
+        """Re-list contracts_dir, re-parsing only new or changed files.
 
-        raise ContractNotFoundError(
-            f"No contract found with contract_id={contract_id} "
-            f"in {self.contracts_dir}"
-        )
+        The first file in sorted order wins when two share a contract_id.
+        """
+        files: Dict[Path, _IndexedFile] = {}
+        by_id: Dict[str, Path] = {}
+        for json_file in sorted(self.contracts_dir.glob("*.json")):
+            stamp = self._stamp(json_file)
+            if stamp is None:
+                continue
+            indexed = self._files.get(json_file)
+            if indexed is None or indexed.stamp != stamp:
+                try:
+                    with open(json_file, "r", encoding="utf-8") as f:
+                        contract = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    contract = None
+                indexed = _IndexedFile(
+                    stamp=stamp,
+                    contract=contract if isinstance(contract, dict) else None,
+                )
+            files[json_file] = indexed
+            if indexed.contract is not None:
+                by_id.setdefault(indexed.contract.get("contract_id"), json_file)
+        self._files = files
+        self._by_id = by_id
 
     def _validate(self, contract: dict, source_path: Path) -> None:
         """Validate a contract against the loaded schema.
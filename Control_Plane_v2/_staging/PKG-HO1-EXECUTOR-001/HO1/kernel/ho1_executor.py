@@ -5,12 +5,16 @@ Every LLM invocation flows through HO1. This enforces:
   - Invariant #3: Agents don't remember, they READ
 
 HO1 receives WorkOrders from HO2, executes them, and returns results.
+execute() blocks on the gateway; execute_async() runs the same steps on
+an asyncio event loop so one process can serve many WOs concurrently.
 """
 
+import asyncio
+import inspect
 import json
 import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generator, List, Optional
 
 import sys
 from pathlib import Path
@@ -29,6 +33,13 @@ try:
 except ImportError:
     from kernel.ledger_client import LedgerClient, LedgerEntry
 
+from prompt_template import TemplateCache
+
+# Blocking calls yielded by HO1Executor._execute_steps()
+_ROUTE = "route"
+_TOOL = "tool"
+_TOOLS = "tools"
+
 
 class HO1Executor:
     """HO1 cognitive process — executes work orders via prompt contracts.
@@ -57,6 +68,7 @@ class HO1Executor:
         self.tool_dispatcher = tool_dispatcher
         self.contract_loader = contract_loader
         self.config = config or {}
+        self._templates = TemplateCache()
 
     def execute(self, work_order: dict) -> dict:
         """Execute a work order and return the completed/failed WO.
@@ -67,6 +79,99 @@ class HO1Executor:
         Returns:
             Updated WO dict with output_result, cost, completed_at, state.
         """
+        steps = self._execute_steps(work_order)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            try:
+                if op == _ROUTE:
+                    reply = self.gateway.route(arg)
+                elif op == _TOOLS:
+                    reply = self._dispatch_tools(arg)
+                else:
+                    reply = self.tool_dispatcher.execute(*arg)
+            except Exception as e:
+                error = e
+
+    async def execute_async(self, work_order: dict) -> dict:
+        """Awaitable execute(): same steps, gateway and tool I/O off the loop.
+
+        Uses gateway.route_async() when available, otherwise runs route()
+        in the default executor; tools always run in the executor. If the
+        HO1m ledger is an AsyncLedgerWriter, its queue is drained before
+        returning so the WO's events are on disk for HO2's next read.
+        """
+        loop = asyncio.get_running_loop()
+        route_async = getattr(self.gateway, "route_async", None)
+        if not asyncio.iscoroutinefunction(route_async):
+            route_async = None
+        steps = self._execute_steps(work_order)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                result = done.value
+                break
+            reply, error = None, None
+            try:
+                if op == _ROUTE and route_async is not None:
+                    reply = await route_async(arg)
+                elif op == _ROUTE:
+                    reply = await loop.run_in_executor(None, self.gateway.route, arg)
+                elif op == _TOOLS:
+                    reply = await loop.run_in_executor(None, self._dispatch_tools, arg)
+                else:
+                    reply = await loop.run_in_executor(None, self.tool_dispatcher.execute, *arg)
+            except Exception as e:
+                error = e
+        drain = getattr(self.ledger, "drain", None)
+        if asyncio.iscoroutinefunction(drain):
+            await drain()
+        return result
+
+    def _dispatch_tools(self, calls: List[tuple]) -> list:
+        """Run one turn's tool calls, batched when the dispatcher supports it.
+
+        ToolDispatcher.execute_many() may run them on its thread pool; any
+        other dispatcher gets one execute() call per tool, in order.
+        """
+        execute_many = getattr(self.tool_dispatcher, "execute_many", None)
+        if inspect.ismethod(execute_many):
+            return execute_many(calls)
+        return [self.tool_dispatcher.execute(*call) for call in calls]
+
+    @staticmethod
+    def _count_tool_cache(cost: dict, tool_result: Any) -> str:
+        """Add a tool result's cache outcome to the WO cost; returns it.
+
+        "hit"/"miss" bump cost tool_cache_hits/tool_cache_misses; results
+        of non-cacheable tools (or other dispatchers) return "".
+        """
+        outcome = getattr(tool_result, "cache", "")
+        if outcome == "hit":
+            cost["tool_cache_hits"] = cost.get("tool_cache_hits", 0) + 1
+        elif outcome == "miss":
+            cost["tool_cache_misses"] = cost.get("tool_cache_misses", 0) + 1
+        else:
+            outcome = ""
+        return outcome
+
+    def _execute_steps(self, work_order: dict) -> Generator[tuple, Any, dict]:
+        """The WO execution pipeline, suspended at each gateway/tool call.
+
+        Yields (_ROUTE, request), (_TOOL, (tool_id, arguments)) and
+        (_TOOLS, [(tool_id, arguments), ...]) for the tool uses of one model
+        turn; the driver sends back the result (a list in call order for
+        _TOOLS) or throws the call's exception in.
+        Returns the completed or failed WO.
+        """
         wo = dict(work_order)  # Work on a copy
         start_time = time.time()
 
@@ -96,7 +201,7 @@ class HO1Executor:
 
             # Step 2: Handle tool_call type specially (no LLM)
             if wo_type == "tool_call":
-                result = self._handle_tool_call(wo, cost)
+                result = yield from self._handle_tool_call(wo, cost)
                 wo["output_result"] = result
                 self._transition_state(wo, "completed")
                 cost["elapsed_ms"] = int((time.time() - start_time) * 1000)
@@ -124,7 +229,9 @@ class HO1Executor:
                     return self._fail_wo(wo, cost, start_time, "input_schema_invalid", "; ".join(errors))
 
             # Step 5: Build PromptRequest
-            request = self._build_prompt_request(wo, contract)
+            # Serialized input values are reused by every follow-up request of this WO
+            render_memo: Dict[str, Any] = {}
+            request = self._build_prompt_request(wo, contract, render_memo=render_memo)
 
             # Step 6: Run tool loop
             turn_limit = constraints.get("turn_limit", 5)
@@ -157,7 +264,7 @@ class HO1Executor:
 
                 # Call gateway
                 try:
-                    response = self.gateway.route(request)
+                    response = yield _ROUTE, request
                 except Exception as e:
                     return self._fail_wo(wo, cost, start_time, "gateway_error", str(e))
 
@@ -205,9 +312,12 @@ class HO1Executor:
 
                 if tool_uses and self.tool_dispatcher:
                     cached_results = []
-                    for tu in tool_uses:
-                        tool_result = self.tool_dispatcher.execute(tu["tool_id"], tu.get("arguments", {}))
+                    tool_results = yield _TOOLS, [
+                        (tu["tool_id"], tu.get("arguments", {})) for tu in tool_uses
+                    ]
+                    for tu, tool_result in zip(tool_uses, tool_results):
                         cost["tool_calls"] += 1
+                        tool_cache = self._count_tool_cache(cost, tool_result)
                         cost.setdefault("tool_ids_used", []).append(tu["tool_id"])
                         result_output = getattr(tool_result, "output", None)
                         cached_results.append({
@@ -228,6 +338,7 @@ class HO1Executor:
                             tool_error=tool_error,
                             args_summary=args_str,
                             result_summary=result_str,
+                            tool_cache=tool_cache,
                         )
                     # Check remaining budget before follow-up call
                     remaining_budget = token_budget - cost.get("total_tokens", 0)
@@ -253,7 +364,8 @@ class HO1Executor:
                     # Build follow-up request with cached tool results
                     tool_results_text = json.dumps(cached_results)
                     request = self._build_prompt_request(wo, contract,
-                        additional_context=f"\nTool results: {tool_results_text}")
+                        additional_context=f"\nTool results: {tool_results_text}",
+                        render_memo=render_memo)
                     continue
                 else:
                     if final_content is None:
@@ -300,15 +412,16 @@ class HO1Executor:
         self._log_event("WO_FAILED", wo, error_code=error_code, error_message=error_message)
         return wo
 
-    def _handle_tool_call(self, wo: dict, cost: dict) -> dict:
+    def _handle_tool_call(self, wo: dict, cost: dict) -> Generator[tuple, Any, dict]:
         constraints = wo.get("constraints", {})
         tools_allowed = constraints.get("tools_allowed", [])
         input_context = wo.get("input_context", {})
         results = {}
         for tool_id in tools_allowed:
             if self.tool_dispatcher:
-                result = self.tool_dispatcher.execute(tool_id, input_context)
+                result = yield _TOOL, (tool_id, input_context)
                 cost["tool_calls"] += 1
+                tool_cache = self._count_tool_cache(cost, result)
                 result_output = getattr(result, "output", None)
                 results[tool_id] = result_output
                 args_str = json.dumps(input_context, default=str)
@@ -325,26 +438,23 @@ class HO1Executor:
                     tool_error=getattr(result, "error", None),
                     args_summary=args_str,
                     result_summary=result_str,
+                    tool_cache=tool_cache,
                 )
         return results
 
-    def _render_template(self, prompt_pack_id: str, input_ctx: dict, additional_context: str = "") -> str:
-        """Load and render a prompt pack template. Falls back to json.dumps if template not found."""
+    def _render_template(
+        self,
+        prompt_pack_id: str,
+        input_ctx: dict,
+        additional_context: str = "",
+        render_memo: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Render a compiled prompt pack template. Falls back to json.dumps if template not found."""
         template_dir = self.contract_loader.contracts_dir.parent / "prompt_packs"
-        template_path = template_dir / f"{prompt_pack_id}.txt"
-        if not template_path.exists():
+        template = self._templates.get(template_dir / f"{prompt_pack_id}.txt")
+        if template is None:
             return json.dumps(input_ctx) + additional_context
-
-        template_text = template_path.read_text()
-        for key, value in input_ctx.items():
-            placeholder = "{{" + key + "}}"
-            if isinstance(value, str):
-                rendered_value = value
-            else:
-                rendered_value = json.dumps(value, indent=2)
-            template_text = template_text.replace(placeholder, rendered_value)
-
-        return template_text + additional_context
+        return template.render(input_ctx, render_memo) + additional_context
 
     def _strip_code_fences(self, content: str) -> str:
         """Strip markdown code fences (with or without language tag) if present."""
@@ -365,7 +475,13 @@ class HO1Executor:
         filtered = [t for t in all_tools if t.get("name") in allowed_set]
         return filtered if filtered else None
 
-    def _build_prompt_request(self, wo: dict, contract: dict, additional_context: str = "") -> object:
+    def _build_prompt_request(
+        self,
+        wo: dict,
+        contract: dict,
+        additional_context: str = "",
+        render_memo: Optional[Dict[str, Any]] = None,
+    ) -> object:
         """Build a PromptRequest-compatible object from WO + contract."""
         tools = self._resolve_tools(wo)
 
@@ -379,7 +495,7 @@ class HO1Executor:
             input_ctx = wo.get("input_context", {})
             token_budget = wo.get("constraints", {}).get("token_budget", 100000)
             prompt_pack_id = contract.get("prompt_pack_id", "")
-            prompt_text = self._render_template(prompt_pack_id, input_ctx, additional_context)
+            prompt_text = self._render_template(prompt_pack_id, input_ctx, additional_context, render_memo)
             domain_tags = wo.get("constraints", {}).get("domain_tags", [])
             return SimpleNamespace(
                 prompt=prompt_text,
@@ -402,7 +518,7 @@ class HO1Executor:
         input_ctx = wo.get("input_context", {})
         token_budget = wo.get("constraints", {}).get("token_budget", 100000)
         prompt_pack_id = contract.get("prompt_pack_id", "")
-        prompt_text = self._render_template(prompt_pack_id, input_ctx, additional_context)
+        prompt_text = self._render_template(prompt_pack_id, input_ctx, additional_context, render_memo)
         domain_tags = wo.get("constraints", {}).get("domain_tags", [])
 
         return PromptRequest(
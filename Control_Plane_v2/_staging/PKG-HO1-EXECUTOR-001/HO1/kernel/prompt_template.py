@@ -0,0 +1,87 @@
+"""Prompt Template — compiled {{placeholder}} templates for prompt packs.
+
+A prompt pack is split once into literal text and placeholder names, so
+rendering is a single join instead of one full-string replace per input
+key. String values are inserted as-is, anything else as json.dumps(indent=2).
+Placeholders with no matching input stay literal. Substitution is a single
+pass: placeholder text inside an inserted value is not expanded.
+
+TemplateCache keeps compiled packs by path and recompiles a pack when its
+mtime or size changes.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_PLACEHOLDER = re.compile(r"\{\{([^{}]*)\}\}")
+
+
+def render_value(value: Any) -> str:
+    """Serialize one template input the way prompt packs expect."""
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, indent=2)
+
+
+class CompiledTemplate:
+    """A prompt pack pre-split into literals and placeholder names."""
+
+    __slots__ = ("literals", "names")
+
+    def __init__(self, text: str):
+        parts = _PLACEHOLDER.split(text)
+        self.literals: List[str] = parts[0::2]
+        self.names: List[str] = parts[1::2]
+
+    def render(
+        self,
+        values: Dict[str, Any],
+        memo: Optional[Dict[str, Tuple[Any, str]]] = None,
+    ) -> str:
+        """Render with values; memo maps name -> (value, serialized).
+
+        Pass the same memo for repeated renders of one input dict (e.g. the
+        follow-up requests of a tool loop) to serialize each value once. A
+        memo entry is reused only while the value is the same object.
+        """
+        out = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            if name in values:
+                value = values[name]
+                cached = memo.get(name) if memo is not None else None
+                if cached is not None and cached[0] is value:
+                    rendered = cached[1]
+                else:
+                    rendered = render_value(value)
+                    if memo is not None:
+                        memo[name] = (value, rendered)
+                out.append(rendered)
+            else:
+                out.append("{{" + name + "}}")
+            out.append(literal)
+        return "".join(out)
+
+
+class TemplateCache:
+    """Compiled templates by path, invalidated on mtime/size change."""
+
+    def __init__(self) -> None:
+        self._compiled: Dict[Path, Tuple[Tuple[int, int], CompiledTemplate]] = {}
+
+    def get(self, path: Path) -> Optional[CompiledTemplate]:
+        """Return the compiled template at path, or None if it does not exist."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._compiled.pop(path, None)
+            return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._compiled.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        template = CompiledTemplate(Path(path).read_text())
+        self._compiled[path] = (stamp, template)
+        return template
@@ -2,10 +2,33 @@
 
 Registers tool handlers, enforces basic allow/forbidden rules,
 and executes tool calls requested by the model.
+
+With max_workers > 0, execute_many() runs the calls of one model turn on a
+bounded thread pool, so the turn costs the slowest tool rather than the sum.
+A tool config may set "max_concurrency" (calls of that tool in flight at
+once, across all batches) and "timeout_sec" (how long a batch waits for the
+call, queueing included). A timed-out call returns an error result; its
+thread is not interrupted and still holds its pool slot until it finishes.
+
+Read-only tools can opt into result caching with "cacheable": true and an
+optional "cache_ttl_sec" (no TTL: kept until evicted). Results are keyed on
+the tool id and a SHA-256 of the canonical JSON of the arguments, held in a
+bounded LRU shared by all WOs using this dispatcher; only "ok" results are
+stored. Outputs are deep-copied into and out of the cache, so a caller that
+mutates its ToolResult.output cannot change what later hits see.
+ToolResult.cache reports "hit" or "miss" for cacheable tools.
 """
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
@@ -19,6 +42,7 @@ class ToolResult:
     status: str
     output: Any = None
     error: str = ""
+    cache: str = ""  # "hit" / "miss" for cacheable tools, else ""
 
     def as_dict(self) -> dict[str, Any]:
         return {
@@ -37,12 +61,23 @@ class ToolDispatcher:
         plane_root: Path,
         tool_configs: list[dict[str, Any]],
         permissions: dict[str, Any],
+        max_workers: int = 0,
+        default_timeout_sec: float | None = None,
+        cache_max_entries: int = 256,
     ):
         self._plane_root = Path(plane_root)
         self._tool_configs = list(tool_configs or [])
         self._permissions = permissions or {}
         self._handlers: dict[str, Callable[[dict[str, Any]], Any]] = {}
         self._declared = {tool.get("tool_id", "") for tool in self._tool_configs}
+        self._max_workers = max(0, int(max_workers or 0))
+        self._default_timeout = default_timeout_sec
+        self._pool: ThreadPoolExecutor | None = None
+        self._limits: dict[str, threading.BoundedSemaphore | None] = {}
+        self._lock = threading.Lock()
+        self._cache: OrderedDict[tuple[str, str], tuple[float | None, Any]] = OrderedDict()
+        self._cache_max_entries = max(0, int(cache_max_entries))
+        self.cache_stats = {"hits": 0, "misses": 0}
 
     def register_tool(
         self,
@@ -73,6 +108,61 @@ class ToolDispatcher:
 
         return True, ""
 
+    def _tool_config(self, tool_id: str) -> dict[str, Any]:
+        for tool in self._tool_configs:
+            if tool.get("tool_id") == tool_id:
+                return tool
+        return {}
+
+    def _limit(self, tool_id: str) -> threading.BoundedSemaphore | None:
+        """Per-tool concurrency semaphore, or None if the tool is unlimited."""
+        with self._lock:
+            if tool_id not in self._limits:
+                limit = self._tool_config(tool_id).get("max_concurrency")
+                self._limits[tool_id] = (
+                    threading.BoundedSemaphore(int(limit)) if limit else None
+                )
+            return self._limits[tool_id]
+
+    def _timeout(self, tool_id: str) -> float | None:
+        return self._tool_config(tool_id).get("timeout_sec", self._default_timeout)
+
+    def _cache_key(self, tool_id: str, arguments: dict[str, Any]) -> tuple[str, str] | None:
+        """Cache key for a call, or None if the tool is not cacheable."""
+        if not self._cache_max_entries or not self._tool_config(tool_id).get("cacheable"):
+            return None
+        canonical = json.dumps(
+            arguments or {}, sort_keys=True, separators=(",", ":"), default=str,
+        )
+        return tool_id, hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _cache_get(self, key: tuple[str, str]) -> tuple[bool, Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and (entry[0] is None or entry[0] > time.monotonic()):
+                self._cache.move_to_end(key)
+                self.cache_stats["hits"] += 1
+                return True, copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._cache[key]
+            self.cache_stats["misses"] += 1
+            return False, None
+
+    def _cache_put(self, key: tuple[str, str], output: Any) -> None:
+        ttl = self._tool_config(key[0]).get("cache_ttl_sec")
+        expires = time.monotonic() + float(ttl) if ttl is not None else None
+        output = copy.deepcopy(output)
+        with self._lock:
+            self._cache[key] = (expires, output)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_max_entries:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached tool results."""
+        with self._lock:
+            self._cache.clear()
+
     def execute(self, tool_id: str, arguments: dict[str, Any]) -> ToolResult:
         """Execute one tool call and return normalized result."""
         allowed, reason = self._is_allowed(tool_id)
@@ -87,11 +177,76 @@ class ToolDispatcher:
                 error=f"No handler registered for '{tool_id}'",
             )
 
+        key = self._cache_key(tool_id, arguments)
+        if key is not None:
+            hit, output = self._cache_get(key)
+            if hit:
+                return ToolResult(tool_id=tool_id, status="ok", output=output, cache="hit")
+
+        limit = self._limit(tool_id)
+        if limit is not None:
+            limit.acquire()
         try:
             result = handler(arguments or {})
-            return ToolResult(tool_id=tool_id, status="ok", output=result)
+            if key is not None:
+                self._cache_put(key, result)
+            return ToolResult(
+                tool_id=tool_id, status="ok", output=result,
+                cache="miss" if key is not None else "",
+            )
         except Exception as exc:  # pragma: no cover - defensive normalization
-            return ToolResult(tool_id=tool_id, status="error", error=str(exc))
+            return ToolResult(
+                tool_id=tool_id, status="error", error=str(exc),
+                cache="miss" if key is not None else "",
+            )
+        finally:
+            if limit is not None:
+                limit.release()
+
+    def execute_many(
+        self, calls: list[tuple[str, dict[str, Any]]]
+    ) -> list[ToolResult]:
+        """Execute several tool calls; results are in call order.
+
+        Sequential unless the dispatcher was built with max_workers > 0.
+        Per-tool timeouts only apply on the pool.
+        """
+        if not self._max_workers or not calls:
+            return [self.execute(tool_id, arguments) for tool_id, arguments in calls]
+
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="tool-dispatch",
+                )
+        started = time.monotonic()
+        futures: list[Future] = [
+            self._pool.submit(self.execute, tool_id, arguments)
+            for tool_id, arguments in calls
+        ]
+        results = []
+        for (tool_id, _), future in zip(calls, futures):
+            timeout = self._timeout(tool_id)
+            try:
+                if timeout is None:
+                    results.append(future.result())
+                else:
+                    remaining = max(0.0, started + float(timeout) - time.monotonic())
+                    results.append(future.result(timeout=remaining))
+            except FutureTimeoutError:
+                results.append(ToolResult(
+                    tool_id=tool_id,
+                    status="error",
+                    error=f"Tool '{tool_id}' timed out after {timeout}s",
+                ))
+        return results
+
+    def close(self) -> None:
+        """Shut down the dispatch pool without waiting for running calls."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
 
     def get_api_tools(self) -> list[dict[str, Any]]:
         """Return tool definitions in Anthropic-style API shape."""
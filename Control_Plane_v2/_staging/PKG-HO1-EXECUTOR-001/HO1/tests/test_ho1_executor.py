@@ -299,7 +299,7 @@ class TestExecuteFlow:
         assert "T" in result["completed_at"]
 
 
-# Contract Loading Tests (5)
+# Contract Loading Tests (8)
 class TestContractLoading:
     def test_contract_loader_load_by_id(self, executor):
         contract = executor.contract_loader.load("PRC-CLASSIFY-001")
@@ -336,6 +336,49 @@ class TestContractLoading:
         assert "max_tokens" in contract["boundary"]
         assert "temperature" in contract["boundary"]
 
+    def test_contract_loader_parses_each_file_once(self, executor):
+        import contract_loader
+        executor.contract_loader.load("PRC-CLASSIFY-001")
+        with patch.object(contract_loader.json, "load", wraps=json.load) as load:
+            for _ in range(5):
+                executor.contract_loader.load("PRC-CLASSIFY-001")
+                executor.contract_loader.load("PRC-SYNTHESIZE-001")
+        assert load.call_count == 0
+
+    def test_contract_loader_picks_up_file_changes(self, executor):
+        import os
+        from contract_loader import ContractNotFoundError
+        loader = executor.contract_loader
+        path = loader.contracts_dir / "classify.json"
+        assert loader.load("PRC-CLASSIFY-001")["boundary"]["max_tokens"] == 500
+
+        data = json.loads(path.read_text())
+        data["boundary"]["max_tokens"] = 1234
+        path.write_text(json.dumps(data))
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert loader.load("PRC-CLASSIFY-001")["boundary"]["max_tokens"] == 1234
+
+        (loader.contracts_dir / "extra.json").write_text(json.dumps({"contract_id": "PRC-EXTRA-001"}))
+        assert loader.load("PRC-EXTRA-001")["contract_id"] == "PRC-EXTRA-001"
+
+        path.unlink()
+        with pytest.raises(ContractNotFoundError):
+            loader.load("PRC-CLASSIFY-001")
+
+    def test_tool_heavy_wo_scans_contracts_once(self, executor, classify_wo):
+        from contract_loader import ContractLoader
+        classify_wo["constraints"]["tools_allowed"] = ["t1"]
+        classify_wo["constraints"]["turn_limit"] = 6
+        tool_resp = _mock_response('[{"type": "tool_use", "tool_id": "t1", "arguments": {}}]')
+        text_resp = _mock_response('{"speech_act": "command", "ambiguity": "low"}')
+        executor.gateway.route.side_effect = [tool_resp] * 4 + [text_resp]
+        with patch.object(ContractLoader, "_rescan", autospec=True, side_effect=ContractLoader._rescan) as rescan:
+            result = executor.execute(classify_wo)
+        assert result["state"] == "completed"
+        assert executor.ledger.write.call_count > 8
+        assert rescan.call_count == 1
+
 
 # Tool Loop Tests (5)
 class TestToolLoop:
@@ -658,7 +701,7 @@ class TestBudgetReconciliation:
         assert followup_request.max_tokens == 3000
 
 
-# Template Rendering Tests (10) — FOLLOWUP-18C
+# Template Rendering Tests (13) — FOLLOWUP-18C
 class TestTemplateRendering:
     def test_render_template_substitutes_string_var(self, executor):
         """#1: {{user_input}} replaced with string value."""
@@ -748,6 +791,56 @@ class TestTemplateRendering:
         assert "{{classification}}" not in result
         assert "{{assembled_context}}" not in result
 
+    def test_compiled_render_matches_sequential_replace(self, executor):
+        """#11: Compiled render equals the former per-key str.replace output."""
+        ctx = {
+            "prior_results": [{"speech_act": "greeting"}],
+            "user_input": "hello",
+            "assembled_context": {"context_text": "x" * 50, "fragment_count": 2},
+        }
+        path = executor.contract_loader.contracts_dir.parent / "prompt_packs" / "PRM-SYNTHESIZE-001.txt"
+        expected = path.read_text()
+        for key, value in ctx.items():
+            expected = expected.replace("{{" + key + "}}", value if isinstance(value, str) else json.dumps(value, indent=2))
+        assert executor._render_template("PRM-SYNTHESIZE-001", ctx) == expected
+
+    def test_template_compiled_once_and_invalidated_on_change(self, executor):
+        """#12: Pack is read once, then re-read only after it changes on disk."""
+        import os
+        from pathlib import Path as _Path
+        path = executor.contract_loader.contracts_dir.parent / "prompt_packs" / "PRM-CLASSIFY-001.txt"
+        with patch.object(_Path, "read_text", autospec=True, side_effect=_Path.read_text) as read_text:
+            for _ in range(3):
+                executor._render_template("PRM-CLASSIFY-001", {"user_input": "a"})
+            assert read_text.call_count == 1
+        path.write_text("Changed pack: {{user_input}}")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert executor._render_template("PRM-CLASSIFY-001", {"user_input": "a"}) == "Changed pack: a"
+
+    def test_tool_loop_serializes_context_once(self, executor):
+        """#13: Follow-up requests of one WO reuse serialized input values."""
+        import prompt_template
+        wo = {
+            "wo_id": "WO-SES-TEST0001-009", "session_id": "SES-TEST0001",
+            "wo_type": "synthesize", "tier_target": "HO1", "state": "dispatched",
+            "input_context": {
+                "prior_results": [{"speech_act": "command"}],
+                "user_input": "list files",
+                "assembled_context": {"context_text": "big context"},
+            },
+            "constraints": {"prompt_contract_id": "PRC-SYNTHESIZE-001", "token_budget": 100000,
+                            "turn_limit": 5, "tools_allowed": ["t1"]},
+            "cost": {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "llm_calls": 0, "tool_calls": 0, "elapsed_ms": 0},
+        }
+        tool_resp = _mock_response('[{"type": "tool_use", "tool_id": "t1", "arguments": {}}]')
+        executor.gateway.route.side_effect = [tool_resp, tool_resp, _mock_response('{"response_text": "done"}')]
+        with patch.object(prompt_template, "render_value", wraps=prompt_template.render_value) as render_value:
+            result = executor.execute(wo)
+        assert result["state"] == "completed"
+        assert executor.gateway.route.call_count == 3
+        assert render_value.call_count == 3  # one per input key, not per request
+
 
 # Tool-Use Wiring Tests (9) — HANDOFF-21
 class TestToolUseWiring:
@@ -1664,3 +1757,264 @@ class TestConsolidationStructuredArtifacts:
         prompt = (ho1_root / "prompt_packs" / "PRM-CONSOLIDATE-001.txt").read_text()
         estimated_tokens = len(prompt.split()) + 200  # rough output allowance
         assert estimated_tokens < 4000
+
+
+# ===========================================================================
+# Async Execute Tests (3)
+# ===========================================================================
+
+class TestExecuteAsync:
+    def test_execute_async_matches_execute(self, executor, classify_wo):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        sync_result = executor.execute(dict(classify_wo))
+        executor.gateway.route_async = AsyncMock(return_value=_mock_response())
+        async_result = asyncio.run(executor.execute_async(dict(classify_wo)))
+
+        assert executor.gateway.route_async.await_count == 1
+        assert async_result["state"] == sync_result["state"] == "completed"
+        assert async_result["output_result"] == sync_result["output_result"]
+        assert async_result["cost"]["llm_calls"] == sync_result["cost"]["llm_calls"]
+
+    def test_sync_gateway_and_tools_run_off_loop(self, executor, classify_wo):
+        import asyncio
+        import threading
+
+        threads = []
+        responses = iter([
+            _mock_tool_use_response(tool_id="read_file", arguments={"path": "x"}),
+            _mock_response('{"speech_act": "command", "ambiguity": "low"}'),
+        ])
+
+        def route(request):
+            threads.append(threading.current_thread())
+            return next(responses)
+
+        def tool(tool_id, arguments):
+            threads.append(threading.current_thread())
+            return SimpleNamespace(tool_id=tool_id, status="ok", output="result")
+
+        executor.gateway = SimpleNamespace(route=route)
+        executor.tool_dispatcher.execute.side_effect = tool
+        classify_wo["constraints"]["tools_allowed"] = ["read_file"]
+
+        result = asyncio.run(executor.execute_async(classify_wo))
+
+        assert result["state"] == "completed"
+        assert result["cost"]["tool_calls"] == 1
+        assert len(threads) == 3
+        assert threading.main_thread() not in threads
+
+    def test_execute_async_drains_ledger_writer(self, executor, classify_wo):
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        executor.gateway.route_async = AsyncMock(return_value=_mock_response())
+        executor.ledger.drain = AsyncMock()
+
+        asyncio.run(executor.execute_async(classify_wo))
+
+        assert executor.ledger.write.call_count >= 2
+        executor.ledger.drain.assert_awaited_once()
+
+
+# ===========================================================================
+# Parallel Tool Dispatch Tests (4)
+# ===========================================================================
+
+def _sleeping_dispatcher(tmp_path, tool_configs, max_workers=4, delay=0.2):
+    import threading
+    import time
+    from tool_dispatch import ToolDispatcher
+
+    dispatcher = ToolDispatcher(
+        tmp_path, tool_configs, {"forbidden": []}, max_workers=max_workers,
+    )
+    state = {"active": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def make_handler(tool_id, sleep_for):
+        def handler(arguments):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(sleep_for)
+            with lock:
+                state["active"] -= 1
+            return f"{tool_id}:{arguments.get('n', '')}"
+        return handler
+
+    for cfg in tool_configs:
+        dispatcher.register_tool(cfg["tool_id"], make_handler(cfg["tool_id"], cfg.get("_delay", delay)))
+    return dispatcher, state
+
+
+class TestParallelToolDispatch:
+    def test_execute_many_overlaps_and_keeps_order(self, tmp_path):
+        import time
+
+        dispatcher, _ = _sleeping_dispatcher(
+            tmp_path, [{"tool_id": "t1"}, {"tool_id": "t2"}, {"tool_id": "t3"}],
+        )
+        start = time.monotonic()
+        results = dispatcher.execute_many([("t3", {"n": 1}), ("t1", {"n": 2}), ("t2", {"n": 3})])
+        elapsed = time.monotonic() - start
+        dispatcher.close()
+
+        assert [r.output for r in results] == ["t3:1", "t1:2", "t2:3"]
+        assert elapsed < 0.45
+
+    def test_per_tool_max_concurrency(self, tmp_path):
+        dispatcher, state = _sleeping_dispatcher(
+            tmp_path, [{"tool_id": "t1", "max_concurrency": 1}], delay=0.05,
+        )
+        results = dispatcher.execute_many([("t1", {"n": i}) for i in range(3)])
+        dispatcher.close()
+
+        assert [r.status for r in results] == ["ok", "ok", "ok"]
+        assert state["peak"] == 1
+
+    def test_timed_out_call_returns_error(self, tmp_path):
+        dispatcher, _ = _sleeping_dispatcher(
+            tmp_path,
+            [{"tool_id": "slow", "timeout_sec": 0.05, "_delay": 0.5}, {"tool_id": "fast", "_delay": 0.0}],
+        )
+        results = dispatcher.execute_many([("slow", {}), ("fast", {"n": 1})])
+        dispatcher.close()
+
+        assert results[0].status == "error"
+        assert "timed out" in results[0].error
+        assert results[1].status == "ok"
+        assert results[1].output == "fast:1"
+
+    def test_multi_tool_turn_dispatches_batch(self, executor, classify_wo, tmp_path):
+        import time
+
+        dispatcher, state = _sleeping_dispatcher(
+            tmp_path, [{"tool_id": "t1"}, {"tool_id": "t2"}, {"tool_id": "read_file"}],
+        )
+        executor.tool_dispatcher = dispatcher
+        classify_wo["constraints"]["tools_allowed"] = ["t1", "t2", "read_file"]
+        executor.gateway.route.side_effect = [
+            _mock_response(json.dumps([
+                {"type": "tool_use", "tool_id": "t2", "arguments": {"n": 1}},
+                {"type": "tool_use", "tool_id": "read_file", "arguments": {"n": 2}},
+                {"type": "tool_use", "tool_id": "t1", "arguments": {"n": 3}},
+            ])),
+            _mock_response('{"speech_act": "command", "ambiguity": "low"}'),
+        ]
+
+        start = time.monotonic()
+        result = executor.execute(classify_wo)
+        elapsed = time.monotonic() - start
+        dispatcher.close()
+
+        assert result["state"] == "completed"
+        assert result["cost"]["tool_calls"] == 3
+        assert result["cost"]["tool_ids_used"] == ["t2", "read_file", "t1"]
+        assert state["peak"] == 3
+        assert elapsed < 0.45
+        events = [c[0][0] for c in executor.ledger.write.call_args_list
+                  if c[0][0].event_type == "TOOL_CALL"]
+        assert [e.metadata["tool_id"] for e in events] == ["t2", "read_file", "t1"]
+        assert [e.metadata["result"] for e in events] == ["t2:1", "read_file:2", "t1:3"]
+
+
+# ===========================================================================
+# Tool Result Cache Tests (5)
+# ===========================================================================
+
+def _counting_dispatcher(tmp_path, tool_configs, **kwargs):
+    from tool_dispatch import ToolDispatcher
+
+    dispatcher = ToolDispatcher(tmp_path, tool_configs, {"forbidden": []}, **kwargs)
+    calls = []
+    for cfg in tool_configs:
+        def handler(arguments, tool_id=cfg["tool_id"]):
+            calls.append((tool_id, arguments))
+            return {"tool": tool_id, "n": len(calls)}
+        dispatcher.register_tool(cfg["tool_id"], handler)
+    return dispatcher, calls
+
+
+class TestToolResultCache:
+    def test_cacheable_tool_hits_on_canonical_arguments(self, tmp_path):
+        dispatcher, calls = _counting_dispatcher(
+            tmp_path, [{"tool_id": "list_packages", "cacheable": True}, {"tool_id": "t1"}],
+        )
+        first = dispatcher.execute("list_packages", {"a": 1, "b": [1, 2]})
+        second = dispatcher.execute("list_packages", {"b": [1, 2], "a": 1})
+        other = dispatcher.execute("list_packages", {"a": 2, "b": [1, 2]})
+        plain = [dispatcher.execute("t1", {}), dispatcher.execute("t1", {})]
+
+        assert (first.cache, second.cache, other.cache) == ("miss", "hit", "miss")
+        assert second.output == first.output
+        assert [r.cache for r in plain] == ["", ""]
+        assert len(calls) == 4
+        assert dispatcher.cache_stats == {"hits": 1, "misses": 2}
+
+    def test_cache_ttl_expires(self, tmp_path):
+        import time
+
+        dispatcher, calls = _counting_dispatcher(
+            tmp_path, [{"tool_id": "t1", "cacheable": True, "cache_ttl_sec": 0.05}],
+        )
+        assert dispatcher.execute("t1", {}).cache == "miss"
+        assert dispatcher.execute("t1", {}).cache == "hit"
+        time.sleep(0.06)
+        assert dispatcher.execute("t1", {}).cache == "miss"
+        assert len(calls) == 2
+
+    def test_cache_is_bounded_lru(self, tmp_path):
+        dispatcher, calls = _counting_dispatcher(
+            tmp_path, [{"tool_id": "t1", "cacheable": True}], cache_max_entries=2,
+        )
+        for n in (1, 2, 1, 3):
+            dispatcher.execute("t1", {"n": n})
+        # n=2 was least recently used when n=3 arrived
+        assert dispatcher.execute("t1", {"n": 1}).cache == "hit"
+        assert dispatcher.execute("t1", {"n": 2}).cache == "miss"
+        assert len(calls) == 4
+
+    def test_cached_output_is_isolated_from_callers(self, tmp_path):
+        dispatcher, calls = _counting_dispatcher(tmp_path, [{"tool_id": "t1", "cacheable": True}])
+        first = dispatcher.execute("t1", {})
+        first.output["n"] = "mutated by caller"
+        second = dispatcher.execute("t1", {})
+        second.output["tool"] = "mutated again"
+        third = dispatcher.execute("t1", {})
+
+        assert (second.cache, third.cache) == ("hit", "hit")
+        assert second.output["n"] == 1
+        assert third.output == {"tool": "t1", "n": 1}
+        assert len(calls) == 1
+
+    def test_cache_counters_in_cost_and_tool_call_event(self, executor, classify_wo, tmp_path):
+        dispatcher, calls = _counting_dispatcher(
+            tmp_path, [{"tool_id": "read_file", "cacheable": True}, {"tool_id": "t1"}],
+        )
+        executor.tool_dispatcher = dispatcher
+        classify_wo["constraints"]["tools_allowed"] = ["read_file", "t1"]
+        executor.gateway.route.side_effect = [
+            _mock_response(json.dumps([
+                {"type": "tool_use", "tool_id": "read_file", "arguments": {"path": "x"}},
+                {"type": "tool_use", "tool_id": "t1", "arguments": {}},
+            ])),
+            _mock_response(json.dumps([
+                {"type": "tool_use", "tool_id": "read_file", "arguments": {"path": "x"}},
+            ])),
+            _mock_response('{"speech_act": "command", "ambiguity": "low"}'),
+        ]
+        classify_wo["constraints"]["turn_limit"] = 3
+
+        result = executor.execute(classify_wo)
+
+        assert result["state"] == "completed"
+        assert result["cost"]["tool_calls"] == 3
+        assert result["cost"]["tool_cache_hits"] == 1
+        assert result["cost"]["tool_cache_misses"] == 1
+        assert len(calls) == 2
+        events = [c[0][0] for c in executor.ledger.write.call_args_list
+                  if c[0][0].event_type == "TOOL_CALL"]
+        assert [e.metadata["tool_cache"] for e in events] == ["miss", "", "hit"]
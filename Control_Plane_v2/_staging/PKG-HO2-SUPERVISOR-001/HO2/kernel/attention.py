@@ -12,7 +12,7 @@ import json
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 @dataclass
@@ -87,11 +87,119 @@ class BudgetTracker:
         )
 
 
+def _entry_session_ids(entry: Dict) -> List[str]:
+    """session_id values a {"session_id": ...} filter would match on."""
+    ids = []
+    top = entry.get("session_id")
+    if isinstance(top, str):
+        ids.append(top)
+    meta = entry.get("metadata")
+    prov = meta.get("provenance") if isinstance(meta, dict) else None
+    nested = prov.get("session_id") if isinstance(prov, dict) else None
+    if isinstance(nested, str) and nested not in ids:
+        ids.append(nested)
+    return ids
+
+
+class _LedgerFileView:
+    """Parsed entries of one JSONL file plus session_id / event_type indexes.
+
+    Valid for the file's (mtime_ns, size) stamp. When the file only grew,
+    refresh() parses just the appended bytes; a shrink triggers a full
+    re-parse. Mirrors read_text().splitlines(): parsing stops at the first
+    malformed line, and a final line without newline is parsed (but not
+    indexed) until its newline arrives.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._reset()
+
+    def _reset(self) -> None:
+        self.stamp: Optional[Tuple[int, int]] = None
+        self.entries: List[Dict] = []
+        self.by_session: Dict[str, List[int]] = {}
+        self.by_event_type: Dict[str, List[int]] = {}
+        self.tail: List[Dict] = []
+        self._offset = 0  # end of the last complete, parsed line
+        self._broken = False
+
+    def refresh(self) -> None:
+        st = self.path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        if stamp == self.stamp:
+            return
+        if st.st_size < self._offset:
+            self._reset()
+        self.stamp = stamp
+        self.tail = []
+        if self._broken:
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(st.st_size - self._offset)
+        complete = data.rfind(b"\n") + 1
+        for line in data[:complete].splitlines():
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                self._broken = True
+                return
+            self._add(entry)
+        self._offset += complete
+        rest = data[complete:].strip()
+        if rest:
+            try:
+                self.tail = [json.loads(rest)]
+            except ValueError:
+                self.tail = []
+
+    def _add(self, entry: Any) -> None:
+        if not isinstance(entry, dict):
+            return
+        idx = len(self.entries)
+        self.entries.append(entry)
+        for sid in _entry_session_ids(entry):
+            self.by_session.setdefault(sid, []).append(idx)
+        et = entry.get("event_type")
+        if isinstance(et, str):
+            self.by_event_type.setdefault(et, []).append(idx)
+
+    def select(self, event_type: Optional[str], session_id: Optional[str]) -> List[Dict]:
+        """Entries matching event_type / session_id, in file order."""
+        candidates: Optional[List[int]] = None
+        if session_id is not None:
+            candidates = self.by_session.get(session_id, [])
+        if event_type:
+            typed = self.by_event_type.get(event_type, [])
+            if candidates is None:
+                candidates = typed
+            else:
+                typed_set = set(typed)
+                candidates = [i for i in candidates if i in typed_set]
+        selected = self.entries if candidates is None else [self.entries[i] for i in candidates]
+        for entry in self.tail:
+            if isinstance(entry, dict) and (not event_type or entry.get("event_type") == event_type) and (
+                session_id is None or session_id in _entry_session_ids(entry)
+            ):
+                selected = selected + [entry]
+        return selected
+
+
 class ContextProvider:
-    """Injectable I/O layer for reading ledger entries. Absorbed from attention_stages.py."""
+    """Injectable I/O layer for reading ledger entries. Absorbed from attention_stages.py.
+
+    Parsed ledger files are cached per provider and revalidated by
+    mtime/size on every read, so the several reads HO2 makes in one turn
+    share one parse and session_id filters are index lookups. Returned
+    entries are shared with the cache and must be treated as read-only.
+    """
 
     def __init__(self, plane_root: Path):
         self.plane_root = plane_root
+        self._views: Dict[Path, _LedgerFileView] = {}
 
     def read_ledger_entries(
         self,
@@ -101,34 +209,97 @@ class ContextProvider:
         filters: Optional[Dict] = None,
     ) -> List[Dict]:
         """Read entries from a ledger JSONL file."""
-        entries = []
-        if ledger_path is None:
-            ledger_dir = self.plane_root / "HOT" / "ledger"
-        else:
-            ledger_dir = ledger_path if ledger_path.is_dir() else ledger_path.parent
+        entries: List[Dict] = []
+        ledger_dir = self._ledger_dir(ledger_path)
         if not ledger_dir.exists():
             return entries
+        filters = dict(filters or {})
+        session_id = filters.pop("session_id") if isinstance(filters.get("session_id"), str) else None
         pattern = "*.jsonl"
-        for jsonl_file in sorted(ledger_dir.glob(pattern)):
+        files = sorted(ledger_dir.glob(pattern))
+        for jsonl_file in files:
+            view = self._views.get(jsonl_file)
+            if view is None:
+                view = self._views[jsonl_file] = _LedgerFileView(jsonl_file)
             try:
-                for line in jsonl_file.read_text().strip().splitlines():
-                    if not line.strip():
-                        continue
-                    entry = json.loads(line)
-                    entries.append(entry)
-            except (json.JSONDecodeError, OSError):
+                view.refresh()
+            except OSError:
                 continue
-        if event_type:
-            entries = [e for e in entries if e.get("event_type") == event_type]
+            entries.extend(view.select(event_type, session_id))
+        # Drop views of files that were removed from this directory
+        live = set(files)
+        for path in [p for p in self._views if p.parent == ledger_dir and p not in live]:
+            del self._views[path]
         if filters:
-            for key, val in filters.items():
-                entries = [e for e in entries if e.get(key) == val or
-                           (isinstance(e.get("metadata", {}), dict) and
-                            e.get("metadata", {}).get("provenance", {}).get(key) == val)]
+            entries = [e for e in entries if _matches_filters(e, filters)]
         if max_entries:
             entries = entries[-max_entries:]
         return entries
 
+    def _ledger_dir(self, ledger_path: Optional[Path]) -> Path:
+        if ledger_path is None:
+            return self.plane_root / "HOT" / "ledger"
+        return ledger_path if ledger_path.is_dir() else ledger_path.parent
+
+    def read_new_ledger_entries(
+        self,
+        ledger_path: Optional[Path],
+        cursors: Dict[str, int],
+        filters: Optional[Dict] = None,
+    ) -> Tuple[List[Dict], Dict[str, int], bool]:
+        """Read only the entries appended since cursors ({file: byte offset}).
+
+        Covers the same files as read_ledger_entries. A trailing line without
+        its newline is left for the next call.
+
+        Returns:
+            (entries, updated_cursors, reset). reset is True when a file
+            shrank or disappeared; the caller should start over from {}.
+        """
+        entries: List[Dict] = []
+        new_cursors = dict(cursors)
+        ledger_dir = self._ledger_dir(ledger_path)
+        files = sorted(ledger_dir.glob("*.jsonl")) if ledger_dir.exists() else []
+        present = {str(f) for f in files}
+        if any(name not in present for name in cursors):
+            return [], {}, True
+        for jsonl_file in files:
+            name = str(jsonl_file)
+            start = cursors.get(name, 0)
+            try:
+                size = jsonl_file.stat().st_size
+                if size < start:
+                    return [], {}, True
+                if size == start:
+                    continue
+                with open(jsonl_file, "rb") as f:
+                    f.seek(start)
+                    data = f.read(size - start)
+            except OSError:
+                continue
+            complete = data.rfind(b"\n") + 1
+            new_cursors[name] = start + complete
+            for line in data[:complete].splitlines():
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and (not filters or _matches_filters(entry, filters)):
+                    entries.append(entry)
+        return entries, new_cursors, False
+
+
+def _matches_filters(entry: Dict, filters: Dict) -> bool:
+    """True if every filter key matches top-level or metadata.provenance."""
+    for key, val in filters.items():
+        if not (entry.get(key) == val or
+                (isinstance(entry.get("metadata", {}), dict) and
+                 entry.get("metadata", {}).get("provenance", {}).get(key) == val)):
+            return False
+    return True
+
 
 def _estimate_tokens(text: str, chars_per_token: int = 4) -> int:
     return len(text) // chars_per_token
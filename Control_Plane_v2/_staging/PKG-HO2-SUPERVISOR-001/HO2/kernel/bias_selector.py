@@ -1,10 +1,20 @@
-"""Pure bias selection policy for HO2 context injection."""
+"""Pure bias selection policy for HO2 context injection.
+
+BiasIndex prepares an artifact set once: context lines, token estimates,
+weight * decay, parsed timestamps and a domain/task label index. Each
+select() then scores only the global artifacts plus those sharing a label
+with the turn, and pops candidates from a heap until the budget is spent
+instead of sorting the whole set. select_biases() is the one-shot form;
+HO2 keeps an index and rebuilds it only when the artifact set changes.
+"""
 
 from __future__ import annotations
 
+import heapq
 import math
 from datetime import datetime
-from typing import Any, Dict, Iterable, List, Set
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 def _normalize_set(value: Any) -> Set[str]:
@@ -28,6 +38,12 @@ def _normalize_set(value: Any) -> Set[str]:
 def _parse_iso(value: Any) -> datetime | None:
     if not isinstance(value, str) or not value:
         return None
+    return _parse_iso_cached(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_cached(value: str) -> datetime | None:
+    # Artifact and turn timestamps repeat across turns; datetimes are immutable
     try:
         return datetime.fromisoformat(value)
     except ValueError:
@@ -47,16 +63,20 @@ def _context_line(artifact: Dict[str, Any]) -> str:
 
 
 def _recency_score(artifact: Dict[str, Any], as_of_ts: str) -> float:
-    as_of = _parse_iso(as_of_ts)
-    if as_of is None:
-        return 1.0
+    return _recency_at(_recency_stamp(artifact), _parse_iso(as_of_ts))
+
+
+def _recency_stamp(artifact: Dict[str, Any]) -> datetime | None:
     stamp = (
         artifact.get("consolidation_event_ts")
         or artifact.get("window_end")
         or artifact.get("last_seen")
     )
-    when = _parse_iso(stamp)
-    if when is None:
+    return _parse_iso(stamp)
+
+
+def _recency_at(when: datetime | None, as_of: datetime | None) -> float:
+    if as_of is None or when is None:
         return 1.0
     age_hours = max((as_of - when).total_seconds() / 3600.0, 0.0)
     if age_hours <= 24.0:
@@ -71,69 +91,133 @@ def _token_estimate(text: str) -> int:
     return max(1, math.ceil(len(text) / 4.0))
 
 
-def select_biases(
-    artifacts: List[Dict[str, Any]],
-    turn_labels: Dict[str, Any],
-    ho3_bias_budget: int,
-    as_of_ts: str,
-) -> List[Dict[str, Any]]:
-    """Filter/rank HO3 artifacts for prompt injection without side effects."""
-    turn_domain = _normalize_set(turn_labels.get("domain") if isinstance(turn_labels, dict) else None)
-    turn_task = _normalize_set(turn_labels.get("task") if isinstance(turn_labels, dict) else None)
-    has_turn_labels = bool(turn_domain or turn_task)
-    as_of = _parse_iso(as_of_ts)
-
-    eligible: List[Dict[str, Any]] = []
-    for artifact in artifacts:
-        if not isinstance(artifact, dict):
-            continue
-        if artifact.get("enabled", True) is False:
-            continue
-
-        expires = _parse_iso(artifact.get("expires_at_event_ts"))
-        if as_of is not None and expires is not None and as_of >= expires:
-            continue
-
-        scope = str(artifact.get("scope", "session"))
-        labels = artifact.get("labels", {})
-        domain_labels = _normalize_set(labels.get("domain")) if isinstance(labels, dict) else set()
-        task_labels = _normalize_set(labels.get("task")) if isinstance(labels, dict) else set()
-
-        if not has_turn_labels:
-            if scope != "global" and "labels" in artifact:
-                continue
-        else:
-            label_match = bool((domain_labels & turn_domain) or (task_labels & turn_task))
-            if scope != "global" and not label_match:
-                continue
+class _Prepared:
+    """Turn-independent parts of one artifact's eligibility and score."""
+
+    __slots__ = ("artifact", "position", "line", "tokens", "base_score", "expires", "stamp", "id_rank")
 
-        line = _context_line(artifact)
-        if not line:
-            continue
+    def __init__(self, artifact: Dict[str, Any], position: int, line: str):
+        self.artifact = artifact
+        self.position = position
+        self.line = line
+        self.tokens = _token_estimate(line)
+        self.base_score: Optional[float] = None  # weight * decay, on first use
+        self.expires = _parse_iso(artifact.get("expires_at_event_ts"))
+        self.stamp = _recency_stamp(artifact)
+        self.id_rank = 0
 
-        weight = float(artifact.get("weight", artifact.get("salience_weight", 0.5)) or 0.0)
-        decay = float(artifact.get("decay_modifier", 1.0) or 0.0)
-        score = weight * decay * _recency_score(artifact, as_of_ts)
 
-        candidate = dict(artifact)
-        candidate["context_line"] = line
-        candidate["_score"] = score
-        candidate["_token_estimate"] = _token_estimate(line)
-        eligible.append(candidate)
+class BiasIndex:
+    """An artifact set prepared for repeated bias selection.
 
-    eligible.sort(key=lambda a: (a["_score"], a.get("artifact_id", "")), reverse=True)
+    The index keeps a reference to `artifacts`; the dicts must not be
+    mutated while it is in use. matches() tells whether a freshly read
+    artifact list is the same set, so callers can reuse the index.
+    """
 
-    selected: List[Dict[str, Any]] = []
-    budget_used = 0
-    for artifact in eligible:
-        token_cost = int(artifact["_token_estimate"])
-        if budget_used + token_cost > max(0, int(ho3_bias_budget)):
-            continue
-        selected.append({
-            k: v for k, v in artifact.items()
-            if not k.startswith("_")
-        })
-        budget_used += token_cost
+    def __init__(self, artifacts: List[Dict[str, Any]]):
+        self.artifacts = artifacts
+        self._global: List[_Prepared] = []
+        self._unlabeled: List[_Prepared] = []   # non-global, no "labels" key
+        self._by_domain: Dict[str, List[_Prepared]] = {}
+        self._by_task: Dict[str, List[_Prepared]] = {}
 
-    return selected
+        prepared: List[_Prepared] = []
+        for position, artifact in enumerate(artifacts):
+            if not isinstance(artifact, dict):
+                continue
+            if artifact.get("enabled", True) is False:
+                continue
+            line = _context_line(artifact)
+            if not line:
+                continue
+            item = _Prepared(artifact, position, line)
+            prepared.append(item)
+
+            if str(artifact.get("scope", "session")) == "global":
+                self._global.append(item)
+                continue
+            if "labels" not in artifact:
+                self._unlabeled.append(item)
+            labels = artifact.get("labels", {})
+            if isinstance(labels, dict):
+                for label in _normalize_set(labels.get("domain")):
+                    self._by_domain.setdefault(label, []).append(item)
+                for label in _normalize_set(labels.get("task")):
+                    self._by_task.setdefault(label, []).append(item)
+
+        # Ties on score break on artifact_id, descending: rank ids once
+        ranks = {aid: rank for rank, aid in enumerate(sorted({p.artifact.get("artifact_id", "") for p in prepared}))}
+        for item in prepared:
+            item.id_rank = ranks[item.artifact.get("artifact_id", "")]
+
+    def matches(self, artifacts: List[Dict[str, Any]]) -> bool:
+        """True if `artifacts` equals the set this index was built from."""
+        return artifacts is self.artifacts or artifacts == self.artifacts
+
+    def _candidates(self, turn_domain: Set[str], turn_task: Set[str]) -> List[_Prepared]:
+        if not (turn_domain or turn_task):
+            return self._global + self._unlabeled
+        seen: Dict[int, _Prepared] = {item.position: item for item in self._global}
+        for index, turn_set in ((self._by_domain, turn_domain), (self._by_task, turn_task)):
+            for label in turn_set:
+                for item in index.get(label, ()):
+                    seen[item.position] = item
+        return list(seen.values())
+
+    def select(
+        self,
+        turn_labels: Dict[str, Any],
+        ho3_bias_budget: int,
+        as_of_ts: str,
+    ) -> List[Dict[str, Any]]:
+        """Filter/rank the indexed artifacts for prompt injection."""
+        turn_domain = _normalize_set(turn_labels.get("domain") if isinstance(turn_labels, dict) else None)
+        turn_task = _normalize_set(turn_labels.get("task") if isinstance(turn_labels, dict) else None)
+        as_of = _parse_iso(as_of_ts)
+        budget = max(0, int(ho3_bias_budget))
+
+        heap: List[Tuple[float, int, int, _Prepared]] = []
+        min_tokens = None
+        for item in self._candidates(turn_domain, turn_task):
+            if as_of is not None and item.expires is not None and as_of >= item.expires:
+                continue
+            if item.base_score is None:
+                weight = float(item.artifact.get("weight", item.artifact.get("salience_weight", 0.5)) or 0.0)
+                decay = float(item.artifact.get("decay_modifier", 1.0) or 0.0)
+                item.base_score = weight * decay
+            score = item.base_score * _recency_at(item.stamp, as_of)
+            heap.append((-score, -item.id_rank, item.position, item))
+            if min_tokens is None or item.tokens < min_tokens:
+                min_tokens = item.tokens
+        heapq.heapify(heap)
+
+        # Greedy fill in (score, artifact_id) descending order, input order on ties
+        selected: List[Dict[str, Any]] = []
+        budget_used = 0
+        while heap and budget - budget_used >= (min_tokens or 1):
+            item = heapq.heappop(heap)[3]
+            if budget_used + item.tokens > budget:
+                continue
+            chosen = {k: v for k, v in item.artifact.items() if not k.startswith("_")}
+            chosen["context_line"] = item.line
+            selected.append(chosen)
+            budget_used += item.tokens
+
+        return selected
+
+
+def select_biases(
+    artifacts: List[Dict[str, Any]],
+    turn_labels: Dict[str, Any],
+    ho3_bias_budget: int,
+    as_of_ts: str,
+    index: Optional[BiasIndex] = None,
+) -> List[Dict[str, Any]]:
+    """Filter/rank HO3 artifacts for prompt injection without side effects.
 
+    Pass `index` (built from the same artifacts) to skip re-preparing them.
+    """
+    if index is None or not index.matches(artifacts):
+        index = BiasIndex(artifacts)
+    return index.select(turn_labels, ho3_bias_budget, as_of_ts)
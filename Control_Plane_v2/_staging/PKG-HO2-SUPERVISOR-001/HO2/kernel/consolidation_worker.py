@@ -0,0 +1,195 @@
+"""Background consolidation queue for HO2.
+
+ConsolidationQueue takes the consolidation_candidates of a turn and runs
+one consolidation job per signal_id on a small thread pool, so the turn
+that produced the candidates never waits for a consolidate WO.
+
+- A signal_id accepted within the last dedupe_window_sec is dropped, as is
+  one already queued or running. A failed job, or one dropped for budget,
+  frees its signal_id again.
+- Jobs draw on a dedicated token pool: each running job reserves
+  wo_budget tokens and, when done, is charged its WO's actual
+  cost.total_tokens. A job that cannot reserve waits for running jobs to
+  settle; with nothing running it is dropped as budget_exhausted.
+  pool_budget=0 means unlimited.
+- metrics() reports queue depth, in-flight jobs, outcome counters, token
+  use and queue-wait/run latency.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+
+class ConsolidationQueue:
+    """Deduplicating, budgeted worker pool for consolidation jobs.
+
+    run_job(signal_id) performs one consolidation and returns the
+    consolidate WO's result, or None when there was nothing to do (gate
+    closed). The token pool covers the life of the queue.
+    """
+
+    def __init__(
+        self,
+        run_job: Callable[[str], Optional[Dict[str, Any]]],
+        max_workers: int = 2,
+        pool_budget: int = 0,
+        wo_budget: int = 0,
+        dedupe_window_sec: float = 0.0,
+        name: str = "consolidation",
+    ):
+        self._run_job = run_job
+        self._max_workers = max(1, int(max_workers))
+        self._pool_budget = max(0, int(pool_budget))
+        self._wo_budget = max(0, int(wo_budget))
+        self._dedupe_window_sec = max(0.0, float(dedupe_window_sec))
+        self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix=name)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._queue: Deque[Tuple[str, float]] = deque()
+        self._in_flight = 0
+        self._closed = False
+        self._accepted_at: Dict[str, float] = {}  # signal_id -> monotonic accept time
+        self._pending: Set[str] = set()           # queued or running signal_ids
+        self._tokens_used = 0
+        self._tokens_reserved = 0
+        self._counters = {
+            "submitted": 0, "deduplicated": 0, "completed": 0,
+            "skipped": 0, "failed": 0, "budget_exhausted": 0,
+        }
+        self._wait_ms: Deque[float] = deque(maxlen=1000)  # recent samples
+        self._run_ms: Deque[float] = deque(maxlen=1000)
+        self.results: Deque[Dict[str, Any]] = deque(maxlen=100)  # recent completed WOs
+
+    def submit(self, signal_ids: Iterable[str]) -> List[str]:
+        """Queue signal_ids for consolidation. Returns the ones accepted.
+
+        After close() nothing is accepted.
+        """
+        accepted = []
+        now = time.monotonic()
+        with self._lock:
+            if self._closed:
+                return accepted
+            self._prune_accepted(now)
+            for sig_id in signal_ids:
+                if not sig_id:
+                    continue
+                last = self._accepted_at.get(sig_id)
+                if sig_id in self._pending or (last is not None and now - last < self._dedupe_window_sec):
+                    self._counters["deduplicated"] += 1
+                    continue
+                self._accepted_at[sig_id] = now
+                self._pending.add(sig_id)
+                self._queue.append((sig_id, now))
+                self._counters["submitted"] += 1
+                accepted.append(sig_id)
+            self._pump()
+        return accepted
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queue is empty and no job is running."""
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def close(self) -> None:
+        """Drop queued jobs and wait for running ones. Idempotent."""
+        with self._lock:
+            self._closed = True
+            for sig_id, _ in self._queue:
+                self._pending.discard(sig_id)
+            self._queue.clear()
+            self._idle.notify_all()
+        self._pool.shutdown(wait=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of queue depth, outcomes, token use and latency (ms)."""
+        with self._lock:
+            now = time.monotonic()
+            oldest = (now - self._queue[0][1]) * 1000.0 if self._queue else 0.0
+            return {
+                "queue_depth": len(self._queue),
+                "in_flight": self._in_flight,
+                **self._counters,
+                "tokens_used": self._tokens_used,
+                "tokens_reserved": self._tokens_reserved,
+                "budget_remaining": (
+                    max(0, self._pool_budget - self._tokens_used - self._tokens_reserved)
+                    if self._pool_budget else None
+                ),
+                "oldest_wait_ms": oldest,
+                "queue_wait_ms_avg": sum(self._wait_ms) / len(self._wait_ms) if self._wait_ms else 0.0,
+                "queue_wait_ms_max": max(self._wait_ms, default=0.0),
+                "run_ms_avg": sum(self._run_ms) / len(self._run_ms) if self._run_ms else 0.0,
+                "run_ms_max": max(self._run_ms, default=0.0),
+            }
+
+    def _prune_accepted(self, now: float) -> None:
+        """Forget accept stamps older than the dedupe window. Caller holds _lock."""
+        stale = [
+            sig_id for sig_id, at in self._accepted_at.items()
+            if now - at >= self._dedupe_window_sec and sig_id not in self._pending
+        ]
+        for sig_id in stale:
+            del self._accepted_at[sig_id]
+
+    def _fits(self) -> bool:
+        if not self._pool_budget:
+            return True
+        return self._tokens_used + self._tokens_reserved + self._wo_budget <= self._pool_budget
+
+    def _pump(self) -> None:
+        """Start queued jobs while workers and budget allow. Caller holds _lock."""
+        while self._queue and self._in_flight < self._max_workers:
+            if not self._fits():
+                if self._in_flight:
+                    return  # a running job may settle under its reservation
+                sig_id, _ = self._queue.popleft()
+                self._pending.discard(sig_id)
+                self._accepted_at.pop(sig_id, None)  # never ran; allow a retry
+                self._counters["budget_exhausted"] += 1
+                continue
+            sig_id, queued_at = self._queue.popleft()
+            self._wait_ms.append((time.monotonic() - queued_at) * 1000.0)
+            self._in_flight += 1
+            self._tokens_reserved += self._wo_budget
+            self._pool.submit(self._run, sig_id)
+        if not self._queue and not self._in_flight:
+            self._idle.notify_all()
+
+    def _run(self, sig_id: str) -> None:
+        start = time.monotonic()
+        result: Optional[Dict[str, Any]] = None
+        error = False
+        try:
+            result = self._run_job(sig_id)
+        except Exception:
+            error = True
+        run_ms = (time.monotonic() - start) * 1000.0
+        with self._lock:
+            self._in_flight -= 1
+            self._tokens_reserved -= self._wo_budget
+            self._pending.discard(sig_id)
+            self._run_ms.append(run_ms)
+            if error:
+                self._counters["failed"] += 1
+                self._accepted_at.pop(sig_id, None)  # allow a retry
+            elif result is None:
+                self._counters["skipped"] += 1
+            else:
+                self._tokens_used += int((result.get("cost") or {}).get("total_tokens", 0))
+                if result.get("state") == "completed":
+                    self._counters["completed"] += 1
+                    self.results.append(result)
+                else:
+                    self._counters["failed"] += 1
+                    self._accepted_at.pop(sig_id, None)
+            self._pump()
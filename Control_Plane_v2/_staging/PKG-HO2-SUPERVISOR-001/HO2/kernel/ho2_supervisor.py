@@ -7,15 +7,24 @@ HO2 owns Steps 2 (Scoping) and 4 (Verification):
 
 HO2 NEVER calls LLM Gateway directly (Invariant #1).
 All cognitive work is dispatched as WorkOrders to HO1.
+
+handle_turn_async() runs the same turn on an asyncio event loop, awaiting
+HO1.execute_async(), so many sessions (one supervisor each) can share a
+process, a gateway and an AsyncLedgerWriter-wrapped HO2m ledger.
 """
 
+import asyncio
 import hashlib
+import inspect
 import json
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, Callable, Dict, Generator, List, Optional, Protocol, Tuple
 
 import sys
 
@@ -37,8 +46,9 @@ from session_manager import SessionManager, TurnMessage
 from attention import AttentionRetriever, ContextProvider, AttentionContext
 from quality_gate import QualityGate, QualityGateResult
 from intent_resolver import resolve_intent_transition, make_intent_id, TransitionDecision
-from bias_selector import select_biases
-from liveness import reduce_liveness, LivenessState
+from bias_selector import BiasIndex, select_biases
+from consolidation_worker import ConsolidationQueue
+from liveness import LivenessReducer, LivenessState
 from overlay_writer import write_projection
 from context_projector import ContextProjector, ProjectionConfig
 
@@ -49,12 +59,21 @@ except ImportError:
     HO3Memory = None
 
 
+# Steps yielded by HO2Supervisor._turn_steps()
+_DISPATCH = "dispatch"  # arg: WO dict; reply: HO1 result
+_PREFETCH = "prefetch"  # arg: _TurnPrefetch; reply: None once its reads finished
+_BLOCKING = "blocking"  # arg: callable doing synchronous ledger/HO3 I/O; reply: its result
+
 # ---------------------------------------------------------------------------
 # Protocols and Data Classes
 # ---------------------------------------------------------------------------
 
 class HO1ExecutorProtocol(Protocol):
-    """Interface HO2 depends on for HO1 execution."""
+    """Interface HO2 depends on for HO1 execution.
+
+    Executors may also provide ``async def execute_async(work_order)``;
+    handle_turn_async() falls back to execute() in a worker thread.
+    """
     def execute(self, work_order: dict) -> dict: ...
 
 
@@ -90,6 +109,11 @@ class HO2Config:
     # Consolidation config (29C)
     consolidation_budget: int = 4000
     consolidation_contract_id: str = "PRC-CONSOLIDATE-001"
+    # Background consolidation pool: 0 workers = run inline in run_consolidation()
+    consolidation_workers: int = 0
+    consolidation_pool_budget: int = 0  # tokens across all background WOs, 0 = unlimited
+    # Start classify-independent reads (liveness, HO3, attention) while classify runs
+    turn_prefetch: bool = True
 
 
 @dataclass
@@ -103,6 +127,40 @@ class TurnResult:
     consolidation_candidates: List[str] = field(default_factory=list)
 
 
+class _TurnPrefetch:
+    """Classify-independent reads started before the classify WO.
+
+    Results are only consumed after wait(). A read that failed, or was
+    never started, is recomputed synchronously by result()'s fallback so
+    the turn behaves exactly as without prefetching.
+    """
+
+    def __init__(self, pool: Optional[ThreadPoolExecutor] = None):
+        self._pool = pool
+        self._futures: Dict[str, Future] = {}
+
+    def submit(self, name: str, fn: Callable[..., Any], *args: Any) -> None:
+        if self._pool is not None:
+            self._futures[name] = self._pool.submit(fn, *args)
+
+    def wait(self) -> None:
+        wait(list(self._futures.values()))
+
+    async def wait_async(self) -> None:
+        """wait() without blocking the event loop."""
+        if self._futures:
+            await asyncio.wait([asyncio.wrap_future(f) for f in self._futures.values()])
+
+    def result(self, name: str, fallback: Callable[[], Any]) -> Any:
+        future = self._futures.pop(name, None)
+        if future is not None:
+            try:
+                return future.result()
+            except Exception:
+                pass
+        return fallback()
+
+
 # ---------------------------------------------------------------------------
 # HO2 Supervisor
 # ---------------------------------------------------------------------------
@@ -131,6 +189,8 @@ class HO2Supervisor:
         self._budgeter = token_budgeter
         self._config = config
         self._ho3_memory = ho3_memory
+        self._bias_index: Optional[BiasIndex] = None  # prepared HO3 artifacts, reused across turns
+        self._wo_id_lock = threading.Lock()  # WO ids are also minted by consolidation workers
 
         agent_id = f"{agent_class}.ho2"
         self._session_mgr = SessionManager(ledger_client, agent_class, agent_id)
@@ -150,7 +210,13 @@ class HO2Supervisor:
         overlay_path = plane_root / "HO2" / "ledger" / "ho2_context_authority.jsonl"
         self._overlay_ledger = LedgerClient(ledger_path=overlay_path)
         self._current_liveness = LivenessState()
+        self._liveness_reducers: Dict[str, LivenessReducer] = {}
+        # Created on first use and shut down by close()
+        self._turn_pool: Optional[ThreadPoolExecutor] = None
         self._quality_gate = QualityGate(config)
+        self._consolidation_queue: Optional[ConsolidationQueue] = None
+        if config.consolidation_workers > 0:
+            self._consolidation_queue = self._new_consolidation_queue()
         self._total_cost: Dict[str, int] = {
             "input_tokens": 0, "output_tokens": 0, "total_tokens": 0,
             "llm_calls": 0, "tool_calls": 0, "elapsed_ms": 0,
@@ -163,17 +229,92 @@ class HO2Supervisor:
         return self._session_mgr.start_session()
 
     def end_session(self) -> None:
-        """Close session. Write SESSION_END to HO2m."""
+        """Close session. Write SESSION_END to HO2m.
+
+        Waits for queued background consolidation WOs first, so they are
+        recorded inside the session.
+        """
+        if self._consolidation_queue is not None:
+            self._consolidation_queue.join()
         self._session_mgr.end_session(
             turn_count=self._session_mgr.turn_count,
             total_cost=dict(self._total_cost),
         )
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the turn prefetch pool and the consolidation queue.
+
+        Called by end_session(). A later session on this supervisor starts
+        fresh ones on first use.
+        """
+        pool, self._turn_pool = self._turn_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        if self._consolidation_queue is not None:
+            self._consolidation_queue.close()
 
     def handle_turn(self, user_message: str) -> TurnResult:
         """Main entry: classify -> attention -> synthesize -> verify -> return.
 
         Kitchener Steps 2 (Scope) -> 3 (Execute via HO1) -> 4 (Verify).
         """
+        steps = self._turn_steps(user_message)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            try:
+                if op == _DISPATCH:
+                    reply = self._dispatch_wo(arg)
+                elif op == _PREFETCH:
+                    arg.wait()
+                else:
+                    reply = arg()
+            except Exception as e:
+                error = e
+
+    async def handle_turn_async(self, user_message: str) -> TurnResult:
+        """Awaitable handle_turn(): the event loop is free while HO1 runs.
+
+        Prefetched reads are awaited via asyncio.wrap_future() and the
+        turn's synchronous ledger/HO3 reads run in the default executor.
+        If the HO2m ledger is an AsyncLedgerWriter, it is drained after
+        each dispatch (before the turn reads HO2m back) and at turn end.
+        """
+        loop = asyncio.get_running_loop()
+        steps = self._turn_steps(user_message)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                await self._drain_ledger()
+                return done.value
+            reply, error = None, None
+            try:
+                if op == _DISPATCH:
+                    reply = await self._dispatch_wo_async(arg)
+                    await self._drain_ledger()
+                elif op == _PREFETCH:
+                    await arg.wait_async()
+                else:
+                    reply = await loop.run_in_executor(None, arg)
+            except Exception as e:
+                error = e
+
+    def _turn_steps(self, user_message: str) -> Generator[Tuple[str, Any], Any, TurnResult]:
+        """The turn pipeline, suspended at each WO dispatch and blocking read.
+
+        Yields (op, arg) steps: a WO to dispatch, the prefetch to join, or
+        a blocking read to run. The driver sends back the step's result or
+        throws its exception in. Returns the TurnResult.
+        """
         # Auto-start session if needed
         session_id = self._session_mgr.session_id
         if session_id is None:
@@ -185,6 +326,7 @@ class HO2Supervisor:
             "llm_calls": 0, "tool_calls": 0, "elapsed_ms": 0,
         }
         turn_event_ts = datetime.now(timezone.utc).isoformat()
+        prefetch = self._start_turn_prefetch(session_id, turn_event_ts)
 
         try:
             # ------ Step 2a: Classify user intent ------
@@ -200,59 +342,42 @@ class HO2Supervisor:
                 },
             )
             self._log_wo_event("WO_PLANNED", classify_wo)
-            classify_result = self._dispatch_wo(classify_wo)
+            classify_result = yield _DISPATCH, classify_wo
+            # Speculative reads ran alongside classify; join before touching their state
+            yield _PREFETCH, prefetch
             wo_chain.append(classify_result)
             self._accumulate_cost(chain_cost, classify_result.get("cost", {}))
 
             classification = classify_result.get("output_result", {}) or {}
 
             # ------ Step 2a+: Intent lifecycle (31C) ------
-            active_intents = self._scan_active_intents(session_id)
+            active_intents = yield _BLOCKING, partial(self._scan_active_intents, session_id)
             intent_decision = resolve_intent_transition(
                 active_intents, classification, session_id, self._intent_sequence + 1,
             )
             self._apply_intent_decision(intent_decision, session_id)
 
             # ------ Step 2a++: Liveness reduction + projection snapshot ------
-            ho2m_entries = self._context_provider.read_ledger_entries(
-                ledger_path=self._config.ho2m_path,
-                filters={"session_id": session_id},
-            )
-            ho1m_entries: List[Dict[str, Any]] = []
-            if self._config.ho1m_path:
-                ho1m_entries = self._context_provider.read_ledger_entries(
-                    ledger_path=self._config.ho1m_path,
-                    filters={"session_id": session_id},
-                )
-
-            self._current_liveness = reduce_liveness(
-                ho2m_entries=ho2m_entries,
-                ho1m_entries=ho1m_entries,
-                session_id=session_id,
-            )
-            turn_id = f"TURN-{self._session_mgr.turn_count + 1:03d}"
-            write_projection(
-                liveness=self._current_liveness,
-                session_id=session_id,
-                turn_id=turn_id,
-                token_budget=self._config.projection_budget,
-                overlay_ledger=self._overlay_ledger,
+            self._current_liveness = yield _BLOCKING, partial(
+                self._project_liveness, session_id, prefetch.result("liveness", lambda: None),
             )
 
             # ------ Step 2b+: HO3 bias selection (29B) ------
             ho3_biases = []
             if self._ho3_memory and self._config.ho3_enabled:
-                try:
-                    all_artifacts = self._ho3_memory.read_active_biases(as_of_ts=turn_event_ts)
-                except TypeError:
-                    # Backward compatibility with older HO3 memory API.
-                    all_artifacts = self._ho3_memory.read_active_biases()
+                all_artifacts = yield _BLOCKING, partial(
+                    prefetch.result, "ho3_artifacts", lambda: self._load_ho3_artifacts(turn_event_ts),
+                )
                 turn_labels = classification.get("labels", {}) if isinstance(classification, dict) else {}
+                # Re-prepare artifacts only when the active set changed
+                if self._bias_index is None or not self._bias_index.matches(all_artifacts):
+                    self._bias_index = BiasIndex(all_artifacts)
                 ho3_biases = select_biases(
                     all_artifacts,
                     turn_labels if isinstance(turn_labels, dict) else {},
                     self._config.ho3_bias_budget,
                     turn_event_ts,
+                    index=self._bias_index,
                 )
 
             # ------ Step 2b/2c: Context projection (31E-1) ------
@@ -269,8 +394,8 @@ class HO2Supervisor:
                     session_id=session_id,
                 )
             elif self._projector and projection_mode == "shadow":
-                horizontal = self._attention.horizontal_scan(session_id)
-                priority = self._attention.priority_probe()
+                horizontal = yield _BLOCKING, partial(self._attention.horizontal_scan, session_id)
+                priority = yield _BLOCKING, self._attention.priority_probe
                 old_context = self._attention.assemble_wo_context(
                     horizontal, priority, user_message, classification,
                 )
@@ -284,8 +409,8 @@ class HO2Supervisor:
                 self._log_shadow_comparison(session_id, old_context, new_context)
                 assembled_context = old_context
             else:
-                horizontal = self._attention.horizontal_scan(session_id)
-                priority = self._attention.priority_probe()
+                horizontal = yield _BLOCKING, partial(self._attention.horizontal_scan, session_id)
+                priority = yield _BLOCKING, self._attention.priority_probe
                 assembled_context = self._attention.assemble_wo_context(
                     horizontal, priority, user_message, classification,
                 )
@@ -324,7 +449,7 @@ class HO2Supervisor:
                 },
             )
             self._log_wo_event("WO_PLANNED", synthesize_wo)
-            synth_result = self._dispatch_wo(synthesize_wo)
+            synth_result = yield _DISPATCH, synthesize_wo
             wo_chain.append(synth_result)
             self._accumulate_cost(chain_cost, synth_result.get("cost", {}))
 
@@ -369,7 +494,7 @@ class HO2Supervisor:
                     },
                 )
                 self._log_wo_event("WO_PLANNED", retry_wo)
-                retry_result = self._dispatch_wo(retry_wo)
+                retry_result = yield _DISPATCH, retry_wo
                 wo_chain.append(retry_result)
                 self._accumulate_cost(chain_cost, retry_result.get("cost", {}))
 
@@ -393,7 +518,7 @@ class HO2Supervisor:
 
             # ------ Log chain events ------
             wo_ids = [w.get("wo_id", "") for w in wo_chain]
-            trace_hash = self._compute_trace_hash(wo_ids, session_id)
+            trace_hash = yield _BLOCKING, partial(self._compute_trace_hash, wo_ids, session_id)
 
             self._log_chain_complete(session_id, wo_ids, chain_cost, trace_hash)
             self._log_quality_gate(session_id, gate_result, trace_hash)
@@ -412,13 +537,14 @@ class HO2Supervisor:
             if self._ho3_memory and self._config.ho3_enabled:
                 # Extract deterministic signals from the turn
                 signals_this_turn: List[str] = []
+                signal_batch: List[Tuple[str, str, str]] = []
                 seen_signals = set()
 
                 def _emit_signal(sig_id: str) -> None:
                     if not sig_id or sig_id in seen_signals:
                         return
                     evt_id = f"EVT-{hashlib.sha256(f'{session_id}:{sig_id}:{time.time_ns()}'.encode()).hexdigest()[:8]}"
-                    self._ho3_memory.log_signal(sig_id, session_id, evt_id)
+                    signal_batch.append((sig_id, session_id, evt_id))
                     signals_this_turn.append(sig_id)
                     seen_signals.add(sig_id)
 
@@ -450,9 +576,10 @@ class HO2Supervisor:
                     outcome = "unknown"
                 _emit_signal(f"outcome:{outcome}")
 
-                # Gate check for each signal logged this turn
-                for sig_id in signals_this_turn:
-                    gate = self._ho3_memory.check_gate(sig_id)
+                # Log the turn's signals, then gate-check them together
+                yield _BLOCKING, partial(self._ho3_log_signals, signal_batch)
+                gates = yield _BLOCKING, partial(self._ho3_check_gates, signals_this_turn)
+                for sig_id, gate in zip(signals_this_turn, gates):
                     if gate.crossed:
                         consolidation_candidates.append(sig_id)
 
@@ -471,6 +598,8 @@ class HO2Supervisor:
             )
 
         except Exception as exc:
+            # Never leave prefetch reads running into the next turn
+            yield _PREFETCH, prefetch
             # Degradation path: log governance violation
             self._log_degradation(session_id, str(exc))
             degradation_response = f"[Degradation: {exc}]"
@@ -493,6 +622,137 @@ class HO2Supervisor:
     # Internal helpers
     # -----------------------------------------------------------------------
 
+    def _start_turn_prefetch(self, session_id: str, turn_event_ts: str) -> _TurnPrefetch:
+        """Start the reads that do not depend on the classify output.
+
+        Liveness ledger reads (and reducer restore), HO3 artifact loading
+        and the attention ledger parse overlap the classify WO; only the
+        cheap catch-up of entries written after classify stays on the
+        critical path.
+        """
+        if not getattr(self._config, "turn_prefetch", True):
+            return _TurnPrefetch()
+        if self._turn_pool is None:
+            self._turn_pool = ThreadPoolExecutor(
+                max_workers=3, thread_name_prefix=f"{self._agent_class}.ho2.prefetch",
+            )
+        prefetch = _TurnPrefetch(self._turn_pool)
+        prefetch.submit("liveness", self._prefetch_liveness, session_id)
+        if self._ho3_memory and self._config.ho3_enabled:
+            prefetch.submit("ho3_artifacts", self._load_ho3_artifacts, turn_event_ts)
+        if (getattr(self._config, "projection_mode", "shadow") or "shadow").lower() != "enforce":
+            prefetch.submit("attention", self._warm_attention_views)
+        return prefetch
+
+    def _load_ho3_artifacts(self, turn_event_ts: str) -> List[Dict[str, Any]]:
+        try:
+            return self._ho3_memory.read_active_biases(as_of_ts=turn_event_ts)
+        except TypeError:
+            # Backward compatibility with older HO3 memory API.
+            return self._ho3_memory.read_active_biases()
+
+    def _warm_attention_views(self) -> None:
+        """Parse the HO2m/HO1m ledgers into the shared provider cache."""
+        self._context_provider.read_ledger_entries(ledger_path=self._config.ho2m_path)
+        if self._config.ho1m_path:
+            self._context_provider.read_ledger_entries(ledger_path=self._config.ho1m_path)
+
+    def _liveness_reducer_for(self, session_id: str) -> LivenessReducer:
+        reducer = self._liveness_reducers.get(session_id)
+        if reducer is None:
+            reducer = self._restore_liveness_reducer(session_id) or LivenessReducer(session_id)
+            self._liveness_reducers[session_id] = reducer
+        return reducer
+
+    def _read_liveness_delta(
+        self, session_id: str, cursors: Dict[str, Dict[str, int]],
+    ) -> Optional[Tuple[Dict[str, List[Dict[str, Any]]], Dict[str, Dict[str, int]]]]:
+        """Read session entries appended after cursors; None if a ledger was truncated."""
+        sources = {"ho2m": self._config.ho2m_path}
+        if self._config.ho1m_path:
+            sources["ho1m"] = self._config.ho1m_path
+        new_entries: Dict[str, List[Dict[str, Any]]] = {}
+        new_cursors: Dict[str, Dict[str, int]] = {}
+        for source, path in sources.items():
+            entries, source_cursors, reset = self._context_provider.read_new_ledger_entries(
+                path, cursors.get(source, {}), filters={"session_id": session_id},
+            )
+            if reset:
+                return None
+            new_entries[source], new_cursors[source] = entries, source_cursors
+        return new_entries, new_cursors
+
+    def _prefetch_liveness(self, session_id: str):
+        reducer = self._liveness_reducer_for(session_id)
+        return reducer, self._read_liveness_delta(session_id, reducer.cursors)
+
+    def _project_liveness(self, session_id: str, prefetched=None) -> LivenessState:
+        """Update the session's liveness and write its PROJECTION_COMPUTED snapshot."""
+        liveness = self._update_liveness(session_id, prefetched=prefetched)
+        write_projection(
+            liveness=liveness,
+            session_id=session_id,
+            turn_id=f"TURN-{self._session_mgr.turn_count + 1:03d}",
+            token_budget=self._config.projection_budget,
+            overlay_ledger=self._overlay_ledger,
+            snapshot=self._liveness_reducers[session_id].snapshot(),
+        )
+        return liveness
+
+    def _update_liveness(self, session_id: str, prefetched=None) -> LivenessState:
+        """Fold HO2m/HO1m events appended since the last turn into liveness.
+
+        The session's reducer is resumed from its latest PROJECTION_COMPUTED
+        snapshot after a restart. prefetched is _prefetch_liveness()'s
+        result from earlier in the turn; only entries appended since are
+        read here. A truncated ledger or an out-of-order event triggers one
+        rebuild from genesis.
+        """
+        reducer = self._liveness_reducer_for(session_id)
+        base = None
+        if prefetched is not None and prefetched[0] is reducer and prefetched[1] is not None:
+            base = prefetched[1]
+
+        for attempt in range(2):
+            if base is not None:
+                delta = self._read_liveness_delta(session_id, base[1])
+                if delta is not None:
+                    delta = ({s: base[0].get(s, []) + e for s, e in delta[0].items()}, delta[1])
+                base = None
+            else:
+                delta = self._read_liveness_delta(session_id, reducer.cursors)
+            if delta is None:
+                reducer = LivenessReducer(session_id)
+                delta = self._read_liveness_delta(session_id, {}) or ({}, {})
+            entries, cursors = delta
+            state = reducer.fold(
+                ho2m_entries=entries.get("ho2m", []),
+                ho1m_entries=entries.get("ho1m", []),
+            )
+            if reducer.needs_rebuild and attempt == 0:
+                reducer = LivenessReducer(session_id)
+                continue
+            reducer.cursors = cursors
+            break
+        self._liveness_reducers[session_id] = reducer
+        return state
+
+    def _restore_liveness_reducer(self, session_id: str) -> Optional[LivenessReducer]:
+        """Restore a session's reducer from its latest projection snapshot.
+
+        The overlay ledger is read backwards, so only the entries after the
+        newest snapshot are touched.
+        """
+        try:
+            for entry in self._overlay_ledger.iter_entries_reversed(
+                event_types=("PROJECTION_COMPUTED",), submission_id=session_id,
+            ):
+                if "reducer_snapshot" in entry.metadata:
+                    return LivenessReducer.restore(entry.metadata["reducer_snapshot"], session_id)
+        except Exception:
+            return None
+        return None
+
     def _create_wo(
         self,
         wo_type: str,
@@ -501,7 +761,8 @@ class HO2Supervisor:
         acceptance_criteria: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Create a WorkOrder dict using SessionManager for ID generation."""
-        wo_id = self._session_mgr.next_wo_id()
+        with self._wo_id_lock:
+            wo_id = self._session_mgr.next_wo_id()
         session_id = self._session_mgr.session_id
         return {
             "wo_id": wo_id,
@@ -530,6 +791,20 @@ class HO2Supervisor:
         result = self._ho1.execute(wo)
         return result
 
+    async def _dispatch_wo_async(self, wo: Dict[str, Any]) -> Dict[str, Any]:
+        """Dispatch WO to HO1 without blocking the event loop."""
+        wo["state"] = "dispatched"
+        self._log_wo_event("WO_DISPATCHED", wo)
+        execute_async = getattr(self._ho1, "execute_async", None)
+        if asyncio.iscoroutinefunction(execute_async):
+            return await execute_async(wo)
+        return await asyncio.get_running_loop().run_in_executor(None, self._ho1.execute, wo)
+
+    async def _drain_ledger(self) -> None:
+        drain = getattr(self._ledger, "drain", None)
+        if asyncio.iscoroutinefunction(drain):
+            await drain()
+
     def _accumulate_cost(self, target: Dict[str, int], source: Dict[str, Any]) -> None:
         for key in ("input_tokens", "output_tokens", "total_tokens", "llm_calls", "tool_calls", "elapsed_ms"):
             target[key] = target.get(key, 0) + int(source.get(key, 0))
@@ -547,8 +822,7 @@ class HO2Supervisor:
     def _compute_trace_hash(self, wo_ids: List[str], session_id: str) -> str:
         """SHA256 of concatenated HO1m entries for this WO chain."""
         ho1m_path = self._config.ho1m_path
-        provider = ContextProvider(self._plane_root)
-        entries = provider.read_ledger_entries(
+        entries = self._context_provider.read_ledger_entries(
             ledger_path=ho1m_path,
             filters={"session_id": session_id},
         )
@@ -783,64 +1057,128 @@ class HO2Supervisor:
         Called AFTER the user response is delivered. Out-of-band.
         Single-shot per signal_id. Idempotent within the gate window.
 
+        With consolidation_workers > 0 the signals are queued on the
+        background pool (deduplicated within the gate window) and this
+        returns [] immediately; see consolidation_metrics().
+
         Returns list of completed consolidation WO dicts.
         """
         if not signal_ids or not self._ho3_memory or not self._config.ho3_enabled:
             return []
 
+        if self._consolidation_queue is not None:
+            # Background mode: the worker pool dispatches the WOs
+            if self._consolidation_queue.closed:
+                self._consolidation_queue = self._new_consolidation_queue()
+            self._consolidation_queue.submit(signal_ids)
+            return []
+
         completed = []
-        session_id = self._session_mgr.session_id
 
-        for sig_id in signal_ids:
-            # Re-check gate (idempotency)
-            gate = self._ho3_memory.check_gate(sig_id)
-            if not gate.crossed:
-                continue
+        # Re-check every gate in one pass (idempotency)
+        signal_ids = list(dict.fromkeys(signal_ids))
+        for sig_id, gate in zip(signal_ids, self._ho3_check_gates(signal_ids)):
+            result = self._consolidate_signal(sig_id, gate)
+            if result is not None and result.get("state") == "completed":
+                completed.append(result)
+
+        return completed
+
+    def consolidation_metrics(self) -> Optional[Dict[str, Any]]:
+        """Queue depth/latency metrics of the background consolidation pool.
+
+        None when consolidation runs inline (consolidation_workers == 0).
+        """
+        if self._consolidation_queue is None:
+            return None
+        return self._consolidation_queue.metrics()
+
+    def _new_consolidation_queue(self) -> ConsolidationQueue:
+        return ConsolidationQueue(
+            self._consolidation_job,
+            max_workers=self._config.consolidation_workers,
+            pool_budget=self._config.consolidation_pool_budget,
+            wo_budget=self._config.consolidation_budget,
+            dedupe_window_sec=self._config.ho3_gate_window_hours * 3600.0,
+            name=f"{self._agent_class}.ho2.consolidation",
+        )
+
+    def _consolidation_job(self, sig_id: str) -> Optional[Dict[str, Any]]:
+        """One background consolidation: gate re-check, then the WO."""
+        return self._consolidate_signal(sig_id, self._ho3_check_gates([sig_id])[0])
 
-            # Read signal accumulator
+    def _consolidate_signal(self, sig_id: str, gate: Any) -> Optional[Dict[str, Any]]:
+        """Dispatch the consolidate WO for a checked gate; None if it stays closed."""
+        if not gate.crossed:
+            return None
+
+        # Signal accumulator the gate was evaluated on
+        acc = gate.accumulator if self._ho3_supports("check_gates") else None
+        if acc is None:
             accumulators = self._ho3_memory.read_signals(signal_id=sig_id)
             if not accumulators:
-                continue
+                return None
             acc = accumulators[0]
 
-            # Create consolidation WO
-            consolidation_wo = self._create_wo(
-                wo_type="consolidate",
-                input_context={
-                    "signal_id": sig_id,
-                    "count": acc.count,
-                    "session_count": len(acc.session_ids),
-                    "recent_events": json.dumps(acc.event_ids[-10:]),
-                },
-                constraints={
-                    "prompt_contract_id": self._config.consolidation_contract_id,
-                    "token_budget": self._config.consolidation_budget,
-                    "followup_min_remaining": self._config.followup_min_remaining,
-                    "budget_mode": self._config.budget_mode,
-                    "turn_limit": 1,
-                    "domain_tags": ["consolidation"],
+        # Create consolidation WO
+        consolidation_wo = self._create_wo(
+            wo_type="consolidate",
+            input_context={
+                "signal_id": sig_id,
+                "count": acc.count,
+                "session_count": len(acc.session_ids),
+                "recent_events": json.dumps(acc.event_ids[-10:]),
+            },
+            constraints={
+                "prompt_contract_id": self._config.consolidation_contract_id,
+                "token_budget": self._config.consolidation_budget,
+                "followup_min_remaining": self._config.followup_min_remaining,
+                "budget_mode": self._config.budget_mode,
+                "turn_limit": 1,
+                "domain_tags": ["consolidation"],
+            },
+        )
+        self._log_wo_event("WO_PLANNED", consolidation_wo)
+        result = self._dispatch_wo(consolidation_wo)
+
+        # On success: write overlay with source_event_ids
+        if result.get("state") == "completed":
+            output = result.get("output_result", {}) or {}
+            now_iso = datetime.now(timezone.utc).isoformat()
+            overlay = {
+                "signal_id": sig_id,
+                "salience_weight": output.get("salience_weight", 0.5),
+                "decay_modifier": output.get("decay_modifier", 0.95),
+                "source_event_ids": acc.event_ids,
+                "content": {
+                    "bias": output.get("bias", ""),
+                    "category": output.get("category", ""),
                 },
-            )
-            self._log_wo_event("WO_PLANNED", consolidation_wo)
-            result = self._dispatch_wo(consolidation_wo)
-
-            # On success: write overlay with source_event_ids
-            if result.get("state") == "completed":
-                output = result.get("output_result", {}) or {}
-                now_iso = datetime.now(timezone.utc).isoformat()
-                overlay = {
-                    "signal_id": sig_id,
-                    "salience_weight": output.get("salience_weight", 0.5),
-                    "decay_modifier": output.get("decay_modifier", 0.95),
-                    "source_event_ids": acc.event_ids,
-                    "content": {
-                        "bias": output.get("bias", ""),
-                        "category": output.get("category", ""),
-                    },
-                    "window_start": acc.last_seen if acc.event_ids else now_iso,
-                    "window_end": now_iso,
-                }
-                self._ho3_memory.log_overlay(overlay)
-                completed.append(result)
+                "window_start": acc.last_seen if acc.event_ids else now_iso,
+                "window_end": now_iso,
+            }
+            self._ho3_memory.log_overlay(overlay)
 
-        return completed
+        return result
+
+    def _ho3_supports(self, name: str) -> bool:
+        """True if the HO3 memory implements the (batched) method `name`."""
+        return inspect.ismethod(getattr(self._ho3_memory, name, None))
+
+    def _ho3_log_signals(self, batch: List[Tuple[str, str, str]]) -> None:
+        """Log (signal_id, session_id, event_id) items in one HO3 append."""
+        if not batch:
+            return
+        if self._ho3_supports("log_signals"):
+            self._ho3_memory.log_signals(batch)
+            return
+        for sig_id, session_id, evt_id in batch:
+            self._ho3_memory.log_signal(sig_id, session_id, evt_id)
+
+    def _ho3_check_gates(self, signal_ids: List[str]) -> List[Any]:
+        """Gate results for signal_ids, in order, from one HO3 evaluation pass."""
+        if not signal_ids:
+            return []
+        if self._ho3_supports("check_gates"):
+            return self._ho3_memory.check_gates(signal_ids)
+        return [self._ho3_memory.check_gate(sig_id) for sig_id in signal_ids]
@@ -1,7 +1,13 @@
-"""Pure liveness reducer for Context Authority snapshots."""
+"""Pure liveness reducer for Context Authority snapshots.
+
+reduce_liveness() folds a full event history. LivenessReducer folds the
+same events incrementally for one session and can be snapshotted into the
+PROJECTION_COMPUTED overlay and restored from it.
+"""
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
@@ -75,6 +81,77 @@ def _event_sort_key(entry: Dict[str, Any], idx: int):
     return (_entry_timestamp(entry), _entry_id(entry, idx), idx)
 
 
+_INTENT_EVENTS = ("INTENT_DECLARED", "INTENT_SUPERSEDED", "INTENT_CLOSED")
+_WO_EVENTS = ("WO_PLANNED", "WO_DISPATCHED", "WO_COMPLETED", "ESCALATION")
+_RETIRED_INTENT_STATUSES = ("SUPERSEDED", "CLOSED")
+
+
+def _new_intent_summary() -> Dict[str, Any]:
+    return {
+        "status": "UNKNOWN",
+        "scope": "session",
+        "objective": "",
+        "declared_at": None,
+        "closed_at": None,
+    }
+
+
+def _apply_intent_event(summary: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    et = entry.get("event_type")
+    meta = _metadata(entry)
+    ts = _entry_timestamp(entry)
+    if et == "INTENT_DECLARED":
+        summary["status"] = "LIVE"
+        summary["declared_at"] = summary["declared_at"] or ts
+        summary["scope"] = meta.get("scope", summary["scope"])
+        summary["objective"] = meta.get("objective", summary["objective"])
+    elif et == "INTENT_SUPERSEDED":
+        summary["status"] = "SUPERSEDED"
+        summary["closed_at"] = ts
+    elif et == "INTENT_CLOSED":
+        summary["status"] = "CLOSED"
+        summary["closed_at"] = ts
+
+
+def _new_wo_summary() -> Dict[str, Any]:
+    return {
+        "status": "UNKNOWN",
+        "intent_id": None,
+        "wo_type": "",
+        "planned_at": None,
+        "completed_at": None,
+    }
+
+
+def _apply_wo_event(summary: Dict[str, Any], entry: Dict[str, Any], wo_id: str) -> Optional[Dict[str, Any]]:
+    """Fold one work-order event; returns the escalation record, if any."""
+    et = entry.get("event_type")
+    meta = _metadata(entry)
+    ts = _entry_timestamp(entry)
+    if et == "WO_PLANNED":
+        summary["status"] = "OPEN"
+        summary["planned_at"] = summary["planned_at"] or ts
+        summary["wo_type"] = meta.get("wo_type", summary["wo_type"])
+        summary["intent_id"] = meta.get("intent_id", summary["intent_id"])
+    elif et == "WO_DISPATCHED":
+        summary["status"] = "DISPATCHED"
+        summary["planned_at"] = summary["planned_at"] or ts
+        summary["wo_type"] = meta.get("wo_type", summary["wo_type"])
+        summary["intent_id"] = meta.get("intent_id", summary["intent_id"])
+    elif et == "WO_COMPLETED":
+        summary["status"] = "COMPLETED"
+        summary["completed_at"] = ts
+    elif et == "ESCALATION":
+        summary["status"] = "FAILED"
+        summary["completed_at"] = ts
+        return {
+            "wo_id": wo_id,
+            "reason": entry.get("reason", ""),
+            "timestamp": ts,
+        }
+    return None
+
+
 def reduce_liveness(
     ho2m_entries: List[Dict[str, Any]],
     ho1m_entries: List[Dict[str, Any]],
@@ -91,7 +168,7 @@ def reduce_liveness(
     intent_events: Dict[str, List[Dict[str, Any]]] = {}
     for idx, entry in enumerate(all_entries):
         et = entry.get("event_type")
-        if et not in ("INTENT_DECLARED", "INTENT_SUPERSEDED", "INTENT_CLOSED"):
+        if et not in _INTENT_EVENTS:
             continue
         intent_id = _intent_id(entry)
         if not intent_id:
@@ -100,29 +177,9 @@ def reduce_liveness(
 
     for intent_id, events in intent_events.items():
         events.sort(key=lambda e: _event_sort_key(e["entry"], e["idx"]))
-        summary = {
-            "status": "UNKNOWN",
-            "scope": "session",
-            "objective": "",
-            "declared_at": None,
-            "closed_at": None,
-        }
+        summary = _new_intent_summary()
         for ev in events:
-            entry = ev["entry"]
-            et = entry.get("event_type")
-            meta = _metadata(entry)
-            ts = _entry_timestamp(entry)
-            if et == "INTENT_DECLARED":
-                summary["status"] = "LIVE"
-                summary["declared_at"] = summary["declared_at"] or ts
-                summary["scope"] = meta.get("scope", summary["scope"])
-                summary["objective"] = meta.get("objective", summary["objective"])
-            elif et == "INTENT_SUPERSEDED":
-                summary["status"] = "SUPERSEDED"
-                summary["closed_at"] = ts
-            elif et == "INTENT_CLOSED":
-                summary["status"] = "CLOSED"
-                summary["closed_at"] = ts
+            _apply_intent_event(summary, ev["entry"])
         state.intents[intent_id] = summary
 
     state.active_intents = sorted(
@@ -133,7 +190,7 @@ def reduce_liveness(
     wo_events: Dict[str, List[Dict[str, Any]]] = {}
     for idx, entry in enumerate(all_entries):
         et = entry.get("event_type")
-        if et not in ("WO_PLANNED", "WO_DISPATCHED", "WO_COMPLETED", "ESCALATION"):
+        if et not in _WO_EVENTS:
             continue
         wo_id = _work_order_id(entry)
         if not wo_id:
@@ -142,39 +199,11 @@ def reduce_liveness(
 
     for wo_id, events in wo_events.items():
         events.sort(key=lambda e: _event_sort_key(e["entry"], e["idx"]))
-        summary = {
-            "status": "UNKNOWN",
-            "intent_id": None,
-            "wo_type": "",
-            "planned_at": None,
-            "completed_at": None,
-        }
+        summary = _new_wo_summary()
         for ev in events:
-            entry = ev["entry"]
-            et = entry.get("event_type")
-            meta = _metadata(entry)
-            ts = _entry_timestamp(entry)
-            if et == "WO_PLANNED":
-                summary["status"] = "OPEN"
-                summary["planned_at"] = summary["planned_at"] or ts
-                summary["wo_type"] = meta.get("wo_type", summary["wo_type"])
-                summary["intent_id"] = meta.get("intent_id", summary["intent_id"])
-            elif et == "WO_DISPATCHED":
-                summary["status"] = "DISPATCHED"
-                summary["planned_at"] = summary["planned_at"] or ts
-                summary["wo_type"] = meta.get("wo_type", summary["wo_type"])
-                summary["intent_id"] = meta.get("intent_id", summary["intent_id"])
-            elif et == "WO_COMPLETED":
-                summary["status"] = "COMPLETED"
-                summary["completed_at"] = ts
-            elif et == "ESCALATION":
-                summary["status"] = "FAILED"
-                summary["completed_at"] = ts
-                state.escalations.append({
-                    "wo_id": wo_id,
-                    "reason": entry.get("reason", ""),
-                    "timestamp": ts,
-                })
+            escalation = _apply_wo_event(summary, ev["entry"], wo_id)
+            if escalation:
+                state.escalations.append(escalation)
         state.work_orders[wo_id] = summary
         if summary["status"] in ("OPEN", "DISPATCHED"):
             state.open_work_orders.append(wo_id)
@@ -190,3 +219,143 @@ def reduce_liveness(
     state.escalations.sort(key=lambda x: (x.get("timestamp", ""), x.get("wo_id", "")))
     return state
 
+
+
+class LivenessReducer:
+    """Incremental latest-event-wins reducer for one session.
+
+    Each fold() applies only newly read events, batch-sorted like
+    reduce_liveness, on top of per-intent / per-work-order summaries, and
+    returns the same LivenessState a full reduction would. An event that
+    sorts before one already folded for the same id cannot be applied
+    incrementally; the reducer then sets needs_rebuild and the caller
+    re-folds from genesis.
+
+    cursors holds the caller's read position per source ledger
+    ({source: {file: byte_offset}}) so snapshot() captures everything a
+    restarted supervisor needs to resume. Snapshots leave out retired
+    intents and completed work orders: a restored reducer reports the same
+    active intents, open work orders, failures and escalations, but its
+    intents / work_orders maps hold only those.
+    """
+
+    SNAPSHOT_VERSION = 1
+
+    def __init__(self, session_id: Optional[str] = None):
+        self.session_id = session_id
+        self.cursors: Dict[str, Dict[str, int]] = {}
+        self.needs_rebuild = False
+        # intent_id -> {"summary", "last_key"}
+        self._intents: Dict[str, Dict[str, Any]] = {}
+        # wo_id -> {"summary", "last_key", "escalations", "last_reason"}
+        self._work_orders: Dict[str, Dict[str, Any]] = {}
+
+    def fold(
+        self,
+        ho2m_entries: List[Dict[str, Any]],
+        ho1m_entries: List[Dict[str, Any]],
+    ) -> LivenessState:
+        """Fold newly appended entries and return the current state."""
+        new = list(ho2m_entries or []) + list(ho1m_entries or [])
+        if self.session_id:
+            new = [e for e in new if _session_id(e) == self.session_id]
+        order = sorted(range(len(new)), key=lambda i: _event_sort_key(new[i], i))
+        for idx in order:
+            self._apply(new[idx])
+        return self.state()
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        et = entry.get("event_type")
+        eid = entry.get("id")
+        key = [_entry_timestamp(entry), eid if isinstance(eid, str) else ""]
+        if et in _INTENT_EVENTS:
+            intent_id = _intent_id(entry)
+            if not intent_id:
+                return
+            slot = self._intents.setdefault(intent_id, {"summary": _new_intent_summary(), "last_key": key})
+            if key < slot["last_key"]:
+                self.needs_rebuild = True
+                return
+            _apply_intent_event(slot["summary"], entry)
+            slot["last_key"] = key
+        elif et in _WO_EVENTS:
+            wo_id = _work_order_id(entry)
+            if not wo_id:
+                return
+            slot = self._work_orders.setdefault(wo_id, {
+                "summary": _new_wo_summary(),
+                "last_key": key,
+                "escalations": [],
+                "last_reason": "",
+            })
+            if key < slot["last_key"]:
+                self.needs_rebuild = True
+                return
+            escalation = _apply_wo_event(slot["summary"], entry, wo_id)
+            if escalation:
+                slot["escalations"].append(escalation)
+            slot["last_reason"] = entry.get("reason", "")
+            slot["last_key"] = key
+
+    def state(self) -> LivenessState:
+        """Materialize the folded summaries as a LivenessState."""
+        state = LivenessState()
+        for intent_id, slot in self._intents.items():
+            state.intents[intent_id] = dict(slot["summary"])
+        state.active_intents = sorted(
+            [intent_id for intent_id, info in state.intents.items() if info.get("status") == "LIVE"]
+        )
+        for wo_id, slot in self._work_orders.items():
+            summary = dict(slot["summary"])
+            state.work_orders[wo_id] = summary
+            state.escalations.extend(dict(e) for e in slot["escalations"])
+            if summary["status"] in ("OPEN", "DISPATCHED"):
+                state.open_work_orders.append(wo_id)
+            if summary["status"] == "FAILED":
+                state.failed_items.append({
+                    "wo_id": wo_id,
+                    "reason": slot["last_reason"],
+                    "timestamp": summary["completed_at"],
+                })
+        state.open_work_orders = sorted(set(state.open_work_orders))
+        state.failed_items.sort(key=lambda x: (x.get("timestamp", ""), x.get("wo_id", "")))
+        state.escalations.sort(key=lambda x: (x.get("timestamp", ""), x.get("wo_id", "")))
+        return state
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable reducer state, including read cursors.
+
+        Only the slots state() still reports on are kept, so the snapshot
+        tracks the session's live work rather than its whole history.
+        """
+        return {
+            "version": self.SNAPSHOT_VERSION,
+            "session_id": self.session_id,
+            "cursors": {source: dict(files) for source, files in self.cursors.items()},
+            "intents": {
+                intent_id: copy.deepcopy(slot)
+                for intent_id, slot in self._intents.items()
+                if slot["summary"]["status"] not in _RETIRED_INTENT_STATUSES
+            },
+            "work_orders": {
+                wo_id: copy.deepcopy(slot)
+                for wo_id, slot in self._work_orders.items()
+                if slot["summary"]["status"] != "COMPLETED" or slot["escalations"]
+            },
+        }
+
+    @classmethod
+    def restore(cls, snapshot: Any, session_id: Optional[str] = None) -> Optional["LivenessReducer"]:
+        """Rebuild a reducer from snapshot(); None if it is unusable."""
+        if not isinstance(snapshot, dict) or snapshot.get("version") != cls.SNAPSHOT_VERSION:
+            return None
+        if session_id is not None and snapshot.get("session_id") != session_id:
+            return None
+        cursors, intents, work_orders = snapshot.get("cursors"), snapshot.get("intents"), snapshot.get("work_orders")
+        if not all(isinstance(part, dict) for part in (cursors, intents, work_orders)):
+            return None
+        reducer = cls(snapshot.get("session_id"))
+        reducer.cursors = {source: dict(files) for source, files in cursors.items()}
+        reducer._intents = intents
+        reducer._work_orders = work_orders
+        return reducer
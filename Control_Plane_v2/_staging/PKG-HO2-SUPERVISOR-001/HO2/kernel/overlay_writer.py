@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from kernel.ledger_client import LedgerClient, LedgerEntry
 
@@ -16,8 +16,13 @@ def write_projection(
     turn_id: str,
     token_budget: int,
     overlay_ledger: LedgerClient,
+    snapshot: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
-    """Write a PROJECTION_COMPUTED snapshot to the overlay ledger."""
+    """Write a PROJECTION_COMPUTED snapshot to the overlay ledger.
+
+    snapshot, when given, is the LivenessReducer state a restarted
+    supervisor resumes from.
+    """
     active_intents = [
         {
             "intent_id": intent_id,
@@ -48,6 +53,8 @@ def write_projection(
         "failed_count": len(liveness.failed_items),
         "computed_at": datetime.now(timezone.utc).isoformat(),
     }
+    if snapshot is not None:
+        metadata["reducer_snapshot"] = snapshot
 
     overlay_ledger.write(
         LedgerEntry(
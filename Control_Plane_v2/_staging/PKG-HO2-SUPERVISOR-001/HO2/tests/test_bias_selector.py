@@ -1,13 +1,16 @@
 """Tests for HO2 bias selection policy (HANDOFF-29.1C)."""
 
 from copy import deepcopy
+import json
 from pathlib import Path
+import random
 import sys
 
 _staging = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(_staging / "PKG-HO2-SUPERVISOR-001" / "HO2" / "kernel"))
 
-from bias_selector import select_biases
+import bias_selector
+from bias_selector import BiasIndex, select_biases
 
 
 def _artifact(
@@ -37,6 +40,71 @@ def _artifact(
     }
 
 
+def _legacy_select_biases(artifacts, turn_labels, ho3_bias_budget, as_of_ts):
+    """The pre-index implementation: score everything, full sort, greedy fill."""
+    turn_domain = bias_selector._normalize_set(turn_labels.get("domain"))
+    turn_task = bias_selector._normalize_set(turn_labels.get("task"))
+    has_turn_labels = bool(turn_domain or turn_task)
+    as_of = bias_selector._parse_iso(as_of_ts)
+    eligible = []
+    for artifact in artifacts:
+        if artifact.get("enabled", True) is False:
+            continue
+        expires = bias_selector._parse_iso(artifact.get("expires_at_event_ts"))
+        if as_of is not None and expires is not None and as_of >= expires:
+            continue
+        scope = str(artifact.get("scope", "session"))
+        labels = artifact.get("labels", {})
+        domain_labels = bias_selector._normalize_set(labels.get("domain")) if isinstance(labels, dict) else set()
+        task_labels = bias_selector._normalize_set(labels.get("task")) if isinstance(labels, dict) else set()
+        if not has_turn_labels:
+            if scope != "global" and "labels" in artifact:
+                continue
+        elif scope != "global" and not ((domain_labels & turn_domain) or (task_labels & turn_task)):
+            continue
+        line = bias_selector._context_line(artifact)
+        if not line:
+            continue
+        weight = float(artifact.get("weight", artifact.get("salience_weight", 0.5)) or 0.0)
+        decay = float(artifact.get("decay_modifier", 1.0) or 0.0)
+        candidate = dict(artifact)
+        candidate["context_line"] = line
+        candidate["_score"] = weight * decay * bias_selector._recency_score(artifact, as_of_ts)
+        candidate["_token_estimate"] = bias_selector._token_estimate(line)
+        eligible.append(candidate)
+    eligible.sort(key=lambda a: (a["_score"], a.get("artifact_id", "")), reverse=True)
+    selected, budget_used = [], 0
+    for artifact in eligible:
+        cost = int(artifact["_token_estimate"])
+        if budget_used + cost > max(0, int(ho3_bias_budget)):
+            continue
+        selected.append({k: v for k, v in artifact.items() if not k.startswith("_")})
+        budget_used += cost
+    return selected
+
+
+def _random_artifacts(rng, n):
+    domains, tasks = ["system", "docs", "config", "net"], ["inspect", "modify", "plan"]
+    artifacts = []
+    for i in range(n):
+        artifact = _artifact(
+            f"a{rng.randrange(n // 2 + 1):04d}",  # duplicate ids exercise tie-breaks
+            scope=rng.choice(["global", "session", "session"]),
+            domain=rng.sample(domains, rng.randrange(3)),
+            task=rng.sample(tasks, rng.randrange(2)),
+            weight=rng.choice([0.3, 0.5, 0.5, 0.9]),
+            decay_modifier=rng.choice([1.0, 0.95]),
+            context_line=rng.choice(["", "short", "x" * rng.randrange(10, 120)]),
+            enabled=rng.random() > 0.1,
+            expires_at_event_ts=rng.choice([None, "2026-02-19T00:00:00+00:00", "2026-03-01T00:00:00+00:00"]),
+            consolidation_event_ts=f"2026-02-{rng.randrange(1, 20):02d}T00:00:00+00:00",
+        )
+        if rng.random() < 0.1:
+            del artifact["labels"]
+        artifacts.append(artifact)
+    return artifacts
+
+
 class TestBiasSelector:
     def test_filter_disabled(self):
         artifacts = [
@@ -140,3 +208,32 @@ class TestBiasSelector:
         }
         selected = select_biases([legacy], {}, 2000, "2026-02-20T00:00:00+00:00")
         assert [a["artifact_id"] for a in selected] == ["legacy"]
+
+    def test_matches_legacy_selection_byte_for_byte(self):
+        rng = random.Random(29)
+        for _ in range(50):
+            artifacts = _random_artifacts(rng, rng.randrange(1, 80))
+            turn_labels = rng.choice([{}, {"domain": "system"}, {"task": ["inspect", "plan"]},
+                                      {"domain": ["docs", "net"], "task": "modify"}])
+            budget = rng.choice([0, 15, 60, 2000])
+            expected = _legacy_select_biases(deepcopy(artifacts), turn_labels, budget, "2026-02-20T00:00:00+00:00")
+            actual = select_biases(artifacts, turn_labels, budget, "2026-02-20T00:00:00+00:00")
+            assert json.dumps(actual) == json.dumps(expected)
+
+    def test_index_reused_for_equal_artifact_set(self):
+        artifacts = [_artifact("g", scope="global"), _artifact("s", domain=["system"])]
+        index = BiasIndex(artifacts)
+        assert index.matches(deepcopy(artifacts))
+        assert not index.matches(artifacts[:1])
+        for labels, expected in (({"domain": "system"}, ["s", "g"]), ({}, ["g"])):
+            selected = select_biases(deepcopy(artifacts), labels, 2000, "2026-02-20T00:00:00+00:00", index=index)
+            assert [a["artifact_id"] for a in selected] == expected
+
+    def test_unmatched_artifacts_are_not_scored(self):
+        """Label pruning happens before scoring: a bad weight outside the turn's labels is never read."""
+        artifacts = [
+            _artifact("ok", domain=["system"]),
+            dict(_artifact("other", domain=["docs"]), weight="not-a-number"),
+        ]
+        selected = select_biases(artifacts, {"domain": "system"}, 2000, "2026-02-20T00:00:00+00:00")
+        assert [a["artifact_id"] for a in selected] == ["ok"]
@@ -0,0 +1,131 @@
+"""Tests for the background consolidation queue."""
+
+from pathlib import Path
+import sys
+import threading
+import time
+
+_staging = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(_staging / "PKG-HO2-SUPERVISOR-001" / "HO2" / "kernel"))
+
+from consolidation_worker import ConsolidationQueue
+
+
+class _Jobs:
+    """run_job stand-in: records calls, optionally blocks until released."""
+
+    def __init__(self, tokens=100, state="completed", block=False):
+        self.calls = []
+        self.tokens = tokens
+        self.state = state
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+        self.running = threading.Semaphore(0)
+        self._lock = threading.Lock()
+
+    def __call__(self, sig_id):
+        with self._lock:
+            self.calls.append(sig_id)
+        self.running.release()
+        self.release.wait(5)
+        if self.state is None:
+            return None
+        if self.state == "raise":
+            raise RuntimeError("boom")
+        return {"wo_id": f"WO-{sig_id}", "state": self.state, "cost": {"total_tokens": self.tokens}}
+
+
+class TestConsolidationQueue:
+    def test_runs_jobs_concurrently(self):
+        jobs = _Jobs(block=True)
+        queue = ConsolidationQueue(jobs, max_workers=3)
+        assert queue.submit(["a", "b", "c"]) == ["a", "b", "c"]
+        for _ in range(3):
+            assert jobs.running.acquire(timeout=5)  # all three started before any finished
+        assert queue.metrics()["in_flight"] == 3
+        jobs.release.set()
+        assert queue.join(timeout=5)
+        metrics = queue.metrics()
+        assert metrics["completed"] == 3
+        assert metrics["tokens_used"] == 300
+        assert [r["wo_id"] for r in sorted(queue.results, key=lambda r: r["wo_id"])] == ["WO-a", "WO-b", "WO-c"]
+        queue.close()
+
+    def test_dedupes_within_window(self):
+        jobs = _Jobs(block=True)
+        queue = ConsolidationQueue(jobs, max_workers=1, dedupe_window_sec=3600)
+        assert queue.submit(["a", "b", "a"]) == ["a", "b"]
+        assert queue.metrics()["queue_depth"] == 1  # "a" running, "b" queued
+        jobs.release.set()
+        assert queue.join(timeout=5)
+        assert queue.submit(["a", "c"]) == ["c"]
+        assert queue.join(timeout=5)
+        assert jobs.calls == ["a", "b", "c"]
+        assert queue.metrics()["deduplicated"] == 2
+        queue.close()
+
+    def test_failed_job_can_be_resubmitted(self):
+        jobs = _Jobs(state="raise")
+        queue = ConsolidationQueue(jobs, max_workers=1, dedupe_window_sec=3600)
+        queue.submit(["a"])
+        assert queue.join(timeout=5)
+        assert queue.metrics()["failed"] == 1
+        jobs.state = None  # gate closed on retry
+        assert queue.submit(["a"]) == ["a"]
+        assert queue.join(timeout=5)
+        assert queue.metrics()["skipped"] == 1
+        queue.close()
+
+    def test_token_pool_limits_jobs(self):
+        jobs = _Jobs(tokens=300, block=True)
+        queue = ConsolidationQueue(jobs, max_workers=4, pool_budget=1000, wo_budget=400)
+        queue.submit(["a", "b", "c", "d"])
+        for _ in range(2):
+            assert jobs.running.acquire(timeout=5)
+        metrics = queue.metrics()
+        assert metrics["in_flight"] == 2  # a third 400-token reservation would exceed 1000
+        assert metrics["queue_depth"] == 2
+        jobs.release.set()
+        assert queue.join(timeout=5)
+        metrics = queue.metrics()
+        # 600 used after a and b: c fits (1000), then d cannot reserve and is dropped
+        assert metrics["completed"] == 3
+        assert metrics["budget_exhausted"] == 1
+        assert metrics["tokens_used"] == 900
+        assert metrics["budget_remaining"] == 100
+        assert "d" not in queue._accepted_at  # dropped unrun, so not deduplicated
+        queue.close()
+
+    def test_stale_accept_stamps_pruned(self):
+        jobs = _Jobs()
+        queue = ConsolidationQueue(jobs, max_workers=1, dedupe_window_sec=0.01)
+        queue.submit(["a", "b"])
+        assert queue.join(timeout=5)
+        time.sleep(0.02)
+        assert queue.submit(["c"]) == ["c"]
+        assert queue.join(timeout=5)
+        assert set(queue._accepted_at) == {"c"}
+        queue.close()
+
+    def test_latency_metrics(self):
+        jobs = _Jobs()
+        queue = ConsolidationQueue(jobs, max_workers=1)
+        queue.submit(["a", "b"])
+        assert queue.join(timeout=5)
+        metrics = queue.metrics()
+        assert metrics["queue_depth"] == 0
+        assert metrics["oldest_wait_ms"] == 0.0
+        assert metrics["queue_wait_ms_max"] >= metrics["queue_wait_ms_avg"] >= 0.0
+        assert metrics["run_ms_max"] >= metrics["run_ms_avg"] >= 0.0
+        assert metrics["budget_remaining"] is None
+        queue.close()
+
+    def test_submit_after_close_is_noop(self):
+        jobs = _Jobs()
+        queue = ConsolidationQueue(jobs, max_workers=1)
+        queue.close()
+        queue.close()
+        assert queue.closed
+        assert queue.submit(["a"]) == []
+        assert jobs.calls == []
@@ -9,6 +9,7 @@ All tests use tmp_path. HO1Executor is mocked. No real LLM calls.
 import hashlib
 import json
 import sys
+import time
 import uuid
 from dataclasses import dataclass
 from pathlib import Path
@@ -314,6 +315,83 @@ class TestAttention:
         assert "assembled_context" in result
 
 
+# ===========================================================================
+# Context Provider Cache Tests (3)
+# ===========================================================================
+
+class TestContextProviderCache:
+    def _write(self, path, entries, mode="w"):
+        with open(path, mode) as f:
+            for e in entries:
+                f.write(json.dumps(e) + "\n")
+
+    def _entries(self, n, start=0):
+        out = []
+        for i in range(start, start + n):
+            sid = f"SES-{i % 3}"
+            meta = {"provenance": {"session_id": sid}} if i % 2 else {}
+            entry = {"event_type": "EVEN" if i % 2 == 0 else "ODD", "seq": i, "metadata": meta}
+            if i % 2 == 0:
+                entry["session_id"] = sid
+            out.append(entry)
+        return out
+
+    def _brute(self, ledger_dir, **kwargs):
+        entries = []
+        for f in sorted(ledger_dir.glob("*.jsonl")):
+            entries.extend(json.loads(l) for l in f.read_text().splitlines() if l.strip())
+        et = kwargs.get("event_type")
+        sid = kwargs.get("session_id")
+        return [
+            e for e in entries
+            if (not et or e["event_type"] == et)
+            and (sid is None or e.get("session_id") == sid
+                 or e["metadata"].get("provenance", {}).get("session_id") == sid)
+        ]
+
+    def test_indexed_filters_match_full_parse(self, tmp_path):
+        ledger_dir = tmp_path / "ledger"
+        ledger_dir.mkdir()
+        self._write(ledger_dir / "a.jsonl", self._entries(20))
+        self._write(ledger_dir / "b.jsonl", self._entries(10, start=20))
+        provider = ContextProvider(tmp_path)
+        for et in (None, "ODD"):
+            for sid in (None, "SES-1", "SES-9"):
+                filters = {"session_id": sid} if sid else None
+                got = provider.read_ledger_entries(ledger_path=ledger_dir, event_type=et, filters=filters)
+                assert [e["seq"] for e in got] == [e["seq"] for e in self._brute(ledger_dir, event_type=et, session_id=sid)]
+
+    def test_repeated_reads_served_from_cache(self, tmp_path):
+        ledger_dir = tmp_path / "ledger"
+        ledger_dir.mkdir()
+        ledger_file = ledger_dir / "a.jsonl"
+        self._write(ledger_file, self._entries(10))
+        provider = ContextProvider(tmp_path)
+        provider.read_ledger_entries(ledger_path=ledger_dir)
+
+        with patch("attention.json.loads", side_effect=json.loads) as loads:
+            provider.read_ledger_entries(ledger_path=ledger_dir, filters={"session_id": "SES-1"})
+            assert loads.call_count == 0
+            self._write(ledger_file, self._entries(2, start=10), mode="a")
+            got = provider.read_ledger_entries(ledger_path=ledger_dir)
+            assert loads.call_count == 2
+        assert [e["seq"] for e in got] == list(range(12))
+
+    def test_rewritten_file_reparsed(self, tmp_path):
+        ledger_dir = tmp_path / "ledger"
+        ledger_dir.mkdir()
+        ledger_file = ledger_dir / "a.jsonl"
+        self._write(ledger_file, self._entries(10))
+        provider = ContextProvider(tmp_path)
+        provider.read_ledger_entries(ledger_path=ledger_dir)
+
+        self._write(ledger_file, self._entries(3, start=50))
+        assert [e["seq"] for e in provider.read_ledger_entries(ledger_path=ledger_dir)] == [50, 51, 52]
+        ledger_file.unlink()
+        assert provider.read_ledger_entries(ledger_path=ledger_dir) == []
+        assert provider._views == {}
+
+
 # ===========================================================================
 # Quality Gate Tests (7)
 # ===========================================================================
@@ -1470,7 +1548,7 @@ class TestIntentLifecycleIntegration:
 
 
 # ===========================================================================
-# Liveness + Projection Integration Tests (4) -- HANDOFF-31D
+# Liveness + Projection Integration Tests (6) -- HANDOFF-31D
 # ===========================================================================
 
 class TestLivenessProjectionIntegration:
@@ -1503,7 +1581,7 @@ class TestLivenessProjectionIntegration:
 
     def test_liveness_computed_each_turn(self, tmp_path):
         sv, _, _, _ = self._make_supervisor(tmp_path)
-        with patch("ho2_supervisor.reduce_liveness") as mock_reduce:
+        with patch("ho2_supervisor.LivenessReducer.fold") as mock_reduce:
             from liveness import LivenessState
             mock_reduce.return_value = LivenessState()
             sv.handle_turn("hello")
@@ -1536,7 +1614,7 @@ class TestLivenessProjectionIntegration:
         }
         (config.ho1m_path / "prev.jsonl").write_text(json.dumps(ho1_entry) + "\n")
 
-        with patch("ho2_supervisor.reduce_liveness") as mock_reduce:
+        with patch("ho2_supervisor.LivenessReducer.fold") as mock_reduce:
             from liveness import LivenessState
             mock_reduce.return_value = LivenessState()
             sv.handle_turn("hello")
@@ -1544,6 +1622,53 @@ class TestLivenessProjectionIntegration:
             ho1m_entries = kwargs["ho1m_entries"]
             assert any(e.get("event_type") == "WO_COMPLETED" for e in ho1m_entries)
 
+    def test_liveness_folds_only_new_entries(self, tmp_path):
+        sv, _, _, config = self._make_supervisor(tmp_path)
+        sid = sv.start_session()
+        ho1_entry = {
+            "event_type": "WO_DISPATCHED",
+            "submission_id": "WO-PREV-001",
+            "timestamp": "2026-02-20T00:00:00+00:00",
+            "metadata": {"provenance": {"session_id": sid, "work_order_id": "WO-PREV-001"}},
+        }
+        (config.ho1m_path / "prev.jsonl").write_text(json.dumps(ho1_entry) + "\n")
+        sv.handle_turn("hello")
+        assert "WO-PREV-001" in sv._current_liveness.open_work_orders
+
+        with patch("ho2_supervisor.LivenessReducer.fold", autospec=True,
+                   side_effect=lambda self, **kw: self.state()) as fold:
+            sv.handle_turn("again")
+        assert fold.call_args.kwargs["ho1m_entries"] == []
+
+        done = dict(ho1_entry, event_type="WO_COMPLETED", timestamp="2026-02-20T00:00:09+00:00")
+        with open(config.ho1m_path / "prev.jsonl", "a") as f:
+            f.write(json.dumps(done) + "\n")
+        sv.handle_turn("and again")
+        assert "WO-PREV-001" not in sv._current_liveness.open_work_orders
+        assert sv._current_liveness.work_orders["WO-PREV-001"]["status"] == "COMPLETED"
+
+    def test_restart_resumes_from_projection_snapshot(self, tmp_path):
+        sv, _, ledger, config = self._make_supervisor(tmp_path)
+        sid = sv.start_session()
+        sv.handle_turn("hello")
+        sv.handle_turn("again")
+        snapshot_state = sv._current_liveness
+
+        restarted = HO2Supervisor(
+            plane_root=tmp_path,
+            agent_class="ADMIN",
+            ho1_executor=MockHO1Executor(responses={}),
+            ledger_client=ledger,
+            token_budgeter=MockTokenBudgeter(),
+            config=config,
+        )
+        with patch.object(restarted._overlay_ledger, "iter_entries") as forward:
+            reducer = restarted._restore_liveness_reducer(sid)
+        forward.assert_not_called()
+        assert reducer is not None
+        assert reducer.cursors == sv._liveness_reducers[sid].cursors
+        assert reducer.state() == snapshot_state
+
 
 # ===========================================================================
 # Context Projector Integration Tests (6) -- HANDOFF-31E-1
@@ -1695,7 +1820,7 @@ class TestContextProjectorIntegration:
                 },
             }
 
-        with patch("ho2_supervisor.reduce_liveness", side_effect=_reduce):
+        with patch("ho2_supervisor.LivenessReducer.fold", side_effect=_reduce):
             sv._projector.project = MagicMock(side_effect=_project)
             sv.handle_turn("hello")
 
@@ -1711,3 +1836,355 @@ class TestContextProjectorIntegration:
         assert set(synth["input_context"]["assembled_context"].keys()) == {
             "context_text", "context_hash", "fragment_count", "tokens_used"
         }
+
+
+# ===========================================================================
+# Turn Prefetch Tests (4)
+# ===========================================================================
+
+class _GatedClassifyHO1(MockHO1Executor):
+    """Classify blocks until `gate` is set, recording whether it was."""
+
+    def __init__(self, gate):
+        super().__init__()
+        self.gate = gate
+        self.gate_set_during_classify = None
+
+    def execute(self, work_order: dict) -> dict:
+        if work_order.get("wo_type") == "classify":
+            self.gate_set_during_classify = self.gate.wait(timeout=2.0)
+        return super().execute(work_order)
+
+
+class TestTurnPrefetch:
+    def _make_supervisor(self, tmp_path, ho1, ho3_memory=None, turn_prefetch=True):
+        ho2m = tmp_path / "ho2m"
+        ho2m.mkdir(exist_ok=True)
+        ho1m = tmp_path / "ho1m"
+        ho1m.mkdir(exist_ok=True)
+        config = HO2Config(
+            attention_templates=["ATT-ADMIN-001"],
+            ho2m_path=ho2m,
+            ho1m_path=ho1m,
+            ho3_enabled=ho3_memory is not None,
+            turn_prefetch=turn_prefetch,
+        )
+        return HO2Supervisor(
+            plane_root=tmp_path,
+            agent_class="ADMIN",
+            ho1_executor=ho1,
+            ledger_client=MockLedgerClient(),
+            token_budgeter=MockTokenBudgeter(),
+            config=config,
+            ho3_memory=ho3_memory,
+        )
+
+    def _gated_ho3(self, gate):
+        ho3 = MockHO3Memory(biases=[])
+
+        def _read(as_of_ts=None):
+            gate.set()
+            return []
+
+        ho3.read_active_biases = _read
+        return ho3
+
+    def test_ho3_artifacts_load_while_classify_in_flight(self, tmp_path):
+        import threading
+        gate = threading.Event()
+        ho1 = _GatedClassifyHO1(gate)
+        sv = self._make_supervisor(tmp_path, ho1, ho3_memory=self._gated_ho3(gate))
+        result = sv.handle_turn("hello")
+        assert ho1.gate_set_during_classify is True
+        assert result.response
+
+    def test_prefetch_disabled_runs_after_classify(self, tmp_path):
+        import threading
+        gate = threading.Event()
+        ho1 = _GatedClassifyHO1(gate)
+        gate_wait = ho1.gate.wait
+        ho1.gate.wait = lambda timeout=None: gate_wait(timeout=0.05)
+        ho3 = self._gated_ho3(gate)
+        sv = self._make_supervisor(tmp_path, ho1, ho3_memory=ho3, turn_prefetch=False)
+        result = sv.handle_turn("hello")
+        assert ho1.gate_set_during_classify is False
+        assert gate.is_set()
+        assert result.response
+
+    def test_end_session_shuts_down_prefetch_pool(self, tmp_path):
+        sv = self._make_supervisor(tmp_path, MockHO1Executor())
+        sv.handle_turn("hello")
+        pool = sv._turn_pool
+        sv.end_session()
+        assert sv._turn_pool is None
+        assert pool._shutdown
+        result = sv.handle_turn("next session")  # a fresh pool on first use
+        assert result.response
+        assert sv._turn_pool is not None and sv._turn_pool is not pool
+        sv.close()
+
+    def test_failed_prefetch_recomputed_on_critical_path(self, tmp_path):
+        sv = self._make_supervisor(tmp_path, MockHO1Executor())
+        with patch.object(sv, "_prefetch_liveness", side_effect=RuntimeError("boom")) as prefetch:
+            result = sv.handle_turn("hello")
+        assert prefetch.call_count == 1
+        assert result.response
+        assert sv._current_liveness is not None
+
+
+# ===========================================================================
+# Async Turn Tests (4)
+# ===========================================================================
+
+class _AsyncMockHO1Executor(MockHO1Executor):
+    """MockHO1Executor whose execute_async yields to the loop for `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+
+    async def execute_async(self, work_order: dict) -> dict:
+        import asyncio
+        await asyncio.sleep(self.delay)
+        return self.execute(work_order)
+
+
+class TestHandleTurnAsync:
+    def _make_supervisor(self, tmp_path, ho1, ledger=None, ho3_memory=None):
+        ho2m = tmp_path / "ho2m"
+        ho2m.mkdir(parents=True, exist_ok=True)
+        ho1m = tmp_path / "ho1m"
+        ho1m.mkdir(parents=True, exist_ok=True)
+        config = HO2Config(
+            attention_templates=["ATT-ADMIN-001"],
+            ho2m_path=ho2m,
+            ho1m_path=ho1m,
+            ho3_enabled=ho3_memory is not None,
+        )
+        return HO2Supervisor(
+            plane_root=tmp_path,
+            agent_class="ADMIN",
+            ho1_executor=ho1,
+            ledger_client=ledger or MockLedgerClient(),
+            token_budgeter=MockTokenBudgeter(),
+            config=config,
+            ho3_memory=ho3_memory,
+        )
+
+    def test_async_turn_matches_sync_turn(self, tmp_path):
+        import asyncio
+        sync_sv = self._make_supervisor(tmp_path / "sync", MockHO1Executor())
+        async_ho1 = _AsyncMockHO1Executor()
+        async_sv = self._make_supervisor(tmp_path / "async", async_ho1)
+
+        expected = sync_sv.handle_turn("hello")
+        result = asyncio.run(async_sv.handle_turn_async("hello"))
+
+        assert result.response == expected.response
+        assert [w["wo_type"] for w in result.wo_chain_summary] == ["classify", "synthesize"]
+        assert result.cost_summary == expected.cost_summary
+        assert result.quality_gate_passed is True
+
+    def test_sessions_multiplexed_on_one_loop(self, tmp_path):
+        import asyncio
+        ho1 = _AsyncMockHO1Executor(delay=0.1)
+        supervisors = [self._make_supervisor(tmp_path / f"s{i}", ho1) for i in range(20)]
+
+        async def run():
+            return await asyncio.gather(*(sv.handle_turn_async("hello") for sv in supervisors))
+
+        start = time.monotonic()
+        results = asyncio.run(run())
+        elapsed = time.monotonic() - start
+
+        assert len({r.session_id for r in results}) == 20
+        assert all(r.quality_gate_passed for r in results)
+        assert len(ho1.executed_wos) == 40
+        assert elapsed < 2.0  # 40 sequential WOs would take 4s
+
+    def test_ho2m_writes_go_through_single_writer(self, tmp_path):
+        import asyncio
+        from ledger_client import AsyncLedgerWriter
+
+        ledger_path = tmp_path / "ho2m" / "ho2m.jsonl"
+        ledger_path.parent.mkdir(parents=True)
+        client = LedgerClient(ledger_path=ledger_path)
+        writer = AsyncLedgerWriter(client)
+        sv = self._make_supervisor(tmp_path, _AsyncMockHO1Executor(), ledger=writer)
+
+        async def run():
+            await sv.handle_turn_async("hello")
+            await sv.handle_turn_async("again")
+            await writer.aclose()
+
+        asyncio.run(run())
+
+        events = [e.event_type for e in client.read_all()]
+        assert events[0] == "SESSION_START"
+        assert events.count("TURN_RECORDED") == 2
+        assert events.count("WO_DISPATCHED") == 4
+        assert writer.queue_depth == 0
+        assert client.verify_chain() == (True, [])
+
+    def test_blocking_reads_run_off_the_loop(self, tmp_path):
+        import asyncio
+        import threading
+        sv = self._make_supervisor(tmp_path, _AsyncMockHO1Executor(), ho3_memory=MockHO3Memory())
+        threads = {}
+
+        def record(name, fn):
+            def wrapper(*args, **kwargs):
+                threads[name] = threading.current_thread()
+                return fn(*args, **kwargs)
+            return wrapper
+
+        blocking = ("_scan_active_intents", "_project_liveness", "_compute_trace_hash", "_ho3_log_signals", "_ho3_check_gates")
+        for name in blocking:
+            setattr(sv, name, record(name, getattr(sv, name)))
+
+        async def run():
+            with patch("ho2_supervisor._TurnPrefetch.wait", side_effect=AssertionError("blocking wait")):
+                result = await sv.handle_turn_async("hello")
+            return result, threading.current_thread()
+
+        result, loop_thread = asyncio.run(run())
+        assert result.quality_gate_passed is True
+        assert set(threads) == set(blocking)
+        assert all(t is not loop_thread for t in threads.values())
+
+
+# ===========================================================================
+# Batched HO3 Signal Tests (2)
+# ===========================================================================
+
+class _BatchedHO3Memory(MockHO3MemoryForConsolidation):
+    """HO3 mock exposing the batched log_signals/check_gates API."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches: List[List[tuple]] = []
+        self.gate_passes: List[List[str]] = []
+        self.signal_reads = 0
+
+    def log_signals(self, batch):
+        self.batches.append(list(batch))
+        return [item[2] for item in batch]
+
+    def check_gates(self, signal_ids):
+        self.gate_passes.append(list(signal_ids))
+        acc = MagicMock()
+        acc.count = 5
+        acc.session_ids = ["SES-1", "SES-2", "SES-3"]
+        acc.event_ids = list(self._event_ids)
+        acc.last_seen = "2026-02-17T10:00:00+00:00"
+        return [MagicMock(signal_id=sid, crossed=self._gate_crossed, accumulator=acc) for sid in signal_ids]
+
+    def read_signals(self, signal_id=None, min_count=0):
+        self.signal_reads += 1
+        return super().read_signals(signal_id, min_count)
+
+
+class TestBatchedHO3Signals:
+    """The post-turn block and run_consolidation use one HO3 call per phase."""
+
+    _make_supervisor_with_consolidation = TestConsolidationDispatch._make_supervisor_with_consolidation
+
+    def test_turn_logs_and_gates_signals_in_one_pass(self, tmp_path):
+        ho3 = _BatchedHO3Memory(enabled=True, gate_crossed=True)
+        sv, ho1, ledger = self._make_supervisor_with_consolidation(
+            tmp_path, ho3,
+            classify_response={"speech_act": "question", "ambiguity": "low",
+                               "labels": {"domain": "system", "task": "inspect"}},
+        )
+        result = sv.handle_turn("what is running?")
+        assert len(ho3.batches) == 1
+        assert ho3.logged_signals == [] and ho3.gate_checks == []
+        ids = [item[0] for item in ho3.batches[0]]
+        assert ids == ["intent:question", "domain:system", "task:inspect", "outcome:success"]
+        assert ho3.gate_passes == [ids]
+        assert result.consolidation_candidates == ids
+
+    def test_consolidation_uses_gate_accumulators(self, tmp_path):
+        ho3 = _BatchedHO3Memory(enabled=True, gate_crossed=True, event_ids=["EVT-b01"])
+        sv, ho1, ledger = self._make_supervisor_with_consolidation(tmp_path, ho3)
+        sv.start_session()
+        results = sv.run_consolidation(["intent:test", "domain:system", "intent:test"])
+        assert len(results) == 2
+        assert ho3.gate_passes == [["intent:test", "domain:system"]]
+        assert ho3.signal_reads == 0
+        assert [o["source_event_ids"] for o in ho3.logged_overlays] == [["EVT-b01"], ["EVT-b01"]]
+
+
+# ===========================================================================
+# Background Consolidation Tests (3)
+# ===========================================================================
+
+class TestBackgroundConsolidation:
+    """consolidation_workers > 0 moves consolidate WOs onto a worker pool."""
+
+    def _make_supervisor(self, tmp_path, ho3, **config_overrides):
+        config = HO2Config(
+            attention_templates=["ATT-ADMIN-001"],
+            ho2m_path=tmp_path / "ho2m",
+            ho1m_path=tmp_path / "ho1m",
+            ho3_enabled=True,
+            consolidation_budget=4000,
+            **config_overrides,
+        )
+        responses = {
+            "classify": {"speech_act": "greeting", "ambiguity": "low"},
+            "synthesize": {"response_text": "Hello!"},
+            "consolidate": {"bias": "prefers greetings", "category": "style", "salience_weight": 0.8},
+        }
+        ho1 = MockHO1Executor(responses=responses)
+        sv = HO2Supervisor(
+            plane_root=tmp_path,
+            agent_class="ADMIN",
+            ho1_executor=ho1,
+            ledger_client=MockLedgerClient(),
+            token_budgeter=MockTokenBudgeter(),
+            config=config,
+            ho3_memory=ho3,
+        )
+        return sv, ho1
+
+    def test_run_consolidation_returns_before_wos_run(self, tmp_path):
+        ho3 = _BatchedHO3Memory(enabled=True, gate_crossed=True)
+        sv, ho1 = self._make_supervisor(tmp_path, ho3, consolidation_workers=2)
+        sv.start_session()
+        assert sv.run_consolidation(["intent:a", "intent:b"]) == []
+        assert sv.run_consolidation(["intent:a"]) == []  # deduplicated within the gate window
+        sv.end_session()  # waits for the pool
+        consolidate_wos = [w for w in ho1.executed_wos if w["wo_type"] == "consolidate"]
+        assert sorted(w["input_context"]["signal_id"] for w in consolidate_wos) == ["intent:a", "intent:b"]
+        assert len({w["wo_id"] for w in consolidate_wos}) == 2
+        assert len(ho3.logged_overlays) == 2
+        metrics = sv.consolidation_metrics()
+        assert metrics["completed"] == 2
+        assert metrics["deduplicated"] == 1
+        assert metrics["queue_depth"] == 0
+
+    def test_inline_mode_by_default(self, tmp_path):
+        ho3 = _BatchedHO3Memory(enabled=True, gate_crossed=True)
+        sv, ho1 = self._make_supervisor(tmp_path, ho3)
+        sv.start_session()
+        assert len(sv.run_consolidation(["intent:a"])) == 1
+        assert sv.consolidation_metrics() is None
+
+    def test_end_session_closes_queue_and_next_session_reopens(self, tmp_path):
+        ho3 = _BatchedHO3Memory(enabled=True, gate_crossed=True)
+        sv, ho1 = self._make_supervisor(tmp_path, ho3, consolidation_workers=2)
+        sv.start_session()
+        sv.run_consolidation(["intent:a"])
+        first = sv._consolidation_queue
+        sv.end_session()
+        assert first.closed
+        assert first.submit(["intent:late"]) == []  # no-op, not a RuntimeError
+
+        sv.start_session()
+        sv.run_consolidation(["intent:b"])
+        assert sv._consolidation_queue is not first
+        sv.end_session()
+        assert sorted(w["input_context"]["signal_id"] for w in ho1.executed_wos if w["wo_type"] == "consolidate") == [
+            "intent:a", "intent:b",
+        ]
@@ -6,7 +6,9 @@ import sys
 _staging = Path(__file__).resolve().parents[3]
 sys.path.insert(0, str(_staging / "PKG-HO2-SUPERVISOR-001" / "HO2" / "kernel"))
 
-from liveness import LivenessState, reduce_liveness
+import json
+
+from liveness import LivenessReducer, LivenessState, reduce_liveness
 
 
 def _entry(event_type, ts, *, submission_id=None, metadata=None, reason=""):
@@ -154,3 +156,62 @@ class TestLivenessReducer:
         s = reduce_liveness(ho2m, [], session_id="SES-A")
         assert "INT-A" in s.active_intents
         assert "INT-B" not in s.active_intents
+
+
+def _history():
+    wo = lambda wo_id: {"provenance": {"work_order_id": wo_id}}
+    return [
+        _entry("INTENT_DECLARED", "2026-02-20T00:00:00+00:00", metadata={"intent_id": "INT-1", "objective": "a"}),
+        _entry("WO_PLANNED", "2026-02-20T00:00:01+00:00", metadata={**wo("WO-1"), "wo_type": "classify"}),
+        _entry("WO_PLANNED", "2026-02-20T00:00:02+00:00", metadata={**wo("WO-2"), "wo_type": "synthesize"}),
+        _entry("WO_COMPLETED", "2026-02-20T00:00:03+00:00", metadata=wo("WO-1")),
+        _entry("INTENT_DECLARED", "2026-02-20T00:00:04+00:00", metadata={"intent_id": "INT-2"}),
+        _entry("INTENT_SUPERSEDED", "2026-02-20T00:00:05+00:00", metadata={"intent_id": "INT-1"}),
+        _entry("ESCALATION", "2026-02-20T00:00:06+00:00", metadata=wo("WO-2"), reason="gate failed"),
+        _entry("WO_DISPATCHED", "2026-02-20T00:00:07+00:00", metadata={**wo("WO-3"), "intent_id": "INT-2"}),
+    ]
+
+
+class TestIncrementalReducer:
+    def test_chunked_folds_match_full_reduction(self):
+        history = _history()
+        reducer = LivenessReducer()
+        for i in range(0, len(history), 3):
+            state = reducer.fold(history[i:i + 2], history[i + 2:i + 3])
+            assert state == reduce_liveness(history[:i + 3], [])
+        assert not reducer.needs_rebuild
+
+    def test_out_of_order_event_requests_rebuild(self):
+        history = _history()
+        reducer = LivenessReducer()
+        reducer.fold(history[3:4], [])
+        reducer.fold(history[1:2], [])
+        assert reducer.needs_rebuild
+
+    def test_snapshot_restore_resumes(self):
+        history = _history()
+        reducer = LivenessReducer()
+        reducer.fold(history[:5], [])
+        reducer.cursors = {"ho2m": {"ho2m.jsonl": 1234}}
+        snapshot = json.loads(json.dumps(reducer.snapshot()))
+
+        restored = LivenessReducer.restore(snapshot)
+        assert restored.cursors == {"ho2m": {"ho2m.jsonl": 1234}}
+        resumed, full = restored.fold(history[5:], []), reduce_liveness(history, [])
+        assert resumed.active_intents == full.active_intents
+        assert resumed.open_work_orders == full.open_work_orders
+        assert resumed.failed_items == full.failed_items
+        assert resumed.escalations == full.escalations
+        assert resumed.work_orders["WO-3"] == full.work_orders["WO-3"]
+        assert LivenessReducer.restore({"version": 99}) is None
+        assert LivenessReducer.restore(snapshot, session_id="SES-OTHER") is None
+
+    def test_snapshot_drops_retired_slots(self):
+        history = _history()
+        reducer = LivenessReducer()
+        reducer.fold(history, [])
+        snapshot = reducer.snapshot()
+        assert sorted(snapshot["intents"]) == ["INT-2"]  # INT-1 superseded
+        assert sorted(snapshot["work_orders"]) == ["WO-2", "WO-3"]  # WO-1 completed
+        state = LivenessReducer.restore(snapshot).state()
+        assert state.failed_items == reducer.state().failed_items
@@ -24,16 +24,31 @@ Usage:
     if result.crossed:
         # Signal ready for consolidation
         ...
+
+    # A turn's signals: one ledger commit, one gate pass
+    mem.log_signals([("intent:tool_query", "SES-001", "EVT-abc124"),
+                     ("domain:system", "SES-001", "EVT-abc125")])
+    results = mem.check_gates(["intent:tool_query", "domain:system"])
+
+Signal accumulators (count, session set, last_seen, recent event ids) are
+materialized in memory and folded forward from signals.jsonl by byte offset,
+so reads and gate checks do not rescan the ledger. The table is checkpointed
+to signals.accumulators.json next to the ledger; a cold start loads the
+checkpoint and replays only the entries appended after it.
 """
 
 import hashlib
+import heapq
 import json
 import math
+import os
+import threading
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -57,22 +72,34 @@ class HO3MemoryConfig:
     gate_window_hours: int = 168        # 7 days -- window for not_consolidated check
     decay_half_life_hours: float = 336  # 14 days -- time-based signal decay
     enabled: bool = False               # MVP default: OFF (opt-in)
+    signal_event_ring: int = 256        # most recent event_ids kept per signal
+    signal_checkpoint_every: int = 100  # checkpoint after N newly folded events
 
 
 @dataclass
 class SignalAccumulator:
-    """Accumulated signal state -- computed on READ, never stored.
+    """Accumulated signal state for one signal_id.
 
-    Derived by scanning signals.jsonl and grouping by signal_id.
+    Derived from signals.jsonl; the ledger stays the source of truth and
+    the materialized table can always be rebuilt from it.
     """
     signal_id: str
     count: int                  # total events for this signal_id
     last_seen: str              # ISO timestamp of most recent event
     session_ids: List[str]      # unique session IDs that contributed
-    event_ids: List[str]        # all event IDs (for source references)
+    event_ids: List[str]        # most recent event IDs, oldest first (bounded)
     decay: float                # time-based decay factor (0.0 to 1.0)
 
 
+@dataclass
+class _SignalState:
+    """Materialized accumulator row, folded forward one event at a time."""
+    count: int = 0
+    last_seen: str = ""
+    session_ids: set = field(default_factory=set)
+    event_ids: deque = field(default_factory=deque)
+
+
 @dataclass
 class GateResult:
     """Result of bistable gate check.
@@ -86,6 +113,171 @@ class GateResult:
     session_count: int = 0
     already_consolidated: bool = False
     reason: str = ""
+    accumulator: Optional[SignalAccumulator] = None  # state the gate was evaluated on
+
+
+def _read_appended_lines(path: Path, offset: int) -> Tuple[List[Tuple[int, bytes]], int]:
+    """Return complete non-blank lines after byte offset as (start, line).
+
+    Also returns the offset just past the last complete line; a partial
+    trailing line is left for the next call.
+
+    Raises:
+        ValueError: if the file is now shorter than offset
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return [], offset
+    if size < offset:
+        raise ValueError(f"{path.name} shrank below offset {offset}")
+    if size == offset:
+        return [], offset
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+    lines = []
+    pos = 0
+    while True:
+        end = data.find(b"\n", pos)
+        if end < 0:
+            break
+        line = data[pos:end + 1]
+        if line.strip():
+            lines.append((offset + pos, line))
+        pos = end + 1
+    return lines, offset + pos
+
+
+class _OverlayIndex:
+    """Lifecycle state of overlays.jsonl, folded forward one entry at a time.
+
+    Per artifact_id it keeps the artifact's own events and two resolved
+    views: the one _find_overlay_by_artifact_id() reports (ledger order)
+    and the active overlay read_active_biases() injects (timestamp order,
+    latest weight applied, expiry not yet checked). Active overlays with a
+    timezone-aware expiry sit in a min-heap and are moved to `expired` as
+    reads pass their expiry; a read at an earlier as_of_ts restores them.
+    Windows holds every window_end logged per signal_id.
+    """
+
+    def __init__(self) -> None:
+        self.legacy: List[Dict[str, Any]] = []  # overlays without artifact_id
+        self.events: Dict[str, List[Tuple[str, str, Dict[str, Any]]]] = {}
+        self.found: Dict[str, Dict[str, Any]] = {}
+        self.live: Dict[str, Tuple[Dict[str, Any], Optional[datetime]]] = {}
+        self.windows: Dict[Any, List[str]] = {}
+        self._order: Dict[str, int] = {}        # first-seen position per artifact
+        self._version: Dict[str, int] = {}      # bumps on every re-resolve
+        self._heap: List[Tuple[float, int, str]] = []
+        self._expired: Dict[str, float] = {}
+        self._mark = float("-inf")              # latest as_of time pruned to
+
+    def fold(self, data: Dict[str, Any]) -> None:
+        etype = data.get("event_type", "")
+        meta = data.get("metadata") or {}
+        window_end = meta.get("window_end", "")
+        if "signal_id" in meta and window_end:
+            self.windows.setdefault(meta["signal_id"], []).append(window_end)
+
+        art_id = meta.get("artifact_id")
+        if etype == "HO3_OVERLAY" and not art_id:
+            # Legacy overlay (no artifact_id) — include if salience > 0
+            if meta.get("salience_weight", 0) > 0:
+                self.legacy.append(meta)
+            return
+        if art_id:
+            if art_id not in self.events:
+                self.events[art_id] = []
+                self._order[art_id] = len(self._order)
+            self.events[art_id].append((data.get("timestamp", ""), etype, meta))
+            self._resolve(art_id)
+
+    def _resolve(self, art_id: str) -> None:
+        events = self.events[art_id]
+
+        # Ledger-order view: a new HO3_OVERLAY resets deactivation
+        base, deactivated = None, False
+        for _, etype, meta in events:
+            if etype == "HO3_OVERLAY":
+                base, deactivated = meta, False
+            elif etype == "HO3_OVERLAY_DEACTIVATED":
+                deactivated = True
+            elif etype == "HO3_OVERLAY_WEIGHT_UPDATED":
+                deactivated = False
+        if base is None:
+            self.found.pop(art_id, None)
+        else:
+            self.found[art_id] = {"metadata": base, "deactivated": deactivated}
+
+        # Timestamp-order view for active biases: latest event wins
+        base, latest_weight, deactivated = None, None, False
+        for _, etype, meta in sorted(events, key=lambda e: e[0]):
+            if etype == "HO3_OVERLAY":
+                base = meta
+            elif etype == "HO3_OVERLAY_DEACTIVATED":
+                deactivated = True
+            elif etype == "HO3_OVERLAY_WEIGHT_UPDATED":
+                deactivated = False  # weight update re-activates
+                latest_weight = meta.get("new_weight")
+
+        version = self._version.get(art_id, 0) + 1
+        self._version[art_id] = version
+        self._expired.pop(art_id, None)
+        self.live.pop(art_id, None)
+        if base is None or deactivated:
+            return
+        overlay = dict(base)
+        if latest_weight is not None:
+            overlay["weight"] = latest_weight
+            overlay["salience_weight"] = latest_weight
+        if overlay.get("salience_weight", 0) <= 0:
+            return
+
+        expires = None
+        if base.get("expires_at_event_ts"):
+            try:
+                expires = datetime.fromisoformat(base["expires_at_event_ts"])
+            except (ValueError, TypeError):
+                expires = None
+        self.live[art_id] = (overlay, expires)
+        if expires is not None and expires.tzinfo is not None:
+            heapq.heappush(self._heap, (expires.timestamp(), version, art_id))
+
+    def active(self, now: datetime) -> List[Dict[str, Any]]:
+        """Active overlays at `now`: legacy first, then by first appearance."""
+        aware = now.tzinfo is not None
+        if aware:
+            self._advance(now.timestamp())
+
+        result = [dict(meta) for meta in self.legacy]
+        for art_id in sorted(self.live, key=self._order.__getitem__):
+            overlay, expires = self.live[art_id]
+            if expires is not None:
+                if aware and expires.tzinfo is not None:
+                    if art_id in self._expired:
+                        continue
+                else:
+                    try:
+                        if now >= expires:
+                            continue
+                    except TypeError:
+                        pass  # naive vs aware: treated as not expired
+            result.append(dict(overlay))
+        return result
+
+    def _advance(self, now_ts: float) -> None:
+        if now_ts < self._mark:
+            # Reading at an earlier time: un-expire what has not expired yet
+            for art_id, exp_ts in list(self._expired.items()):
+                if exp_ts > now_ts:
+                    del self._expired[art_id]
+                    heapq.heappush(self._heap, (exp_ts, self._version[art_id], art_id))
+        self._mark = now_ts
+        while self._heap and self._heap[0][0] <= now_ts:
+            exp_ts, version, art_id = heapq.heappop(self._heap)
+            if self._version.get(art_id) == version and art_id in self.live:
+                self._expired[art_id] = exp_ts
 
 
 # ---------------------------------------------------------------------------
@@ -115,6 +307,15 @@ class HO3Memory:
             rotate_daily=False,
         )
 
+        # Materialized signal accumulators (see module docstring)
+        self._signal_checkpoint_path = self.config.memory_dir / "signals.accumulators.json"
+        self._signal_lock = threading.Lock()
+        self._signal_states: Dict[str, _SignalState] = {}
+        self._signals_offset = 0        # bytes of signals.jsonl folded so far
+        self._signals_anchor = (0, "")  # (start offset, sha256) of last folded line
+        self._signals_unsaved = 0       # events folded since the last checkpoint
+        self._load_signal_checkpoint()
+
         # Overlay entries ledger (append-only)
         self._overlays_path = self.config.memory_dir / "overlays.jsonl"
         self._overlays_client = LedgerClient(
@@ -124,6 +325,11 @@ class HO3Memory:
             rotate_daily=False,
         )
 
+        # Overlay lifecycle index, folded forward from overlays.jsonl
+        self._overlay_lock = threading.Lock()
+        self._overlay_index = _OverlayIndex()
+        self._overlays_offset = 0
+
     # =======================================================================
     # HO3.LOG (synchronous signal/event append)
     # =======================================================================
@@ -137,8 +343,8 @@ class HO3Memory:
     ) -> str:
         """Append a signal event to signals.jsonl.
 
-        Each call creates one immutable event line. Accumulated state
-        (count, session_ids, last_seen) is computed by READ, not stored.
+        Each call creates one immutable event line, then folds it into the
+        materialized accumulators.
 
         Args:
             signal_id: Signal identifier (e.g., "intent:tool_query")
@@ -149,6 +355,38 @@ class HO3Memory:
         Returns:
             The event_id that was logged
         """
+        self._signals_client.write(self._signal_entry(signal_id, session_id, event_id, metadata))
+        self._refresh_signals()
+        return event_id
+
+    def log_signals(self, batch: Iterable[Sequence[Any]]) -> List[str]:
+        """Append several signal events to signals.jsonl in one commit.
+
+        Each item is (signal_id, session_id, event_id) with an optional
+        fourth metadata dict, as for log_signal(). The entries are written
+        in a single ledger transaction and folded into the accumulators
+        once.
+
+        Returns:
+            The event_ids that were logged, in batch order
+        """
+        items = [tuple(item) for item in batch]
+        if not items:
+            return []
+        with self._signals_client.transaction():
+            for signal_id, session_id, event_id, *rest in items:
+                metadata = rest[0] if rest else None
+                self._signals_client.write(self._signal_entry(signal_id, session_id, event_id, metadata))
+        self._refresh_signals()
+        return [item[2] for item in items]
+
+    @staticmethod
+    def _signal_entry(
+        signal_id: str,
+        session_id: str,
+        event_id: str,
+        metadata: Optional[Dict[str, Any]],
+    ) -> LedgerEntry:
         entry_metadata = {
             "signal_id": signal_id,
             "session_id_signal": session_id,
@@ -157,15 +395,13 @@ class HO3Memory:
         if metadata:
             entry_metadata.update(metadata)
 
-        entry = LedgerEntry(
+        return LedgerEntry(
             event_type="HO3_SIGNAL",
             submission_id=signal_id,
             decision="LOGGED",
             reason=f"Signal event for {signal_id}",
             metadata=entry_metadata,
         )
-        self._signals_client.write(entry)
-        return event_id
 
     def log_overlay(self, overlay: Dict[str, Any]) -> str:
         """Append an overlay entry to overlays.jsonl.
@@ -248,6 +484,7 @@ class HO3Memory:
             metadata=entry_metadata,
         )
         self._overlays_client.write(entry)
+        self._refresh_overlays()
         return overlay_id
 
     # =======================================================================
@@ -262,77 +499,178 @@ class HO3Memory:
     ) -> List[SignalAccumulator]:
         """Read accumulated signal state.
 
-        Scans signals.jsonl, groups by signal_id, computes count,
-        session_ids, last_seen, event_ids, and decay. Nothing is
-        pre-aggregated -- all state derived on read.
+        Served from the materialized accumulators after folding in any
+        events appended to signals.jsonl since the last read. Decay is
+        computed at read time from last_seen.
 
         Args:
             signal_id: Filter to a specific signal_id (None = all)
             min_count: Only return signals with count >= min_count
 
         Returns:
-            List of SignalAccumulator instances
+            List of SignalAccumulator instances, in first-seen order
         """
-        entries = self._signals_client.read_all()
-
-        # Group by signal_id
-        groups: Dict[str, Dict[str, Any]] = {}
-        for entry in entries:
-            meta = entry.metadata
-            sid = meta.get("signal_id", "")
-            if not sid:
-                continue
-            if signal_id is not None and sid != signal_id:
-                continue
-
-            if sid not in groups:
-                groups[sid] = {
-                    "signal_id": sid,
-                    "count": 0,
-                    "last_seen": "",
-                    "session_ids": set(),
-                    "event_ids": [],
-                }
-
-            g = groups[sid]
-            g["count"] += 1
-            g["session_ids"].add(meta.get("session_id_signal", ""))
-            g["event_ids"].append(meta.get("ho3_event_id", ""))
+        now = datetime.fromisoformat(as_of_ts) if as_of_ts else datetime.now(timezone.utc)
+        with self._signal_lock:
+            self._fold_new_signals()
+            if signal_id is not None:
+                state = self._signal_states.get(signal_id)
+                rows = [(signal_id, state)] if state is not None else []
+            else:
+                rows = list(self._signal_states.items())
+            return [
+                self._to_accumulator(sid, state, now)
+                for sid, state in rows
+                if state.count >= min_count
+            ]
+
+    def _to_accumulator(self, signal_id: str, state: _SignalState, now: datetime) -> SignalAccumulator:
+        # Compute decay: exp(-ln(2) / half_life * hours_since_last_seen)
+        decay = 1.0
+        if state.last_seen and self.config.decay_half_life_hours > 0:
+            try:
+                last_dt = datetime.fromisoformat(state.last_seen)
+                hours_since = (now - last_dt).total_seconds() / 3600.0
+                if hours_since > 0:
+                    lam = math.log(2) / self.config.decay_half_life_hours
+                    decay = math.exp(-lam * hours_since)
+            except (ValueError, OverflowError):
+                decay = 1.0
+
+        return SignalAccumulator(
+            signal_id=signal_id,
+            count=state.count,
+            last_seen=state.last_seen,
+            session_ids=sorted(state.session_ids),
+            event_ids=list(state.event_ids),
+            decay=decay,
+        )
 
-            # Track last_seen as the most recent timestamp
-            ts = entry.timestamp
-            if not g["last_seen"] or ts > g["last_seen"]:
-                g["last_seen"] = ts
+    # =======================================================================
+    # Signal accumulator table (materialized, checkpointed)
+    # =======================================================================
 
-        # Convert to SignalAccumulator with decay
-        now = datetime.fromisoformat(as_of_ts) if as_of_ts else datetime.now(timezone.utc)
-        result = []
-        for sid, g in groups.items():
-            if g["count"] < min_count:
-                continue
+    def _refresh_signals(self) -> None:
+        with self._signal_lock:
+            self._fold_new_signals()
 
-            # Compute decay: exp(-ln(2) / half_life * hours_since_last_seen)
-            decay = 1.0
-            if g["last_seen"] and self.config.decay_half_life_hours > 0:
-                try:
-                    last_dt = datetime.fromisoformat(g["last_seen"])
-                    hours_since = (now - last_dt).total_seconds() / 3600.0
-                    if hours_since > 0:
-                        lam = math.log(2) / self.config.decay_half_life_hours
-                        decay = math.exp(-lam * hours_since)
-                except (ValueError, OverflowError):
-                    decay = 1.0
-
-            result.append(SignalAccumulator(
-                signal_id=g["signal_id"],
-                count=g["count"],
-                last_seen=g["last_seen"],
-                session_ids=sorted(g["session_ids"]),
-                event_ids=g["event_ids"],
-                decay=decay,
-            ))
+    def _fold_new_signals(self) -> None:
+        """Fold complete lines appended to signals.jsonl since the last fold.
 
-        return result
+        Caller holds _signal_lock. Checkpoints every signal_checkpoint_every
+        folded events.
+        """
+        try:
+            lines, self._signals_offset = _read_appended_lines(self._signals_path, self._signals_offset)
+        except ValueError:
+            # The ledger shrank (replaced): rebuild from scratch
+            self._reset_signal_states()
+            lines, self._signals_offset = _read_appended_lines(self._signals_path, 0)
+        for start, line in lines:
+            self._fold_signal_line(line)
+            self._signals_anchor = (start, hashlib.sha256(line).hexdigest())
+            self._signals_unsaved += 1
+
+        every = self.config.signal_checkpoint_every
+        if every > 0 and self._signals_unsaved >= every:
+            self._write_signal_checkpoint()
+
+    def _fold_signal_line(self, line: bytes) -> None:
+        try:
+            data = json.loads(line)
+            meta = data.get("metadata") or {}
+            sid = meta.get("signal_id", "")
+        except (ValueError, AttributeError):
+            return  # Skip malformed entries
+        if not sid:
+            return
+        state = self._signal_states.get(sid)
+        if state is None:
+            state = self._signal_states[sid] = _SignalState(
+                event_ids=deque(maxlen=max(1, self.config.signal_event_ring)),
+            )
+        state.count += 1
+        state.session_ids.add(meta.get("session_id_signal", ""))
+        state.event_ids.append(meta.get("ho3_event_id", ""))
+        ts = data.get("timestamp", "")
+        if not state.last_seen or ts > state.last_seen:
+            state.last_seen = ts
+
+    def _reset_signal_states(self) -> None:
+        self._signal_states = {}
+        self._signals_offset = 0
+        self._signals_anchor = (0, "")
+        self._signals_unsaved = 0
+
+    def checkpoint_signals(self) -> None:
+        """Persist the accumulator table now (it is also saved periodically)."""
+        with self._signal_lock:
+            self._fold_new_signals()
+            self._write_signal_checkpoint()
+
+    def _write_signal_checkpoint(self) -> None:
+        """Write the table atomically (temp file + rename). Caller holds the lock."""
+        payload = {
+            "version": 1,
+            "offset": self._signals_offset,
+            "anchor_offset": self._signals_anchor[0],
+            "anchor_sha256": self._signals_anchor[1],
+            "signals": {
+                sid: {
+                    "count": st.count,
+                    "last_seen": st.last_seen,
+                    "session_ids": sorted(st.session_ids),
+                    "event_ids": list(st.event_ids),
+                }
+                for sid, st in self._signal_states.items()
+            },
+        }
+        tmp = self._signal_checkpoint_path.with_name(self._signal_checkpoint_path.name + ".tmp")
+        try:
+            tmp.write_text(json.dumps(payload))
+            os.replace(tmp, self._signal_checkpoint_path)
+        except OSError:
+            return  # The checkpoint is an optimization; the ledger stays authoritative
+        self._signals_unsaved = 0
+
+    def _load_signal_checkpoint(self) -> None:
+        """Restore the table from its checkpoint, then fold newer events.
+
+        The checkpoint is used only if signals.jsonl still holds the same
+        line at its anchor; otherwise the table is rebuilt from the ledger.
+        """
+        with self._signal_lock:
+            self._reset_signal_states()
+            try:
+                payload = json.loads(self._signal_checkpoint_path.read_text())
+                if payload.get("version") != 1:
+                    raise ValueError("unknown checkpoint version")
+                offset = int(payload["offset"])
+                anchor_offset = int(payload["anchor_offset"])
+                anchor_sha = payload["anchor_sha256"]
+                if offset:
+                    with open(self._signals_path, "rb") as f:
+                        f.seek(anchor_offset)
+                        line = f.read(offset - anchor_offset)
+                    if hashlib.sha256(line).hexdigest() != anchor_sha:
+                        raise ValueError("checkpoint anchor mismatch")
+                ring = max(1, self.config.signal_event_ring)
+                states = {
+                    sid: _SignalState(
+                        count=int(row["count"]),
+                        last_seen=row["last_seen"],
+                        session_ids=set(row["session_ids"]),
+                        event_ids=deque(row["event_ids"], maxlen=ring),
+                    )
+                    for sid, row in payload["signals"].items()
+                }
+            except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                states = None
+            if states is not None:
+                self._signal_states = states
+                self._signals_offset = offset
+                self._signals_anchor = (anchor_offset, anchor_sha)
+            self._fold_new_signals()
 
     def read_overlays(
         self,
@@ -365,7 +703,8 @@ class HO3Memory:
         Returns overlays with salience > 0, suitable for injection
         into HO2's assembled context at Step 2b. Applies lifecycle
         resolution: deactivated overlays excluded, latest weight wins,
-        expired overlays excluded.
+        expired overlays excluded. Served from the overlay index, so the
+        cost follows the number of active artifacts, not ledger history.
 
         Args:
             as_of_ts: Optional ISO timestamp for deterministic expiry.
@@ -375,78 +714,29 @@ class HO3Memory:
             List of overlay dicts with active biases
         """
         now = datetime.fromisoformat(as_of_ts) if as_of_ts else datetime.now(timezone.utc)
-        entries = self._overlays_client.read_all()
-
-        # Phase 1: Collect all events by artifact_id
-        # Events without artifact_id are legacy overlays — pass through directly
-        legacy = []
-        by_artifact: Dict[str, List[Dict[str, Any]]] = {}
-
-        for entry in entries:
-            meta = entry.metadata
-            etype = entry.event_type
-            art_id = meta.get("artifact_id")
-
-            if etype == "HO3_OVERLAY" and not art_id:
-                # Legacy overlay (no artifact_id) — include if salience > 0
-                if meta.get("salience_weight", 0) > 0:
-                    legacy.append(meta)
-                continue
-
-            if art_id:
-                if art_id not in by_artifact:
-                    by_artifact[art_id] = []
-                by_artifact[art_id].append({"event_type": etype, "metadata": meta, "timestamp": entry.timestamp})
-
-        # Phase 2: Resolve lifecycle per artifact_id
-        result = list(legacy)
-        for art_id, events in by_artifact.items():
-            # Sort by timestamp to find latest event
-            events.sort(key=lambda e: e["timestamp"])
-
-            # Find the original OVERLAY event
-            base_overlay = None
-            latest_weight = None
-            deactivated = False
-
-            for evt in events:
-                etype = evt["event_type"]
-                meta = evt["metadata"]
-                if etype == "HO3_OVERLAY":
-                    base_overlay = meta
-                elif etype == "HO3_OVERLAY_DEACTIVATED":
-                    deactivated = True
-                elif etype == "HO3_OVERLAY_WEIGHT_UPDATED":
-                    deactivated = False  # weight update re-activates
-                    latest_weight = meta.get("new_weight")
-
-            if base_overlay is None:
-                continue
-            if deactivated:
-                continue
-
-            # Check expiry
-            expires = base_overlay.get("expires_at_event_ts")
-            if expires:
-                try:
-                    if now >= datetime.fromisoformat(expires):
-                        continue
-                except (ValueError, TypeError):
-                    pass
-
-            # Apply latest weight if updated
-            overlay = dict(base_overlay)
-            if latest_weight is not None:
-                overlay["weight"] = latest_weight
-                overlay["salience_weight"] = latest_weight
-
-            # Filter salience > 0
-            if overlay.get("salience_weight", 0) <= 0:
-                continue
-
-            result.append(overlay)
-
-        return result
+        with self._overlay_lock:
+            self._fold_new_overlays()
+            return self._overlay_index.active(now)
+
+    def _refresh_overlays(self) -> None:
+        with self._overlay_lock:
+            self._fold_new_overlays()
+
+    def _fold_new_overlays(self) -> None:
+        """Fold entries appended to overlays.jsonl. Caller holds _overlay_lock."""
+        try:
+            lines, self._overlays_offset = _read_appended_lines(self._overlays_path, self._overlays_offset)
+        except ValueError:
+            # The ledger shrank (replaced): rebuild from scratch
+            self._overlay_index = _OverlayIndex()
+            lines, self._overlays_offset = _read_appended_lines(self._overlays_path, 0)
+        for _, line in lines:
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue  # Skip malformed entries
+            if isinstance(data, dict):
+                self._overlay_index.fold(data)
 
     # =======================================================================
     # Overlay Lifecycle (append-only)
@@ -488,6 +778,7 @@ class HO3Memory:
             },
         )
         self._overlays_client.write(entry)
+        self._refresh_overlays()
         return artifact_id
 
     def update_overlay_weight(self, artifact_id: str, new_weight: float, reason: str, event_ts: str) -> str:
@@ -528,13 +819,15 @@ class HO3Memory:
             },
         )
         self._overlays_client.write(entry)
+        self._refresh_overlays()
         return artifact_id
 
     def _find_overlay_by_artifact_id(self, artifact_id: str) -> Optional[Dict[str, Any]]:
         """Find an overlay by artifact_id, with lifecycle resolution.
 
-        Scans all overlay events for the given artifact_id and resolves
-        the lifecycle state (active, deactivated, weight-updated).
+        Looks the artifact up in the overlay index, which resolves the
+        lifecycle state (active, deactivated, weight-updated) of each
+        artifact's events in ledger order.
 
         Args:
             artifact_id: The artifact_id to search for
@@ -542,26 +835,10 @@ class HO3Memory:
         Returns:
             Dict with 'metadata' and 'deactivated' keys, or None if not found
         """
-        entries = self._overlays_client.read_all()
-        base_overlay = None
-        deactivated = False
-
-        for entry in entries:
-            meta = entry.metadata
-            if meta.get("artifact_id") != artifact_id:
-                continue
-            etype = entry.event_type
-            if etype == "HO3_OVERLAY":
-                base_overlay = meta
-                deactivated = False
-            elif etype == "HO3_OVERLAY_DEACTIVATED":
-                deactivated = True
-            elif etype == "HO3_OVERLAY_WEIGHT_UPDATED":
-                deactivated = False
-
-        if base_overlay is None:
-            return None
-        return {"metadata": base_overlay, "deactivated": deactivated}
+        with self._overlay_lock:
+            self._fold_new_overlays()
+            found = self._overlay_index.found.get(artifact_id)
+            return dict(found) if found is not None else None
 
     @staticmethod
     def compute_artifact_id(
@@ -608,17 +885,51 @@ class HO3Memory:
         Returns:
             GateResult with crossed status and diagnostic info
         """
-        accumulators = self.read_signals(signal_id=signal_id)
+        return self.check_gates([signal_id])[0]
+
+    def check_gates(self, signal_ids: Iterable[str]) -> List[GateResult]:
+        """Check the bistable gate for several signals in one pass.
+
+        Folds new signal and overlay entries once, then evaluates every
+        gate against the same snapshot and clock. Same conditions as
+        check_gate(); each result carries the accumulator it was
+        evaluated on (None if the signal has no events).
 
-        if not accumulators:
+        Args:
+            signal_ids: Signals to check
+
+        Returns:
+            One GateResult per signal_id, in input order
+        """
+        ids = list(signal_ids)
+        now = datetime.now(timezone.utc)
+        # O(len(ids)): lookups in the materialized accumulator table
+        with self._signal_lock:
+            self._fold_new_signals()
+            accumulators = {
+                sid: self._to_accumulator(sid, self._signal_states[sid], now)
+                for sid in ids
+                if sid in self._signal_states
+            }
+        with self._overlay_lock:
+            self._fold_new_overlays()
+            windows = {sid: list(self._overlay_index.windows.get(sid, ())) for sid in ids}
+        return [self._evaluate_gate(sid, accumulators.get(sid), windows[sid], now) for sid in ids]
+
+    def _evaluate_gate(
+        self,
+        signal_id: str,
+        acc: Optional[SignalAccumulator],
+        windows: List[str],
+        now: datetime,
+    ) -> GateResult:
+        if acc is None:
             return GateResult(
                 signal_id=signal_id,
                 crossed=False,
                 reason="No signal events found",
             )
 
-        acc = accumulators[0]
-
         # Check count threshold
         if acc.count < self.config.gate_count_threshold:
             return GateResult(
@@ -627,6 +938,7 @@ class HO3Memory:
                 count=acc.count,
                 session_count=len(acc.session_ids),
                 reason=f"Count {acc.count} < threshold {self.config.gate_count_threshold}",
+                accumulator=acc,
             )
 
         # Check session threshold
@@ -637,11 +949,11 @@ class HO3Memory:
                 count=acc.count,
                 session_count=len(acc.session_ids),
                 reason=f"Sessions {len(acc.session_ids)} < threshold {self.config.gate_session_threshold}",
+                accumulator=acc,
             )
 
         # Check not_consolidated
-        already = self._is_consolidated(signal_id)
-        if already:
+        if self._within_gate_window(windows, now):
             return GateResult(
                 signal_id=signal_id,
                 crossed=False,
@@ -649,6 +961,7 @@ class HO3Memory:
                 session_count=len(acc.session_ids),
                 already_consolidated=True,
                 reason="Already consolidated within gate window",
+                accumulator=acc,
             )
 
         return GateResult(
@@ -657,13 +970,14 @@ class HO3Memory:
             count=acc.count,
             session_count=len(acc.session_ids),
             reason="All thresholds met, not consolidated",
+            accumulator=acc,
         )
 
     def _is_consolidated(self, signal_id: str, as_of_ts: Optional[str] = None) -> bool:
         """Check if signal was already consolidated within the gate window.
 
-        Reads overlays.jsonl for an overlay with matching signal_id
-        whose window_end is within the last gate_window_hours.
+        Looks for a window_end logged for this signal_id (from the
+        overlay index) within the last gate_window_hours.
 
         Args:
             signal_id: Signal to check
@@ -673,17 +987,22 @@ class HO3Memory:
         Returns:
             True if consolidated within window (gate stays closed)
         """
-        overlays = self.read_overlays(signal_id=signal_id, active_only=False)
-        if not overlays:
+        with self._overlay_lock:
+            self._fold_new_overlays()
+            windows = list(self._overlay_index.windows.get(signal_id, ()))
+        if not windows:
             return False
 
         now = datetime.fromisoformat(as_of_ts) if as_of_ts else datetime.now(timezone.utc)
+        return self._within_gate_window(windows, now)
+
+    def _within_gate_window(self, windows: List[str], now: datetime) -> bool:
+        """True if any window_end falls within gate_window_hours before now."""
+        if not windows:
+            return False
         window_cutoff = now - timedelta(hours=self.config.gate_window_hours)
 
-        for overlay in overlays:
-            window_end_str = overlay.get("window_end", "")
-            if not window_end_str:
-                continue
+        for window_end_str in windows:
             try:
                 window_end = datetime.fromisoformat(window_end_str)
                 if window_cutoff <= window_end <= now:
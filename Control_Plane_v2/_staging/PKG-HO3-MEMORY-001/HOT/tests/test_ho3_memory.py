@@ -1,9 +1,11 @@
 """Tests for PKG-HO3-MEMORY-001 -- HO3 Memory Store.
 
-36 tests covering: signal logging, signal reading/accumulation,
+47 tests covering: signal logging, signal reading/accumulation,
 overlay logging, overlay reading, bistable gate, decay computation,
 active biases, source ledger immutability, as_of_ts replay-safe decay,
-structured artifacts, overlay lifecycle, expiry filtering, idempotency.
+structured artifacts, overlay lifecycle, expiry filtering, idempotency,
+materialized signal accumulators and their checkpoint, overlay index,
+batched signal logging and gate checks.
 No LLM calls. All tests use tmp_path for isolation.
 """
 
@@ -11,6 +13,8 @@ import sys
 import json
 import hashlib
 import math
+import os
+import time
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from unittest.mock import patch
@@ -661,3 +665,232 @@ class TestLifecycleResolution:
         biases = ho3.read_active_biases()
         art_ids = [b.get("artifact_id") for b in biases]
         assert "ART-resolve01" not in art_ids
+
+
+# === Signal Accumulator Table Tests ===
+
+def _ho3_instance(tmp_path, **overrides):
+    from ho3_memory import HO3Memory, HO3MemoryConfig
+    config = HO3MemoryConfig(
+        memory_dir=tmp_path / "HOT" / "memory",
+        gate_count_threshold=5,
+        gate_session_threshold=3,
+        enabled=True,
+        **overrides,
+    )
+    return HO3Memory(plane_root=tmp_path, config=config)
+
+
+class TestSignalAccumulatorTable:
+    def test_gate_check_does_not_rescan_ledger(self, ho3):
+        """After log_signal folds an event, check_gate reads no ledger entries."""
+        for i in range(5):
+            ho3.log_signal("sig:hot", f"SES-{i % 3}", f"EVT-{i:03d}")
+        with patch.object(ho3._signals_client, "iter_entries") as iter_entries, \
+                patch.object(ho3._signals_client, "read_all") as read_all:
+            gate = ho3.check_gate("sig:hot")
+        assert gate.crossed is True
+        assert gate.count == 5
+        iter_entries.assert_not_called()
+        read_all.assert_not_called()
+
+    def test_event_id_ring_is_bounded(self, tmp_path):
+        mem = _ho3_instance(tmp_path, signal_event_ring=3)
+        for i in range(6):
+            mem.log_signal("sig:ring", "SES-001", f"EVT-{i:03d}")
+        acc = mem.read_signals(signal_id="sig:ring")[0]
+        assert acc.count == 6
+        assert acc.event_ids == ["EVT-003", "EVT-004", "EVT-005"]
+
+    def test_cold_start_replays_only_after_checkpoint(self, tmp_path):
+        mem = _ho3_instance(tmp_path)
+        for i in range(4):
+            mem.log_signal("sig:a", f"SES-{i}", f"EVT-a{i}")
+        mem.checkpoint_signals()
+        mem.log_signal("sig:b", "SES-9", "EVT-b0")
+        expected = [(a.signal_id, a.count, a.session_ids, a.event_ids, a.last_seen)
+                    for a in mem.read_signals()]
+
+        from ho3_memory import HO3Memory
+        folded = []
+        original = HO3Memory._fold_signal_line
+
+        def spy(self, line):
+            folded.append(json.loads(line)["metadata"]["ho3_event_id"])
+            return original(self, line)
+
+        with patch.object(HO3Memory, "_fold_signal_line", spy):
+            restarted = _ho3_instance(tmp_path)
+        assert folded == ["EVT-b0"]
+        assert [(a.signal_id, a.count, a.session_ids, a.event_ids, a.last_seen)
+                for a in restarted.read_signals()] == expected
+
+    def test_stale_checkpoint_is_rebuilt_from_ledger(self, tmp_path):
+        mem = _ho3_instance(tmp_path)
+        for i in range(3):
+            mem.log_signal("sig:a", "SES-001", f"EVT-{i}")
+        mem.checkpoint_signals()
+        checkpoint = tmp_path / "HOT" / "memory" / "signals.accumulators.json"
+        payload = json.loads(checkpoint.read_text())
+        payload["signals"]["sig:a"]["count"] = 99
+        payload["anchor_sha256"] = "0" * 64
+        checkpoint.write_text(json.dumps(payload))
+
+        restarted = _ho3_instance(tmp_path)
+        assert restarted.read_signals(signal_id="sig:a")[0].count == 3
+
+    def test_events_from_another_writer_are_folded(self, tmp_path):
+        reader = _ho3_instance(tmp_path)
+        writer = _ho3_instance(tmp_path)
+        writer.log_signal("sig:shared", "SES-001", "EVT-001")
+        writer.log_signal("sig:shared", "SES-002", "EVT-002")
+        acc = reader.read_signals(signal_id="sig:shared")[0]
+        assert acc.count == 2
+        assert acc.session_ids == ["SES-001", "SES-002"]
+
+
+# === Overlay Index Tests ===
+
+def _artifact(art_id, now, **extra):
+    overlay = {
+        "signal_id": f"sig:{art_id}",
+        "salience_weight": 0.7,
+        "source_event_ids": ["EVT-001"],
+        "content": {"bias": art_id},
+        "window_start": (now - timedelta(days=7)).isoformat(),
+        "window_end": now.isoformat(),
+        "artifact_id": art_id,
+        "artifact_type": "topic_affinity",
+        "enabled": True,
+        "weight": 0.7,
+    }
+    overlay.update(extra)
+    return overlay
+
+
+class TestOverlayIndex:
+    def test_reads_do_not_rescan_ledger(self, ho3):
+        """Active biases, lookups and gate windows come from the index."""
+        now = datetime.now(timezone.utc)
+        ho3.log_overlay(_artifact("ART-idx001", now))
+        with patch.object(ho3._overlays_client, "read_all") as read_all:
+            biases = ho3.read_active_biases()
+            found = ho3._find_overlay_by_artifact_id("ART-idx001")
+            consolidated = ho3._is_consolidated("sig:ART-idx001")
+        read_all.assert_not_called()
+        assert [b["artifact_id"] for b in biases] == ["ART-idx001"]
+        assert found["deactivated"] is False
+        assert consolidated is True
+
+    def test_lifecycle_and_order_follow_ledger(self, ho3):
+        """Weight updates, deactivation and legacy overlays resolve as before."""
+        now = datetime.now(timezone.utc)
+        ho3.log_overlay(_artifact("ART-ord001", now))
+        ho3.log_overlay({"signal_id": "sig:legacy", "salience_weight": 0.4,
+                         "source_event_ids": ["EVT-002"], "content": {},
+                         "window_start": now.isoformat(), "window_end": now.isoformat()})
+        ho3.log_overlay(_artifact("ART-ord002", now))
+        ho3.log_overlay(_artifact("ART-ord003", now))
+        ho3.update_overlay_weight("ART-ord001", 0.2, "cooled", now.isoformat())
+        ho3.deactivate_overlay("ART-ord002", "obsolete", now.isoformat())
+
+        biases = ho3.read_active_biases()
+        assert [b.get("artifact_id", b["signal_id"]) for b in biases] == [
+            "sig:legacy", "ART-ord001", "ART-ord003"]
+        assert biases[1]["weight"] == 0.2
+        assert biases[1]["salience_weight"] == 0.2
+        assert ho3._find_overlay_by_artifact_id("ART-ord002")["deactivated"] is True
+
+    def test_expiry_heap_honours_earlier_as_of(self, ho3):
+        """An overlay expired by a later read is active again at an earlier as_of_ts."""
+        now = datetime.now(timezone.utc)
+        ho3.log_overlay(_artifact("ART-exp001", now,
+                                  expires_at_event_ts=(now + timedelta(hours=1)).isoformat()))
+        later = (now + timedelta(hours=2)).isoformat()
+        assert ho3.read_active_biases(as_of_ts=later) == []
+        biases = ho3.read_active_biases(as_of_ts=now.isoformat())
+        assert [b["artifact_id"] for b in biases] == ["ART-exp001"]
+        assert ho3.read_active_biases(as_of_ts=later) == []
+
+    def test_overlays_from_another_writer_are_folded(self, tmp_path):
+        reader = _ho3_instance(tmp_path)
+        writer = _ho3_instance(tmp_path)
+        now = datetime.now(timezone.utc)
+        assert reader.read_active_biases() == []
+        writer.log_overlay(_artifact("ART-shr001", now))
+        assert [b["artifact_id"] for b in reader.read_active_biases()] == ["ART-shr001"]
+        writer.deactivate_overlay("ART-shr001", "done", now.isoformat())
+        assert reader.read_active_biases() == []
+
+
+# === Batched Signal Tests ===
+
+def _turn_batch(session_id, turn):
+    sigs = ["intent:tool_query", "domain:system", "task:inspect", "tool:read_file", "outcome:success"]
+    return [(sig, session_id, f"EVT-{turn}-{i}") for i, sig in enumerate(sigs)]
+
+
+class TestBatchedSignals:
+    def test_log_signals_commits_once(self, ho3, tmp_path):
+        """A batch is one ledger commit; accumulators see every event."""
+        batch = _turn_batch("SES-001", 0) + [("domain:system", "SES-002", "EVT-x", {"source": "test"})]
+        with patch("kernel.pristine.assert_append_only") as guard:
+            event_ids = ho3.log_signals(batch)
+        assert guard.call_count == 1
+        assert event_ids == [item[2] for item in batch]
+        lines = (tmp_path / "HOT" / "memory" / "signals.jsonl").read_text().splitlines()
+        assert json.loads(lines[-1])["metadata"]["source"] == "test"
+        acc = ho3.read_signals(signal_id="domain:system")[0]
+        assert acc.count == 2
+        assert acc.session_ids == ["SES-001", "SES-002"]
+        assert ho3.log_signals([]) == []
+
+    def test_check_gates_matches_check_gate(self, ho3):
+        """check_gates returns check_gate's result per signal, in input order."""
+        for turn in range(5):
+            ho3.log_signals(_turn_batch(f"SES-{turn % 3}", turn))
+        now = datetime.now(timezone.utc)
+        ho3.log_overlay({
+            "signal_id": "domain:system", "salience_weight": 0.5,
+            "source_event_ids": ["EVT-0-1"], "content": {},
+            "window_start": (now - timedelta(days=1)).isoformat(),
+            "window_end": now.isoformat(),
+        })
+        ids = ["outcome:success", "domain:system", "sig:unknown"]
+        gates = ho3.check_gates(ids)
+        singles = [ho3.check_gate(sid) for sid in ids]
+        assert [(g.signal_id, g.crossed, g.count, g.session_count, g.already_consolidated, g.reason)
+                for g in gates] == [(g.signal_id, g.crossed, g.count, g.session_count,
+                                     g.already_consolidated, g.reason) for g in singles]
+        assert [g.crossed for g in gates] == [True, False, False]
+        assert gates[1].already_consolidated is True
+        assert gates[0].accumulator.event_ids[-1] == "EVT-4-4"
+        assert gates[2].accumulator is None
+
+    @pytest.mark.skipif(
+        not os.environ.get("CP_HO3_BENCH"),
+        reason="set CP_HO3_BENCH=1 to run the post-turn latency benchmark",
+    )
+    def test_benchmark_turn_latency(self, tmp_path):
+        """Post-turn HO3 work with 10k historical signals: batched vs per-signal."""
+        mem = _ho3_instance(tmp_path)
+        for turn in range(2000):
+            mem.log_signals(_turn_batch(f"SES-{turn % 50}", turn))
+        timings = {}
+        for name in ("per-signal", "batched"):
+            start = time.perf_counter()
+            for turn in range(2000, 2100):
+                batch = _turn_batch(f"SES-{turn % 50}", turn)
+                ids = [item[0] for item in batch]
+                if name == "batched":
+                    mem.log_signals(batch)
+                    mem.check_gates(ids)
+                else:
+                    for item in batch:
+                        mem.log_signal(*item)
+                    for sid in ids:
+                        mem.check_gate(sid)
+                mem.read_active_biases()
+            timings[name] = (time.perf_counter() - start) / 100 * 1000
+            print(f"{name}: {timings[name]:.2f} ms/turn")
+        assert timings["batched"] < timings["per-signal"]
@@ -5,6 +5,22 @@ cryptographic hash chaining for tamper detection (SPEC-025), plus
 rotation, batching, segment Merkle rollups, optional offset indexing,
 and parallel verification to keep the ledger fast as it grows.
 
+When indexing is enabled, each segment also carries a sidecar entry index
+(idx/<segment>.pos + idx/<segment>.keys) maintained in flush(): entry
+ordinal -> byte offset, event_type postings and dedupe keys. Counting,
+tail reads, range reads and dedupe checks use it instead of parsing the
+whole ledger. Legacy segments are indexed lazily on first read. Tail
+reads (read_recent, client start-up) scan segments backwards from EOF.
+Closed, verified segments can be compacted into columnar sidecars
+(idx/<segment>.cols, see ledger_columns.py) that iter_entries() filters on
+before parsing the matching JSONL lines.
+
+Writes are serialized by a per-client lock. transaction() or
+group_commit=True coalesce writes from many callers into one append, and
+fsync_policy ("none" / "per-batch" / "per-entry") picks the durability.
+AsyncLedgerWriter wraps a client for asyncio callers: writes return at
+once and a single writer task appends them off the event loop.
+
 Each entry contains:
 - previous_hash: Hash of prior entry (empty for first)
 - entry_hash: Hash of this entry's content
@@ -26,21 +42,36 @@ Usage:
     valid, issues = client.verify_chain()
 """
 
+import asyncio
+import hashlib
+import io
 import json
+import mmap
 import uuid
 import os
+import struct
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from collections import defaultdict
+import weakref
+
+try:
+    import fcntl
+except ImportError:  # non-POSIX: index appends are serialized per process only
+    fcntl = None
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import OrderedDict, defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
+from itertools import chain
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, DefaultDict, Protocol
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, DefaultDict, Protocol, Union
 
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from kernel.merkle import hash_string, merkle_root
+from kernel.ledger_columns import ColumnarSegment, build_columns, load_columns, write_columns
+from kernel.merkle import MerkleAccumulator, hash_string, merkle_root
 
 
 @dataclass
@@ -81,7 +112,24 @@ DEFAULT_ROTATE_BYTES = 256 * 1024 * 1024  # 256 MB
 DEFAULT_ROTATE_DAILY = True
 DEFAULT_BATCH_SIZE = 1  # legacy behavior (no buffering)
 DEFAULT_BATCH_INTERVAL_SEC = 0.0  # time-based flush disabled by default
+DEFAULT_GROUP_COMMIT_INTERVAL_SEC = 0.05  # background flusher period
+FSYNC_POLICIES = ("none", "per-batch", "per-entry")
+DEFAULT_FSYNC_POLICY = "none"  # legacy behavior (OS decides when to persist)
 DEFAULT_VERIFY_WORKERS = 4
+DEFAULT_VERIFY_RANGE_BYTES = 64 * 1024 * 1024  # process-backend work unit
+DEFAULT_TAIL_BLOCK_BYTES = 64 * 1024  # backward read size for tail scans
+
+# Sidecar entry index: one fixed-width (byte offset, byte length) record per entry
+_POSITION_RECORD = struct.Struct("<QQ")
+# flock is per open file description, so clients in one process also share a thread lock
+_ENTRY_INDEX_THREAD_LOCK = threading.RLock()
+
+# Submission index (idx/<segment>.subidx): header, then records sorted by
+# (8-byte blake2b of submission_id, offset), binary-searched through mmap
+_SUBMISSION_INDEX_MAGIC = b"CPSUBIX1"
+_SUBMISSION_INDEX_HEADER = struct.Struct("<8sQQ?7x")  # magic, records, covered bytes, complete
+_SUBMISSION_RECORD = struct.Struct("<8sQQ")  # key, byte offset, byte length
+DEFAULT_SUBMISSION_INDEX_CACHE = 16  # open submission indexes kept per client
 
 
 def _compute_entry_hash(entry_dict: dict) -> str:
@@ -100,7 +148,7 @@ def _compute_entry_hash(entry_dict: dict) -> str:
     return hash_string(json_str)
 
 
-@dataclass
+@dataclass(slots=True)
 class LedgerEntry:
     """Immutable ledger record with hash chaining (SPEC-025)."""
 
@@ -117,9 +165,38 @@ class LedgerEntry:
     previous_hash: str = ""
     entry_hash: str = ""
 
+    def _content(self) -> Dict[str, Any]:
+        """Shallow field dict without entry_hash (asdict() would deep-copy)."""
+        return {
+            "event_type": self.event_type,
+            "submission_id": self.submission_id,
+            "decision": self.decision,
+            "reason": self.reason,
+            "prompts_used": self.prompts_used,
+            "metadata": self.metadata,
+            "id": self.id,
+            "timestamp": self.timestamp,
+            "previous_hash": self.previous_hash,
+        }
+
+    def seal(self, previous_hash: str) -> bytes:
+        """Chain this entry onto previous_hash and return its ledger line.
+
+        The canonical (sorted-key) serialization is produced once: its
+        SHA256 becomes entry_hash and the same bytes, with entry_hash
+        appended as the last key, are the on-disk line. Hashes are identical
+        to _compute_entry_hash(asdict(entry)).
+        """
+        self.previous_hash = previous_hash
+        canonical = json.dumps(self._content(), sort_keys=True, ensure_ascii=False).encode("utf-8")
+        self.entry_hash = hashlib.sha256(canonical).hexdigest()
+        return b"".join((canonical[:-1], b', "entry_hash": "', self.entry_hash.encode("ascii"), b'"}\n'))
+
     def to_json(self) -> str:
         """Serialize to JSON string."""
-        return json.dumps(asdict(self), ensure_ascii=False)
+        data = self._content()
+        data["entry_hash"] = self.entry_hash
+        return json.dumps(data, ensure_ascii=False)
 
     @classmethod
     def from_json(cls, json_str: str) -> "LedgerEntry":
@@ -128,6 +205,269 @@ class LedgerEntry:
         return cls(**data)
 
 
+def _iter_lines_reversed(
+    path: Path,
+    block_size: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Yield the raw lines of a file from last to first.
+
+    Reads fixed-size blocks backwards from EOF (or from byte `end`) and
+    splits on newlines, so the I/O for a tail read is proportional to the
+    bytes consumed rather than to the file size. Yielded lines exclude the
+    newline and may be blank; callers skip those.
+    """
+    block_size = block_size or DEFAULT_TAIL_BLOCK_BYTES
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        if end is not None:
+            pos = min(pos, end)
+        remainder = b""
+        while pos > 0:
+            size = min(block_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + remainder).split(b"\n")
+            remainder = lines[0]
+            for line in reversed(lines[1:]):
+                yield line
+        yield remainder
+
+
+def _split_line_ranges(path: Path, range_bytes: int) -> List[Tuple[int, int]]:
+    """Split a file into ~range_bytes [start, end) ranges that begin on line starts."""
+    size = path.stat().st_size
+    bounds = [0]
+    with open(path, "rb") as f:
+        pos = max(1, range_bytes)
+        while pos < size:
+            f.seek(pos - 1)
+            f.readline()  # finish the line containing byte pos-1
+            pos = f.tell()
+            if pos >= size:
+                break
+            bounds.append(pos)
+            pos += max(1, range_bytes)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _verify_byte_range(path: str, start: int, end: int) -> Dict[str, Any]:
+    """Verify entries whose lines start in [start, end) of a segment.
+
+    Module-level so process pools can pickle it. The chain link into the
+    range is unknown here, so the first hashed entry's (id, previous_hash)
+    is returned as head_link (unless a legacy entry reset the chain before
+    it) together with the issue-list position where a stitched chain-break
+    belongs; tail_prev is the chain value handed to the next range.
+    """
+    name = Path(path).name
+    issues: List[str] = []
+    prev_local = ""
+    head_link: Optional[Tuple[str, str]] = None
+    head_issue_pos = 0
+    seen_hashed_or_legacy = False
+    last_hash = ""
+    count = 0
+    with open(path, "rb") as f:
+        f.seek(start)
+        offset = start
+        while offset < end:
+            raw = f.readline()
+            if not raw:
+                break
+            offset += len(raw)
+            line = raw.strip()
+            if not line:
+                continue
+            try:
+                entry = LedgerEntry.from_json(line.decode("utf-8"))
+            except Exception:
+                issues.append(f"FAIL: Malformed entry in {name}")
+                continue
+
+            if entry.entry_hash:
+                expected = _compute_entry_hash(entry._content())
+                if entry.entry_hash != expected:
+                    issues.append(f"FAIL: Hash mismatch {entry.id} in {name}")
+                if not seen_hashed_or_legacy:
+                    head_link = (entry.id, entry.previous_hash)
+                    head_issue_pos = len(issues)
+                elif prev_local and entry.previous_hash != prev_local:
+                    issues.append(f"FAIL: Chain break {entry.id} in {name}")
+                prev_local = entry.entry_hash
+                last_hash = entry.entry_hash
+            else:
+                issues.append(f"WARN: Legacy entry {entry.id} lacks entry_hash in {name}")
+                prev_local = ""
+            seen_hashed_or_legacy = True
+            count += 1
+
+    return {
+        "issues": issues,
+        "head_link": head_link,
+        "head_issue_pos": head_issue_pos,
+        "tail_prev": prev_local,
+        "last_hash": last_hash,
+        "count": count,
+    }
+
+
+def _field_needle(value: str) -> Optional[bytes]:
+    """Return bytes that must appear in any raw line whose field equals value.
+
+    Only plain printable-ASCII values qualify: their JSON encoding is the
+    same whatever escaping options the writer used. Anything else returns
+    None and is matched after parsing only.
+    """
+    if not value.isascii() or not value.isprintable() or any(c in value for c in '"\\/'):
+        return None
+    return ('"' + value + '"').encode("ascii")
+
+
+@contextmanager
+def _mapped_segment(path: Path) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Map a segment read-only; empty files yield b"" (mmap rejects size 0).
+
+    Callers must release memoryviews of the mapping before the block exits.
+    """
+    with open(path, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            yield b""
+            return
+        try:
+            yield mapped
+        finally:
+            mapped.close()
+
+
+def _iter_mapped_lines(
+    buf: Union[mmap.mmap, bytes],
+    needles: Optional[List[List[bytes]]] = None,
+) -> Iterator[bytes]:
+    """Yield stripped non-blank lines of a mapped segment.
+
+    With needle groups, the buffer is searched for the first group's needles
+    and only the lines around a hit are checked against the other groups,
+    so non-matching lines are neither copied out of the mapping nor decoded.
+    """
+    size = len(buf)
+    if not size:
+        return
+    if not needles:
+        if isinstance(buf, mmap.mmap):
+            buf.seek(0)
+            readline = buf.readline
+        else:
+            readline = io.BytesIO(buf).readline
+        for raw in iter(readline, b""):
+            line = raw.strip()
+            if line:
+                yield line
+        return
+
+    anchor, rest = needles[0], needles[1:]
+    next_hit = {n: buf.find(n) for n in anchor}
+    while True:
+        hits = [h for h in next_hit.values() if h >= 0]
+        if not hits:
+            return
+        hit = min(hits)
+        start = buf.rfind(b"\n", 0, hit) + 1
+        newline = buf.find(b"\n", hit)
+        end = size if newline < 0 else newline + 1
+        if all(any(buf.find(n, start, end) >= 0 for n in group) for group in rest):
+            line = buf[start:end].strip()
+            if line:
+                yield line
+        for n, h in next_hit.items():
+            if 0 <= h < end:
+                next_hit[n] = buf.find(n, end)
+
+
+@dataclass
+class _SegmentIndex:
+    """In-memory view of one segment's sidecar entry index."""
+
+    positions: List[Tuple[int, int]] = field(default_factory=list)
+    event_types: DefaultDict[str, List[int]] = field(default_factory=lambda: defaultdict(list))
+    dedupe_keys: Set[str] = field(default_factory=set)
+    keys_offset: int = 0  # bytes of the .keys sidecar already folded in
+
+
+def _submission_key(submission_id: str) -> bytes:
+    return hashlib.blake2b(submission_id.encode("utf-8"), digest_size=8).digest()
+
+
+class _SubmissionIndex:
+    """Read-only mmap view of one segment's binary submission index.
+
+    Keys are hashes, so lookups can return a colliding submission's
+    positions; callers compare submission_id after parsing.
+    """
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, self.records, self.covered_bytes, self.complete = _SUBMISSION_INDEX_HEADER.unpack_from(self._buf)
+            expected = _SUBMISSION_INDEX_HEADER.size + self.records * _SUBMISSION_RECORD.size
+            if magic != _SUBMISSION_INDEX_MAGIC or len(self._buf) != expected:
+                raise ValueError(f"Corrupt submission index: {path.name}")
+        except Exception:
+            self._buf.close()
+            raise
+
+    def _key_at(self, i: int) -> bytes:
+        start = _SUBMISSION_INDEX_HEADER.size + i * _SUBMISSION_RECORD.size
+        return self._buf[start:start + 8]
+
+    def lookup(self, submission_id: str) -> List[Tuple[int, int]]:
+        """Return (offset, length) positions recorded for submission_id, in file order."""
+        key = _submission_key(submission_id)
+        lo, hi = 0, self.records
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        positions = []
+        while lo < self.records:
+            rec_key, offset, length = _SUBMISSION_RECORD.unpack_from(
+                self._buf, _SUBMISSION_INDEX_HEADER.size + lo * _SUBMISSION_RECORD.size
+            )
+            if rec_key != key:
+                break
+            positions.append((offset, length))
+            lo += 1
+        return positions
+
+    def close(self) -> None:
+        self._buf.close()
+
+
+def _write_submission_index_file(
+    path: Path,
+    offsets: Dict[str, List[Tuple[int, int]]],
+    covered_bytes: int,
+    complete: bool,
+) -> None:
+    """Write a sorted binary submission index atomically."""
+    records = sorted(
+        (_submission_key(sid), offset, length)
+        for sid, positions in offsets.items()
+        for offset, length in positions
+    )
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(_SUBMISSION_INDEX_HEADER.pack(_SUBMISSION_INDEX_MAGIC, len(records), covered_bytes, complete))
+        f.write(b"".join(_SUBMISSION_RECORD.pack(*rec) for rec in records))
+    os.replace(tmp, path)
+
+
 @dataclass
 class SegmentMeta:
     """Metadata for a rotated ledger segment."""
@@ -142,6 +482,26 @@ class SegmentMeta:
     merkle_root: str
 
 
+@dataclass
+class VerifyCheckpoint:
+    """Verified prefix of a segment, persisted by verify_chain(incremental=True).
+
+    Everything in `segment` before byte `offset` was hash- and chain-checked,
+    entering with `previous_hash` and ending at `entry_hash`. `merkle_root`
+    covers the `count` entry hashes in that prefix; `merkle_state` lets the
+    next run extend it without re-reading them.
+    """
+
+    segment: str
+    offset: int
+    count: int
+    previous_hash: str
+    entry_hash: str
+    merkle_root: str
+    merkle_state: Dict[str, Any]
+    verified_at: str
+
+
 class LedgerProtocol(Protocol):
     """Interface for pluggable ledger backends."""
 
@@ -175,6 +535,9 @@ class LedgerClient:
         batch_interval_sec: float = DEFAULT_BATCH_INTERVAL_SEC,
         enable_index: bool = True,
         tier_context: Optional[TierContext] = None,
+        fsync_policy: str = DEFAULT_FSYNC_POLICY,
+        group_commit: bool = False,
+        group_commit_interval_sec: float = DEFAULT_GROUP_COMMIT_INTERVAL_SEC,
     ):
         """Initialize ledger client.
 
@@ -186,7 +549,14 @@ class LedgerClient:
             batch_interval_sec: max seconds to hold a buffer (0 disables)
             enable_index: write per-segment submission offsets and metadata
             tier_context: Optional tier context for entry stamping
+            fsync_policy: "none", "per-batch" (one fsync per flush) or
+                "per-entry" (fsync after every line)
+            group_commit: buffer writes from all callers and let a background
+                flusher commit them together every group_commit_interval_sec
+            group_commit_interval_sec: background flusher period
         """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync_policy}")
         self.ledger_path = ledger_path or DEFAULT_LEDGER_PATH
         self.tier_context = tier_context
         self.rotate_bytes = rotate_bytes
@@ -194,14 +564,17 @@ class LedgerClient:
         self.batch_size = max(1, batch_size)
         self.batch_interval_sec = batch_interval_sec
         self.enable_index = enable_index
+        self.fsync_policy = fsync_policy
+        self.group_commit = group_commit
+        self.group_commit_interval_sec = group_commit_interval_sec
 
         # Index paths are instance-relative for multi-ledger isolation
         self.index_dir = self.ledger_path.parent / "idx"
         self.segment_index_path = self.ledger_path.parent / "index.jsonl"
+        self.checkpoint_path = self.index_dir / f"{self.ledger_path.stem}.checkpoints.jsonl"
 
         # Runtime state
         self._buffer: List[LedgerEntry] = []
-        self._buffer_bytes: int = 0
         self._last_flush_time = time.time()
         self._segment_hashes: List[str] = []
         self._segment_count: int = 0
@@ -211,9 +584,21 @@ class LedgerClient:
         self._last_timestamp: str = ""
         self._first_timestamp_segment: str = ""
         self._current_offsets: DefaultDict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._entry_indexes: Dict[str, _SegmentIndex] = {}
+        self._columns: Dict[str, Tuple[float, ColumnarSegment]] = {}
+        self._submission_indexes: "OrderedDict[str, Tuple[Tuple[int, int], _SubmissionIndex]]" = OrderedDict()
+
+        # Serializes buffer, chain state and disk appends across threads
+        self._lock = threading.RLock()
+        self._txn_depth = 0
+        self._flusher_stop: Optional[threading.Event] = None
+        self._flusher: Optional[threading.Thread] = None
+        self._flush_error: Optional[BaseException] = None  # raised by the next write/flush/close
 
         self._ensure_ledger_exists()
         self._init_state()
+        if self.group_commit:
+            self._start_flusher()
 
     def _ensure_ledger_exists(self) -> None:
         """Ensure ledger directory and file exist."""
@@ -244,17 +629,17 @@ class LedgerClient:
         """Return (last_entry_hash, last_timestamp) for a segment."""
         if not path.exists():
             return ("", "")
-        last_line = ""
-        with open(path, "r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    last_line = line
+        last_line = b""
+        for line in _iter_lines_reversed(path):
+            if line.strip():
+                last_line = line
+                break
         if not last_line:
             return ("", "")
         try:
             entry = json.loads(last_line)
             return (entry.get("entry_hash", ""), entry.get("timestamp", ""))
-        except json.JSONDecodeError:
+        except (ValueError, AttributeError):
             return ("", "")
 
     def _init_state(self) -> None:
@@ -318,14 +703,26 @@ class LedgerClient:
         with open(self.segment_index_path, "a", encoding="utf-8") as f:
             f.write(json.dumps(asdict(meta)) + "\n")
 
-    def _write_submission_index(self, filename: str, offsets: DefaultDict[str, List[Tuple[int, int]]]):
-        """Persist submission -> offsets index for a segment."""
+    def _submission_index_path(self, segment: Path) -> Path:
+        return self.index_dir / f"{segment.stem}.subidx"
+
+    def _write_submission_index(self, segment: Path, offsets: DefaultDict[str, List[Tuple[int, int]]]):
+        """Persist the binary submission -> offsets index for a segment.
+
+        The index is marked complete when this client's offsets cover every
+        entry in the segment, which lets lookups trust a miss.
+        """
         if not self.enable_index:
             return
-        path = self.index_dir / filename
-        data = {k: v for k, v in offsets.items()}
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f)
+        total = self._sync_entry_index(segment)
+        recorded = sum(len(v) for v in offsets.values())
+        _write_submission_index_file(
+            self._submission_index_path(segment),
+            offsets,
+            covered_bytes=segment.stat().st_size,
+            complete=recorded == total,
+        )
+        self._evict_submission_index(segment.stem)
 
     def _segment_meta_exists(self, segment: str) -> bool:
         """Check if metadata already recorded for a segment."""
@@ -357,7 +754,7 @@ class LedgerClient:
                 last_hash=self._segment_hashes[-1] if self._segment_hashes else "",
                 merkle=merkle_root(self._segment_hashes),
             )
-            self._write_submission_index(self._current_segment_path.stem + ".json", self._current_offsets)
+            self._write_submission_index(self._current_segment_path, self._current_offsets)
 
         # Reset segment tracking
         self._segment_hashes = []
@@ -371,6 +768,195 @@ class LedgerClient:
         new_path.touch()
         self._current_segment_path = new_path
 
+    # ------------------------------------------------------------------
+    # Entry index (ordinal -> offset, event_type postings, dedupe keys)
+    # ------------------------------------------------------------------
+    def _position_index_path(self, segment: Path) -> Path:
+        return self.index_dir / f"{segment.stem}.pos"
+
+    def _keys_index_path(self, segment: Path) -> Path:
+        return self.index_dir / f"{segment.stem}.keys"
+
+    @contextmanager
+    def _entry_index_lock(self, segment: Path) -> Iterator[None]:
+        """Exclusive lock on a segment's sidecar index, across clients and processes.
+
+        Every client sharing the ledger appends to the same .pos/.keys files,
+        so each append re-reads the indexed extent under this lock. The lock
+        file is never deleted, so dropping a torn index stays serialized too.
+        """
+        with _ENTRY_INDEX_THREAD_LOCK:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            with open(self.index_dir / f"{segment.stem}.lock", "a") as f:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def _index_keys(entry: LedgerEntry) -> Tuple[str, Optional[str]]:
+        """Return the (event_type, dedupe_key) pair recorded for an entry."""
+        dedupe_key = entry.metadata.get("_dedupe_key") if isinstance(entry.metadata, dict) else None
+        return entry.event_type, dedupe_key
+
+    def _drop_entry_index(self, segment: Path) -> None:
+        """Discard a segment's sidecar index so it is rebuilt from the segment."""
+        self._entry_indexes.pop(segment.name, None)
+        for path in (self._position_index_path(segment), self._keys_index_path(segment)):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _indexed_extent(self, segment: Path) -> Tuple[int, int]:
+        """Return (entry_count, indexed_end_byte), or (-1, -1) for a torn index."""
+        pos_path = self._position_index_path(segment)
+        size = pos_path.stat().st_size if pos_path.exists() else 0
+        if size % _POSITION_RECORD.size:
+            return (-1, -1)
+        if size == 0:
+            return (0, 0)
+        with open(pos_path, "rb") as f:
+            f.seek(size - _POSITION_RECORD.size)
+            offset, length = _POSITION_RECORD.unpack(f.read(_POSITION_RECORD.size))
+        return (size // _POSITION_RECORD.size, offset + length)
+
+    def _append_entry_index(
+        self,
+        segment: Path,
+        records: List[Tuple[int, int]],
+        keys: List[Tuple[str, Optional[str]]],
+    ) -> int:
+        """Append index records for entries already written to a segment.
+
+        Runs under _entry_index_lock: records another client already indexed
+        are skipped, and if the records do not start at the indexed end
+        (another client's entries in between), the gap is scanned from the
+        segment instead. Returns the segment's indexed entry count.
+
+        Keys lines carry their ordinal so a torn write (keys persisted but
+        positions not) is harmless: the replayed duplicates are skipped.
+        """
+        with self._entry_index_lock(segment):
+            count, end = self._indexed_extent(segment)
+            size = segment.stat().st_size if segment.exists() else 0
+            if count < 0 or end > size:
+                # Torn index or the segment shrank underneath it: rebuild
+                self._drop_entry_index(segment)
+                count, end = 0, 0
+            pending = [(rec, key) for rec, key in zip(records, keys) if rec[0] >= end]
+            if (pending and pending[0][0][0] != end) or (not records and end < size):
+                pending = list(zip(*self._scan_index_records(segment, end)))
+            if not pending:
+                return count
+            with open(self._keys_index_path(segment), "a", encoding="utf-8") as f:
+                for i, (_, (event_type, dedupe_key)) in enumerate(pending):
+                    f.write(json.dumps([count + i, event_type, dedupe_key], ensure_ascii=False) + "\n")
+            with open(self._position_index_path(segment), "ab") as f:
+                f.write(b"".join(_POSITION_RECORD.pack(off, length) for (off, length), _ in pending))
+            return count + len(pending)
+
+    def _scan_index_records(
+        self, segment: Path, start: int,
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[str, Optional[str]]]]:
+        """Parse a segment from byte start and return its index records and keys."""
+        records: List[Tuple[int, int]] = []
+        keys: List[Tuple[str, Optional[str]]] = []
+        with open(segment, "rb") as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                line = raw.strip()
+                if line and raw.endswith(b"\n"):
+                    try:
+                        entry = LedgerEntry.from_json(line.decode("utf-8"))
+                    except (ValueError, TypeError):
+                        # Skip malformed entries (same policy as read_all)
+                        entry = None
+                    if entry is not None:
+                        records.append((offset, len(raw)))
+                        keys.append(self._index_keys(entry))
+                offset += len(raw)
+        return records, keys
+
+    def _sync_entry_index(self, segment: Path) -> int:
+        """Bring a segment's sidecar index up to date and return its entry count.
+
+        Only bytes past the last indexed entry are parsed, so this is a stat
+        plus one 16-byte read when the index is current, and a one-time scan
+        for legacy segments or entries appended by another client.
+        """
+        count, end = self._indexed_extent(segment)
+        size = segment.stat().st_size if segment.exists() else 0
+        if 0 <= count and end == size:
+            return count
+        # Stale, torn or shrunk: the locked append re-checks and scans
+        return self._append_entry_index(segment, [], [])
+
+    def _load_entry_index(self, segment: Path, _retry: bool = True) -> _SegmentIndex:
+        """Return the cached in-memory index for a segment, folding in new records."""
+        count = self._sync_entry_index(segment)
+        idx = self._entry_indexes.setdefault(segment.name, _SegmentIndex())
+        if len(idx.positions) >= count:
+            return idx
+
+        with open(self._position_index_path(segment), "rb") as f:
+            f.seek(len(idx.positions) * _POSITION_RECORD.size)
+            data = f.read((count - len(idx.positions)) * _POSITION_RECORD.size)
+        idx.positions.extend(_POSITION_RECORD.iter_unpack(data))
+
+        keys_path = self._keys_index_path(segment)
+        keyed = sum(len(v) for v in idx.event_types.values())
+        if keys_path.exists():
+            with open(keys_path, "rb") as f:
+                f.seek(idx.keys_offset)
+                for raw in f:
+                    if keyed >= count:
+                        break
+                    idx.keys_offset += len(raw)
+                    try:
+                        ordinal, event_type, dedupe_key = json.loads(raw)
+                    except (ValueError, TypeError):
+                        continue
+                    if ordinal != keyed:
+                        continue
+                    idx.event_types[event_type].append(ordinal)
+                    if dedupe_key is not None:
+                        idx.dedupe_keys.add(dedupe_key)
+                    keyed += 1
+        if keyed < count:
+            # Keys sidecar lost records; rebuild this segment's index once
+            self._drop_entry_index(segment)
+            if _retry:
+                return self._load_entry_index(segment, _retry=False)
+        return idx
+
+    def _read_positions(self, segment: Path, start: int, stop: int) -> List[Tuple[int, int]]:
+        """Read index records [start, stop) without loading the whole index."""
+        if stop <= start:
+            return []
+        cached = self._entry_indexes.get(segment.name)
+        if cached is not None and len(cached.positions) >= stop:
+            return cached.positions[start:stop]
+        with open(self._position_index_path(segment), "rb") as f:
+            f.seek(start * _POSITION_RECORD.size)
+            data = f.read((stop - start) * _POSITION_RECORD.size)
+        return list(_POSITION_RECORD.iter_unpack(data))
+
+    @staticmethod
+    def _read_entries_at(segment: Path, positions: List[Tuple[int, int]]) -> List[LedgerEntry]:
+        """Read and parse the entries at the given (offset, length) positions."""
+        entries: List[LedgerEntry] = []
+        for raw in LedgerClient._read_lines_at(segment, positions):
+            try:
+                entries.append(LedgerEntry(**json.loads(raw)))
+            except (ValueError, TypeError):
+                continue
+        return entries
+
     # ------------------------------------------------------------------
 
     def _get_last_entry_hash(self) -> str:
@@ -398,24 +984,104 @@ class LedgerClient:
             for key, value in tier_meta.items():
                 entry.metadata.setdefault(key, value)
 
-        self._buffer.append(entry)
-        self._buffer_bytes += len(entry.to_json()) + 1
+        # Reject entries seal() cannot serialize before they reach the buffer
+        try:
+            json.dumps(entry._content(), sort_keys=True, ensure_ascii=False)
+        except (TypeError, ValueError) as exc:
+            raise TypeError(f"Ledger entry {entry.id} is not JSON-serializable: {exc}") from exc
 
-        now = time.time()
-        should_flush = len(self._buffer) >= self.batch_size
-        if self.batch_interval_sec > 0 and (now - self._last_flush_time) >= self.batch_interval_sec:
-            should_flush = True
+        with self._lock:
+            self._raise_flush_error()
+            self._buffer.append(entry)
 
-        if should_flush:
-            self.flush()
+            # Inside a transaction or under group commit, someone else flushes
+            if self._txn_depth or self.group_commit:
+                return entry.id
+
+            now = time.time()
+            should_flush = len(self._buffer) >= self.batch_size
+            if self.batch_interval_sec > 0 and (now - self._last_flush_time) >= self.batch_interval_sec:
+                should_flush = True
+
+            if should_flush:
+                self.flush()
 
         return entry.id
 
+    @contextmanager
+    def transaction(self) -> Iterator["LedgerClient"]:
+        """Group the writes made inside the block into one commit.
+
+        Entries are hash-chained and appended together on exit with a single
+        open/write (and one fsync under "per-batch"). Other threads' writes
+        block until the transaction ends, so the batch stays contiguous.
+        The ledger is append-only: entries written before an exception are
+        still committed. Transactions nest; the outermost one commits.
+        """
+        with self._lock:
+            self._txn_depth += 1
+            try:
+                yield self
+            finally:
+                self._txn_depth -= 1
+                if not self._txn_depth:
+                    self.flush()
+
+    def _start_flusher(self) -> None:
+        """Start the background group-commit flusher."""
+        self._flusher_stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=LedgerClient._flusher_loop,
+            args=(weakref.ref(self), self._flusher_stop, self.group_commit_interval_sec),
+            name=f"ledger-flusher-{self.ledger_path.stem}",
+            daemon=True,
+        )
+        self._flusher.start()
+
+    @staticmethod
+    def _flusher_loop(client_ref, stop: threading.Event, interval: float) -> None:
+        # Holds only a weak reference so an unreferenced client can still be collected
+        while not stop.wait(interval):
+            client = client_ref()
+            if client is None:
+                return
+            try:
+                client.flush()
+            except Exception as exc:
+                # The buffer is kept for a retry; the caller sees the error on its next call
+                with client._lock:
+                    client._flush_error = exc
+            del client
+
+    def close(self) -> None:
+        """Stop the group-commit flusher (if any) and flush pending entries."""
+        if self._flusher_stop is not None:
+            self._flusher_stop.set()
+            if self._flusher is not None and self._flusher is not threading.current_thread():
+                self._flusher.join()
+            self._flusher_stop = None
+            self._flusher = None
+        self.flush()
+
     def flush(self) -> None:
-        """Flush buffered entries to disk, handling rotation and indexing."""
-        if not self._buffer:
-            return
+        """Flush buffered entries to disk, handling rotation and indexing.
 
+        All buffered entries are chained and appended with one open and one
+        write (one write per entry under "per-entry" fsync). An error from a
+        background group-commit flush is raised here first.
+        """
+        with self._lock:
+            self._raise_flush_error()
+            if not self._buffer:
+                return
+            self._flush_locked()
+
+    def _raise_flush_error(self) -> None:
+        if self._flush_error is not None:
+            error, self._flush_error = self._flush_error, None
+            raise error
+
+    def _flush_locked(self) -> None:
         # Rotate if needed before writing buffered entries
         if self._needs_rotation():
             self._start_new_segment()
@@ -424,35 +1090,74 @@ class LedgerClient:
         # Lazy import to avoid circular dependency with pristine.py
         from kernel.pristine import assert_append_only
         assert_append_only(path)
-        with open(path, "a", encoding="utf-8") as f:
-            for entry in self._buffer:
-                entry.previous_hash = self._last_hash
-                entry_dict = asdict(entry)
-                entry.entry_hash = _compute_entry_hash(entry_dict)
-
-                line = entry.to_json()
+        records: List[Tuple[int, int]] = []
+        keys: List[Tuple[str, Optional[str]]] = []
+
+        # Seal into locals: chain and index state only move once bytes are written
+        sealed: List[Tuple[LedgerEntry, bytes]] = []
+        previous_hash = self._last_hash
+        for entry in self._buffer:
+            data = entry.seal(previous_hash)
+            previous_hash = entry.entry_hash
+            sealed.append((entry, data))
+
+        committed = 0
+        try:
+            # Binary append so offsets and lengths are exact byte counts
+            with open(path, "ab") as f:
                 offset = f.tell()
-                f.write(line + "\n")
-
-                # Update chain state
-                self._last_hash = entry.entry_hash
-                self._last_timestamp = entry.timestamp
-                self._segment_hashes.append(entry.entry_hash)
-                self._segment_count += 1
-                self._segment_bytes += len(line) + 1
-                if not self._first_timestamp_segment:
-                    self._first_timestamp_segment = entry.timestamp
-
+                if self.fsync_policy == "per-entry":
+                    for entry, data in sealed:
+                        f.write(data)
+                        f.flush()
+                        os.fsync(f.fileno())
+                        self._commit_entry(entry, data, offset, records, keys)
+                        offset += len(data)
+                        committed += 1
+                else:
+                    f.write(b"".join(data for _, data in sealed))
+                    if self.fsync_policy == "per-batch":
+                        f.flush()
+                        os.fsync(f.fileno())
+                    for entry, data in sealed:
+                        self._commit_entry(entry, data, offset, records, keys)
+                        offset += len(data)
+                    committed = len(sealed)
+        finally:
+            # Entries that reached disk leave the buffer even if a later one failed
+            if committed:
                 if self.enable_index:
-                    self._current_offsets[entry.submission_id].append((offset, len(line) + 1))
+                    self._append_entry_index(path, records, keys)
+                del self._buffer[:committed]
+                self._last_flush_time = time.time()
 
-        self._buffer.clear()
-        self._buffer_bytes = 0
-        self._last_flush_time = time.time()
+    def _commit_entry(
+        self,
+        entry: LedgerEntry,
+        data: bytes,
+        offset: int,
+        records: List[Tuple[int, int]],
+        keys: List[Tuple[str, Optional[str]]],
+    ) -> None:
+        """Advance chain and index state past an entry written at offset."""
+        self._last_hash = entry.entry_hash
+        self._last_timestamp = entry.timestamp
+        self._segment_hashes.append(entry.entry_hash)
+        self._segment_count += 1
+        self._segment_bytes += len(data)
+        if not self._first_timestamp_segment:
+            self._first_timestamp_segment = entry.timestamp
+
+        if self.enable_index:
+            self._current_offsets[entry.submission_id].append((offset, len(data)))
+            records.append((offset, len(data)))
+            keys.append(self._index_keys(entry))
 
     def __del__(self):
         """Best-effort flush on object destruction."""
         try:
+            if self._flusher_stop is not None:
+                self._flusher_stop.set()
             self.flush()
             if self.enable_index and self._segment_count > 0:
                 # If meta not yet recorded for this active segment, write it now
@@ -468,7 +1173,7 @@ class LedgerClient:
                         last_hash=self._segment_hashes[-1] if self._segment_hashes else "",
                         merkle=merkle_root(self._segment_hashes),
                     )
-                    self._write_submission_index((self._current_segment_path or self.ledger_path).stem + ".json", self._current_offsets)
+                    self._write_submission_index(self._current_segment_path or self.ledger_path, self._current_offsets)
         except Exception:
             # Avoid raising during GC
             pass
@@ -479,19 +1184,231 @@ class LedgerClient:
         Returns:
             List of all entries in order
         """
-        entries: List[LedgerEntry] = []
-        segments = self._list_segments()
-        for seg in segments:
-            with open(seg, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
+        return list(self.iter_entries())
+
+    def _load_segment_metas(self) -> Dict[str, SegmentMeta]:
+        """Load recorded SegmentMeta by segment filename (later records win)."""
+        metas: Dict[str, SegmentMeta] = {}
+        if not self.segment_index_path.exists():
+            return metas
+        with open(self.segment_index_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    meta = SegmentMeta(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+                metas[meta.segment] = meta
+        return metas
+
+    def _segment_outside_window(
+        self,
+        segment: Path,
+        meta: Optional[SegmentMeta],
+        since: Optional[str],
+        until: Optional[str],
+    ) -> bool:
+        """Decide whether a whole segment falls outside [since, until].
+
+        SegmentMeta is trusted for the upper bound only when it still
+        describes every byte of the segment. Its first_timestamp reflects
+        only what the finalizing client wrote, so the lower bound is read
+        from the segment's first line instead.
+        """
+        if since:
+            if meta is not None and meta.count and meta.bytes == segment.stat().st_size:
+                last_ts = meta.last_timestamp
+            else:
+                last_ts = self._scan_last_entry(segment)[1]
+            if last_ts and last_ts < since:
+                return True
+        if until:
+            with open(segment, "rb") as f:
+                for raw in f:
+                    if raw.strip():
                         try:
-                            entries.append(LedgerEntry.from_json(line))
-                        except (json.JSONDecodeError, TypeError):
-                            # Skip malformed entries
-                            pass
-        return entries
+                            first_ts = json.loads(raw).get("timestamp", "")
+                        except (ValueError, AttributeError):
+                            first_ts = ""
+                        if first_ts and first_ts > until:
+                            return True
+                        break
+        return False
+
+    def iter_entries(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        submission_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        session_id: Optional[str] = None,
+    ) -> Iterator[LedgerEntry]:
+        """Stream ledger entries in order, filtering before materializing.
+
+        Segments whose timestamp bounds fall outside [since, until] are
+        skipped unopened. Segments with a current columnar sidecar are
+        filtered on its columns and only the matching lines are read.
+        Otherwise raw lines are pre-filtered on cheap byte substrings of the
+        requested values before json.loads, and only matching records become
+        LedgerEntry objects, so memory stays flat regardless of ledger size.
+
+        Args:
+            event_types: Only yield entries whose event_type is in this set
+            submission_id: Only yield entries for this submission
+            session_id: Only yield entries whose metadata.session_id matches
+            since: ISO timestamp lower bound (inclusive)
+            until: ISO timestamp upper bound (inclusive)
+
+        Yields:
+            Matching entries in ledger order
+        """
+        types = set(event_types) if event_types is not None else None
+        if types is not None and not types:
+            return
+
+        needles: List[List[bytes]] = []
+        if types is not None:
+            type_needles = [_field_needle(t) for t in types]
+            if all(n is not None for n in type_needles):
+                needles.append(type_needles)
+        for value in (submission_id, session_id):
+            if value is not None:
+                needle = _field_needle(value)
+                if needle is not None:
+                    needles.append([needle])
+
+        def matches(data: Dict[str, Any]) -> bool:
+            if types is not None and data.get("event_type") not in types:
+                return False
+            if submission_id is not None and data.get("submission_id") != submission_id:
+                return False
+            if session_id is not None and (data.get("metadata") or {}).get("session_id") != session_id:
+                return False
+            ts = data.get("timestamp", "")
+            if since and ts < since:
+                return False
+            if until and ts > until:
+                return False
+            return True
+
+        metas = self._load_segment_metas() if (since or until) else {}
+        for seg in self._list_segments():
+            cols = self._load_columns(seg)
+            if cols is not None:
+                rows = cols.select(types, submission_id, session_id, since, until)
+                lines = self._read_lines_at(seg, [cols.position(r) for r in rows])
+            else:
+                if (since or until) and self._segment_outside_window(seg, metas.get(seg.name), since, until):
+                    continue
+                lines = self._iter_filtered_lines(seg, needles)
+            for raw in lines:
+                try:
+                    data = json.loads(raw)
+                    if not matches(data):
+                        continue
+                    entry = LedgerEntry(**data)
+                except (ValueError, TypeError, AttributeError):
+                    # Skip malformed entries
+                    continue
+                yield entry
+
+    @staticmethod
+    def _iter_filtered_lines(segment: Path, needles: List[List[bytes]], start: int = 0) -> Iterator[bytes]:
+        """Yield non-blank lines from byte start on containing one needle from every group."""
+        with _mapped_segment(segment) as buf:
+            yield from _iter_mapped_lines(buf[start:] if start else buf, needles)
+
+    @staticmethod
+    def _read_lines_at(segment: Path, positions: List[Tuple[int, int]]) -> Iterator[bytes]:
+        """Yield the raw lines at the given (offset, length) positions.
+
+        Lines are sliced from the mapping as memoryviews and copied out one
+        at a time, so only the requested bytes are touched.
+        """
+        if not positions:
+            return
+        with _mapped_segment(segment) as buf, memoryview(buf) as view:
+            for offset, length in positions:
+                raw = view[offset:offset + length]
+                try:
+                    line = bytes(raw).strip()
+                finally:
+                    raw.release()
+                yield line
+
+    # ------------------------------------------------------------------
+    # Columnar compaction of closed segments
+    # ------------------------------------------------------------------
+    def _columns_path(self, segment: Path) -> Path:
+        return self.index_dir / f"{segment.stem}.cols"
+
+    def _load_columns(self, segment: Path) -> Optional[ColumnarSegment]:
+        """Return the segment's columnar sidecar if it still matches the segment."""
+        path = self._columns_path(segment)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            self._columns.pop(segment.name, None)
+            return None
+        cached = self._columns.get(segment.name)
+        if cached is not None and cached[0] == mtime:
+            cols = cached[1]
+        else:
+            cols = load_columns(path)
+            if cols is None:
+                return None
+            self._columns[segment.name] = (mtime, cols)
+        # Any byte appended or removed since compaction makes the sidecar stale
+        try:
+            if segment.stat().st_size != cols.source_bytes:
+                return None
+        except OSError:
+            return None
+        return cols
+
+    def _closed_segments(self) -> List[Path]:
+        """Segments that are no longer written to (all but the active one)."""
+        segments = self._list_segments()
+        active = {segments[-1]} if segments else set()
+        if self._current_segment_path is not None:
+            active.add(self._current_segment_path)
+        return [seg for seg in segments if seg not in active]
+
+    def compact_segment(self, segment: Path) -> Path:
+        """Write the columnar sidecar for a closed segment after verifying it.
+
+        The JSONL segment is left untouched and stays authoritative for
+        hashing; the sidecar is only a filter accelerator.
+
+        Returns:
+            Path of the written sidecar
+
+        Raises:
+            ValueError: if the segment is still active or fails verification
+        """
+        segment = Path(segment)
+        if segment not in self._closed_segments():
+            raise ValueError(f"Cannot compact active or unknown segment: {segment.name}")
+        result = _verify_byte_range(str(segment), 0, segment.stat().st_size)
+        failures = [i for i in result["issues"] if i.startswith("FAIL")]
+        if failures:
+            raise ValueError(f"Refusing to compact unverified segment {segment.name}: {failures[0]}")
+        path = self._columns_path(segment)
+        write_columns(build_columns(segment), path)
+        return path
+
+    def compact_closed_segments(self) -> List[Path]:
+        """Compact every closed segment that lacks a current sidecar.
+
+        Returns:
+            Paths of the sidecars written by this call
+        """
+        written = []
+        for seg in self._closed_segments():
+            if self._load_columns(seg) is None:
+                written.append(self.compact_segment(seg))
+        return written
 
     def read_by_submission(self, submission_id: str) -> List[LedgerEntry]:
         """Read entries for a specific submission.
@@ -504,67 +1421,106 @@ class LedgerClient:
         """
         return self.read_by_submission_fast(submission_id)
 
-    def _load_submission_index(self, segment_stem: str) -> Optional[Dict[str, List[Tuple[int, int]]]]:
-        """Load per-segment submission offset index if present."""
-        path = self.index_dir / f"{segment_stem}.json"
-        if not path.exists():
+    def _evict_submission_index(self, stem: str) -> None:
+        cached = self._submission_indexes.pop(stem, None)
+        if cached is not None:
+            cached[1].close()
+
+    def _open_submission_index(self, segment: Path) -> Optional[_SubmissionIndex]:
+        """Return the segment's mapped submission index via a small LRU.
+
+        Entries are revalidated against the index file's mtime and size, so
+        an index rewritten by another client is remapped.
+        """
+        path = self._submission_index_path(segment)
+        try:
+            st = path.stat()
+        except OSError:
+            self._evict_submission_index(segment.stem)
             return None
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._submission_indexes.get(segment.stem)
+        if cached is not None and cached[0] == stamp:
+            self._submission_indexes.move_to_end(segment.stem)
+            return cached[1]
+        self._evict_submission_index(segment.stem)
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return {k: [tuple(x) for x in v] for k, v in data.items()}
-        except Exception:
+            index = _SubmissionIndex(path)
+        except (OSError, ValueError, struct.error):
             return None
+        self._submission_indexes[segment.stem] = (stamp, index)
+        while len(self._submission_indexes) > DEFAULT_SUBMISSION_INDEX_CACHE:
+            _, (_, oldest) = self._submission_indexes.popitem(last=False)
+            oldest.close()
+        return index
 
     def read_by_submission_fast(self, submission_id: str) -> List[LedgerEntry]:
-        """Read entries for a submission using per-segment offset indices when available."""
+        """Read entries for a submission using per-segment offset indices when available.
+
+        A complete index answers for the bytes it covers; bytes appended
+        after it was written are needle-scanned. Segments without a usable
+        index fall back to a needle scan of the whole segment.
+        """
         results: List[LedgerEntry] = []
-        segments = self._list_segments()
-        for seg in segments:
-            stem = seg.stem
-            index = self._load_submission_index(stem)
-            if index and submission_id in index:
-                offsets = index[submission_id]
-                with open(seg, "r", encoding="utf-8") as f:
-                    for offset, length in offsets:
-                        f.seek(offset)
-                        line = f.read(length)
-                        if not line:
-                            continue
-                        try:
-                            results.append(LedgerEntry.from_json(line.strip()))
-                        except Exception:
-                            continue
+        needle = _field_needle(submission_id)
+        needles = [[needle]] if needle else []
+        for seg in self._list_segments():
+            index = self._open_submission_index(seg)
+            size = seg.stat().st_size
+            if index is not None and index.complete and index.covered_bytes <= size:
+                lines: Iterable[bytes] = self._read_lines_at(seg, index.lookup(submission_id))
+                if index.covered_bytes < size:
+                    # Entries appended since the index was written
+                    lines = chain(lines, self._iter_filtered_lines(seg, needles, start=index.covered_bytes))
             else:
-                # Fallback scan for this segment only
-                with open(seg, "r", encoding="utf-8") as f:
-                    for line in f:
-                        if not line.strip():
-                            continue
-                        try:
-                            entry = LedgerEntry.from_json(line.strip())
-                            if entry.submission_id == submission_id:
-                                results.append(entry)
-                        except Exception:
-                            continue
+                # Fallback scan for this segment only; decode just candidate lines
+                lines = self._iter_filtered_lines(seg, needles)
+            for line in lines:
+                if not line:
+                    continue
+                try:
+                    entry = LedgerEntry(**json.loads(line))
+                except Exception:
+                    continue
+                if entry.submission_id == submission_id:
+                    results.append(entry)
         return results
 
     def count(self) -> int:
         """Count total entries in ledger."""
-        return len(self.read_all())
+        if not self.enable_index:
+            return len(self.read_all())
+        return sum(self._sync_entry_index(seg) for seg in self._list_segments())
 
-    def verify_chain(self) -> Tuple[bool, List[str]]:
+    def verify_chain(
+        self,
+        incremental: bool = False,
+        revalidate_closed: bool = False,
+    ) -> Tuple[bool, List[str]]:
         """Verify ledger chain integrity.
 
         Checks:
         1. Each entry's entry_hash matches computed hash
         2. Each entry's previous_hash matches prior entry's entry_hash
 
+        Args:
+            incremental: resume from persisted VerifyCheckpoints and only
+                re-hash bytes appended since the last run (O(delta))
+            revalidate_closed: also re-hash closed segments and compare
+                them to their recorded SegmentMeta.merkle_root
+
         Returns:
             Tuple of (is_valid, list_of_issues)
             - is_valid: True if no FAIL issues
             - issues: List of WARN (legacy) or FAIL (tampered) messages
         """
+        if incremental or revalidate_closed:
+            issues = self._verify_chain_incremental() if incremental else self.verify_chain()[1]
+            if revalidate_closed:
+                issues.extend(self.verify_segment_roots()[1])
+            is_valid = not any(issue.startswith("FAIL") for issue in issues)
+            return (is_valid, issues)
+
         issues = []
         entries = self.read_all()
 
@@ -577,8 +1533,7 @@ class LedgerClient:
                 continue
 
             # Verify entry_hash matches computed hash
-            entry_dict = asdict(entry)
-            expected_hash = _compute_entry_hash(entry_dict)
+            expected_hash = _compute_entry_hash(entry._content())
             if entry.entry_hash != expected_hash:
                 issues.append(f"FAIL: Entry {entry.id} content tampered (hash mismatch)")
 
@@ -591,76 +1546,220 @@ class LedgerClient:
         is_valid = not any(issue.startswith("FAIL") for issue in issues)
         return (is_valid, issues)
 
-    def verify_chain_parallel(self, workers: int = DEFAULT_VERIFY_WORKERS) -> Tuple[bool, List[str]]:
-        """Verify ledger integrity using per-segment parallelism."""
-        segments = self._list_segments()
-        if not segments:
-            return True, []
+    def _load_verify_checkpoints(self) -> Dict[str, VerifyCheckpoint]:
+        """Load the latest VerifyCheckpoint per segment."""
+        checkpoints: Dict[str, VerifyCheckpoint] = {}
+        if not self.checkpoint_path.exists():
+            return checkpoints
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    cp = VerifyCheckpoint(**json.loads(line))
+                except (ValueError, TypeError):
+                    continue
+                checkpoints[cp.segment] = cp
+        return checkpoints
 
+    def _write_verify_checkpoints(self, checkpoints: List[VerifyCheckpoint]) -> None:
+        """Append verified-prefix records for segments that advanced."""
+        if not checkpoints:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            for cp in checkpoints:
+                f.write(json.dumps(asdict(cp)) + "\n")
+
+    def _checkpoint_anchor_ok(self, segment: Path, cp: VerifyCheckpoint) -> bool:
+        """Check the entry ending at the checkpoint offset is still the one verified."""
+        if cp.offset == 0:
+            return True
+        lines = _iter_lines_reversed(segment, end=cp.offset)
+        if next(lines, None) != b"":
+            # Checkpoints always end on a newline boundary
+            return False
+        for raw in lines:
+            raw = raw.strip()
+            if not raw:
+                continue
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                return False
+            if not isinstance(data, dict) or data.get("entry_hash", "") != cp.entry_hash:
+                return False
+            return not cp.entry_hash or _compute_entry_hash(data) == cp.entry_hash
+        return False
+
+    def _verify_chain_incremental(self) -> List[str]:
+        """verify_chain() that resumes each segment from its last checkpoint.
+
+        A checkpoint is reused only if the segment has not shrunk, the
+        chain still enters the segment with the same previous_hash, and the
+        anchor entry at the checkpoint offset is unchanged; otherwise the
+        segment is verified from its first byte. Checkpoints only advance
+        over segments with no FAIL issues, so failures are re-reported;
+        WARN issues are reported once, by the run that verifies them.
+        """
         issues: List[str] = []
-        results: Dict[str, Dict[str, Any]] = {}
+        checkpoints = self._load_verify_checkpoints()
+        advanced: List[VerifyCheckpoint] = []
+        prev_hash = ""
+
+        for seg in self._list_segments():
+            size = seg.stat().st_size
+            entering = prev_hash
+            cp = checkpoints.get(seg.name)
+            start, count, acc = 0, 0, MerkleAccumulator()
+            if cp is not None:
+                if cp.offset > size:
+                    issues.append(f"FAIL: Segment {seg.name} shrank below verified checkpoint ({size} < {cp.offset} bytes)")
+                elif cp.previous_hash == entering and self._checkpoint_anchor_ok(seg, cp):
+                    start, count = cp.offset, cp.count
+                    acc = MerkleAccumulator.from_state(cp.merkle_state)
+                    prev_hash = cp.entry_hash
+                elif cp.previous_hash == entering:
+                    issues.append(f"FAIL: Segment {seg.name} verified prefix modified (checkpoint anchor mismatch)")
+
+            seg_issues: List[str] = []
+            resume = (start, count, prev_hash, acc.to_state())
+            with open(seg, "rb") as f:
+                f.seek(start)
+                offset = start
+                for raw in f:
+                    offset += len(raw)
+                    if not raw.endswith(b"\n"):
+                        # Unterminated tail may still be mid-write: check, don't checkpoint
+                        resume = (offset - len(raw), count, prev_hash, acc.to_state())
+                    line = raw.strip()
+                    if line:
+                        try:
+                            entry = LedgerEntry.from_json(line.decode("utf-8"))
+                        except (ValueError, TypeError):
+                            entry = None
+                        if entry is not None:
+                            if not entry.entry_hash:
+                                seg_issues.append(f"WARN: Entry {entry.id} is legacy (no entry_hash)")
+                                prev_hash = ""
+                            else:
+                                if entry.entry_hash != _compute_entry_hash(entry._content()):
+                                    seg_issues.append(f"FAIL: Entry {entry.id} content tampered (hash mismatch)")
+                                if entry.previous_hash != prev_hash:
+                                    seg_issues.append(f"FAIL: Entry {entry.id} chain broken (previous_hash mismatch)")
+                                prev_hash = entry.entry_hash
+                                acc.add(entry.entry_hash)
+                                count += 1
+                    if raw.endswith(b"\n"):
+                        resume = (offset, count, prev_hash, acc.to_state())
+            issues.extend(seg_issues)
+
+            end, end_count, end_hash, end_state = resume
+            if not any(i.startswith("FAIL") for i in seg_issues) and (cp is None or end != cp.offset or start == 0):
+                advanced.append(VerifyCheckpoint(
+                    segment=seg.name,
+                    offset=end,
+                    count=end_count,
+                    previous_hash=entering,
+                    entry_hash=end_hash,
+                    merkle_root=MerkleAccumulator.from_state(end_state).root(),
+                    merkle_state=end_state,
+                    verified_at=datetime.now(timezone.utc).isoformat(),
+                ))
+
+        self._write_verify_checkpoints(advanced)
+        return issues
+
+    def verify_segment_roots(self) -> Tuple[bool, List[str]]:
+        """Re-hash closed segments and compare to their SegmentMeta.merkle_root.
+
+        A SegmentMeta describes the entries its finalizing client wrote,
+        which are the last `count` entries of the segment, so the root is
+        recomputed over that tail.
 
-        def verify_segment(path: Path) -> Dict[str, Any]:
-            seg_issues = []
-            prev_hash_local = ""
-            hashes = []
-            first_hash = ""
-            last_hash = ""
-            count = 0
-            first_ts = ""
-            last_ts = ""
-
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
+        Returns:
+            Tuple of (is_valid, list_of_issues)
+        """
+        issues: List[str] = []
+        metas = self._load_segment_metas()
+        for seg in self._list_segments():
+            meta = metas.get(seg.name)
+            if meta is None or not meta.merkle_root:
+                continue
+            hashes: List[str] = []
+            with open(seg, "rb") as f:
+                for raw in f:
+                    raw = raw.strip()
+                    if not raw:
                         continue
                     try:
-                        entry = LedgerEntry.from_json(line)
-                    except Exception:
-                        seg_issues.append(f"FAIL: Malformed entry in {path.name}")
+                        entry = LedgerEntry.from_json(raw.decode("utf-8"))
+                    except (ValueError, TypeError):
                         continue
-
                     if entry.entry_hash:
-                        expected = _compute_entry_hash(asdict(entry))
-                        if entry.entry_hash != expected:
-                            seg_issues.append(f"FAIL: Hash mismatch {entry.id} in {path.name}")
-
-                        if prev_hash_local and entry.previous_hash != prev_hash_local:
-                            seg_issues.append(f"FAIL: Chain break {entry.id} in {path.name}")
-
-                        prev_hash_local = entry.entry_hash
-                        hashes.append(entry.entry_hash)
-                        if not first_hash:
-                            first_hash = entry.entry_hash
-                        last_hash = entry.entry_hash
-                    else:
-                        seg_issues.append(f"WARN: Legacy entry {entry.id} lacks entry_hash in {path.name}")
-                        prev_hash_local = ""
-                        hashes = []
-
-                    if not first_ts:
-                        first_ts = entry.timestamp
-                    last_ts = entry.timestamp
-                    count += 1
-
-            return {
-                "path": path,
-                "issues": seg_issues,
-                "first_hash": first_hash,
-                "last_hash": last_hash,
-                "merkle": merkle_root(hashes) if hashes else "",
-                "count": count,
-                "first_ts": first_ts,
-                "last_ts": last_ts,
-            }
+                        hashes.append(_compute_entry_hash(entry._content()))
+            if len(hashes) < meta.count:
+                issues.append(f"FAIL: Segment {seg.name} has {len(hashes)} entries, metadata records {meta.count}")
+            elif merkle_root(hashes[len(hashes) - meta.count:]) != meta.merkle_root:
+                issues.append(f"FAIL: Segment {seg.name} Merkle root mismatch")
+        return (not any(i.startswith("FAIL") for i in issues), issues)
+
+    def verify_chain_parallel(
+        self,
+        workers: int = DEFAULT_VERIFY_WORKERS,
+        backend: str = "thread",
+        range_bytes: int = DEFAULT_VERIFY_RANGE_BYTES,
+    ) -> Tuple[bool, List[str]]:
+        """Verify ledger integrity in parallel.
+
+        The "thread" backend verifies one segment per task. Hashing is pure
+        Python, so for real multi-core speedup use the "process" backend: it
+        also splits large segments into ~range_bytes ranges on line
+        boundaries, verifies each range in a worker process and stitches the
+        chain links between ranges here. Both report the same issues.
+
+        Args:
+            workers: max concurrent workers
+            backend: "thread" or "process"
+            range_bytes: target range size for the process backend
+
+        Returns:
+            Tuple of (is_valid, list_of_issues)
+        """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Unknown verify backend: {backend}")
+        segments = self._list_segments()
+        if not segments:
+            return True, []
+
+        tasks: List[Tuple[str, int, int]] = []
+        for seg in segments:
+            if backend == "process":
+                tasks.extend((str(seg), lo, hi) for lo, hi in _split_line_ranges(seg, range_bytes))
+            else:
+                tasks.append((str(seg), 0, seg.stat().st_size))
+
+        executor_cls = ProcessPoolExecutor if backend == "process" else ThreadPoolExecutor
+        with executor_cls(max_workers=workers) as executor:
+            ranges = list(executor.map(_verify_byte_range, *zip(*tasks)))
 
-        with ThreadPoolExecutor(max_workers=workers) as executor:
-            future_map = {executor.submit(verify_segment, p): p for p in segments}
-            for fut in as_completed(future_map):
-                res = fut.result()
-                results[res["path"].name] = res
-                issues.extend(res["issues"])
+        # Stitch ranges back into per-segment results, in order
+        issues: List[str] = []
+        results: Dict[str, Dict[str, Any]] = {}
+        for (path, _lo, _hi), rng in zip(tasks, ranges):
+            name = Path(path).name
+            res = results.setdefault(name, {"issues": [], "last_hash": "", "count": 0, "carry": ""})
+            range_issues = list(rng["issues"])
+            head = rng["head_link"]
+            if head and res["carry"] and head[1] != res["carry"]:
+                range_issues.insert(rng["head_issue_pos"], f"FAIL: Chain break {head[0]} in {name}")
+            if rng["count"]:
+                res["carry"] = rng["tail_prev"]
+            res["last_hash"] = rng["last_hash"] or res["last_hash"]
+            res["count"] += rng["count"]
+            res["issues"].extend(range_issues)
+        for res in results.values():
+            issues.extend(res["issues"])
 
         # Check cross-segment previous_hash continuity
         prev_last_hash = ""
@@ -693,13 +1792,8 @@ class LedgerClient:
         Returns:
             Merkle root hash, or "" if no entries with hashes
         """
-        entries = self.read_all()
-
-        if since:
-            entries = [e for e in entries if e.timestamp >= since]
-
         # Only include entries with hashes
-        hashes = [e.entry_hash for e in entries if e.entry_hash]
+        hashes = [e.entry_hash for e in self.iter_entries(since=since) if e.entry_hash]
 
         if not hashes:
             return ""
@@ -788,7 +1882,7 @@ class LedgerClient:
             - is_valid: True if no FAIL issues
             - issues: List of WARN/FAIL/INFO messages
         """
-        entries = self.read_all()
+        entries = self.read_entries_range(0, 1)
         issues: List[str] = []
 
         if not entries:
@@ -822,7 +1916,7 @@ class LedgerClient:
             - is_valid: True if chain link is valid
             - issues: List of WARN/FAIL/INFO messages
         """
-        entries = self.read_all()
+        entries = self.read_entries_range(0, 1)
         issues: List[str] = []
 
         if not entries or entries[0].event_type != "GENESIS":
@@ -841,7 +1935,7 @@ class LedgerClient:
             return False, issues
 
         parent_client = LedgerClient(ledger_path=parent_ledger_path)
-        parent_entries = parent_client.read_all()
+        parent_entries = parent_client.read_recent(1)
 
         if not parent_entries:
             issues.append("FAIL: Parent ledger is empty")
@@ -867,7 +1961,7 @@ class LedgerClient:
         Returns:
             Hash string if ledger has entries with hashes, None otherwise
         """
-        entries = self.read_all()
+        entries = self.read_recent(1)
         if not entries:
             return None
         # Return last entry's hash
@@ -885,6 +1979,11 @@ class LedgerClient:
         Returns:
             True if an entry with this dedupe_key exists
         """
+        if self.enable_index:
+            return any(
+                dedupe_key in self._load_entry_index(seg).dedupe_keys
+                for seg in self._list_segments()
+            )
         entries = self.read_all()
         for entry in entries:
             if entry.metadata.get("_dedupe_key") == dedupe_key:
@@ -900,8 +1999,14 @@ class LedgerClient:
         Returns:
             List of matching entries in order
         """
-        entries = self.read_all()
-        return [e for e in entries if e.event_type == event_type]
+        if not self.enable_index:
+            return list(self.iter_entries(event_types=(event_type,)))
+        results: List[LedgerEntry] = []
+        for seg in self._list_segments():
+            idx = self._load_entry_index(seg)
+            ordinals = idx.event_types.get(event_type, [])
+            results.extend(self._read_entries_at(seg, [idx.positions[i] for i in ordinals]))
+        return results
 
     def read_entries_range(self, start: int, end: int) -> List[LedgerEntry]:
         """Read entries in a specific index range.
@@ -913,8 +2018,22 @@ class LedgerClient:
         Returns:
             List of entries in the range
         """
-        entries = self.read_all()
-        return entries[start:end]
+        if not self.enable_index:
+            entries = self.read_all()
+            return entries[start:end]
+        segments = self._list_segments()
+        counts = [self._sync_entry_index(seg) for seg in segments]
+        start, end, _ = slice(start, end).indices(sum(counts))
+        results: List[LedgerEntry] = []
+        base = 0
+        for seg, count in zip(segments, counts):
+            lo, hi = max(start - base, 0), min(end - base, count)
+            if lo < hi:
+                results.extend(self._read_entries_at(seg, self._read_positions(seg, lo, hi)))
+            base += count
+            if base >= end:
+                break
+        return results
 
     def read_recent(self, limit: int = 10) -> List[LedgerEntry]:
         """Read the most recent entries from the ledger.
@@ -925,8 +2044,213 @@ class LedgerClient:
         Returns:
             List of most recent entries, newest last
         """
-        entries = self.read_all()
-        return entries[-limit:] if len(entries) > limit else entries
+        if limit <= 0:
+            entries = self.read_all()
+            return entries[-limit:] if len(entries) > limit else entries
+        # Walk segments newest-first, reading each one backwards from EOF
+        newest_first: List[LedgerEntry] = []
+        for seg in reversed(self._list_segments()):
+            for line in _iter_lines_reversed(seg):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    newest_first.append(LedgerEntry.from_json(line.decode("utf-8")))
+                except (ValueError, TypeError):
+                    # Skip malformed entries
+                    continue
+                if len(newest_first) >= limit:
+                    return newest_first[::-1]
+        return newest_first[::-1]
+
+    def iter_entries_reversed(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        submission_id: Optional[str] = None,
+    ) -> Iterator[LedgerEntry]:
+        """Stream matching entries newest-first.
+
+        Segments are read backwards from EOF and lines are pre-filtered on
+        the same byte needles as iter_entries(), so finding the latest
+        matching entry only touches the ledger's tail.
+        """
+        types = set(event_types) if event_types is not None else None
+        if types is not None and not types:
+            return
+        needles: List[List[bytes]] = []
+        if types is not None:
+            type_needles = [_field_needle(t) for t in types]
+            if all(n is not None for n in type_needles):
+                needles.append(type_needles)
+        if submission_id is not None:
+            needle = _field_needle(submission_id)
+            if needle is not None:
+                needles.append([needle])
+
+        for seg in reversed(self._list_segments()):
+            for line in _iter_lines_reversed(seg):
+                if not all(any(n in line for n in group) for group in needles):
+                    continue
+                try:
+                    entry = LedgerEntry.from_json(line.decode("utf-8"))
+                except (ValueError, TypeError):
+                    # Skip malformed entries
+                    continue
+                if types is not None and entry.event_type not in types:
+                    continue
+                if submission_id is not None and entry.submission_id != submission_id:
+                    continue
+                yield entry
+
+
+class AsyncLedgerWriter:
+    """Asyncio front-end that funnels writes through one writer task.
+
+    write() keeps LedgerProtocol's synchronous signature so existing code
+    can use it unchanged: inside a running event loop it queues the entry
+    and returns its id (assigned when the LedgerEntry was built). One task
+    per writer drains the queue in order and appends each batch inside a
+    single transaction() on a dedicated thread, so coroutines never block
+    the loop on disk I/O and the hash chain has exactly one writer.
+
+    Outside an event loop, write() appends directly (after anything still
+    queued), unless the writer's loop is running on another thread: then
+    the entry is handed to that loop with call_soon_threadsafe(), so worker
+    threads never touch the queue. Reads delegate to the wrapped client;
+    await drain() first to read your own writes. A failed append is
+    re-raised by the next drain() or write().
+    """
+
+    def __init__(self, ledger: Any):
+        self._ledger = ledger
+        self._pending: deque = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._idle: Optional[asyncio.Event] = None
+        self._error: Optional[BaseException] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ledger-writer")
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_ledger":
+            raise AttributeError(name)
+        return getattr(self._ledger, name)
+
+    @property
+    def ledger(self) -> Any:
+        """The wrapped ledger client."""
+        return self._ledger
+
+    @property
+    def queue_depth(self) -> int:
+        """Entries queued but not yet handed to the writer thread."""
+        return len(self._pending)
+
+    def write(self, entry: LedgerEntry) -> str:
+        self._raise_error()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            if self._loop_owns_queue():
+                try:
+                    self._loop.call_soon_threadsafe(self._enqueue, entry)
+                    return entry.id
+                except RuntimeError:
+                    pass  # the loop closed in between; append directly
+            self._write_pending()
+            return self._ledger.write(entry)
+        if loop is not self._loop:
+            self._bind(loop)
+        self._enqueue(entry)
+        return entry.id
+
+    async def drain(self) -> None:
+        """Wait until every queued entry has been appended."""
+        if self._idle is not None and asyncio.get_running_loop() is self._loop:
+            await self._idle.wait()
+        else:
+            self._write_pending()
+        self._raise_error()
+
+    def flush(self) -> None:
+        """Append anything queued, then flush the wrapped client.
+
+        Blocks the caller; coroutines should await drain() instead. From
+        a thread other than the running writer loop's, queued entries are
+        left to the writer task.
+        """
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop or not self._loop_owns_queue():
+            self._write_pending()
+        self._ledger.flush()
+
+    async def aclose(self) -> None:
+        """Drain the queue and stop the writer task."""
+        try:
+            await self.drain()
+        finally:
+            if self._task is not None:
+                self._task.cancel()
+                self._task = None
+            self._loop = None
+
+    def _enqueue(self, entry: LedgerEntry) -> None:
+        self._pending.append(entry)
+        self._idle.clear()
+        self._wakeup.set()
+
+    def _loop_owns_queue(self) -> bool:
+        loop, task = self._loop, self._task
+        return loop is not None and loop.is_running() and task is not None and not task.done()
+
+    def _bind(self, loop: asyncio.AbstractEventLoop) -> None:
+        # A previous loop may have stopped with entries still queued
+        self._write_pending()
+        self._loop = loop
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            while self._pending:
+                batch = list(self._pending)
+                self._pending.clear()
+                try:
+                    await loop.run_in_executor(self._executor, self._append, batch)
+                except Exception as exc:
+                    self._error = exc
+            self._idle.set()
+
+    def _write_pending(self) -> None:
+        if self._pending:
+            batch = list(self._pending)
+            self._pending.clear()
+            self._append(batch)
+
+    def _append(self, batch: List[LedgerEntry]) -> None:
+        transaction = getattr(self._ledger, "transaction", None)
+        if transaction is None:
+            for entry in batch:
+                self._ledger.write(entry)
+            return
+        with transaction():
+            for entry in batch:
+                self._ledger.write(entry)
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
 
 
 def get_session_ledger_path(
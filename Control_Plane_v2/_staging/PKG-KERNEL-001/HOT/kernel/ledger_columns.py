@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+ledger_columns.py - Columnar sidecars for closed ledger segments.
+
+A closed, verified JSONL segment can be compacted into a compressed binary
+sidecar holding only the columns that filtering scans need: event_type,
+submission_id, timestamp and metadata.session_id, plus each entry's
+(offset, length) in the original file. String columns are dictionary
+encoded. Readers select row numbers from the columns and then parse only
+the matching JSONL lines, so the JSONL stays the hash-authoritative source.
+
+File layout (little-endian):
+    MAGIC | u32 header length | header JSON | zlib column blobs...
+
+The header records the row count, the source segment's byte size and last
+entry_hash (a sidecar is only used while the segment still has that size),
+and the compressed length of each column in storage order.
+
+Usage:
+    from kernel.ledger_columns import build_columns, write_columns, load_columns
+
+    cols = build_columns(segment_path)
+    write_columns(cols, sidecar_path)
+    rows = load_columns(sidecar_path).select(event_types={"TURN"})
+"""
+
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"CPCOL\x01"
+_HEADER_LEN = struct.Struct("<I")
+_NO_VALUE = -1  # code for a missing metadata.session_id
+
+# Storage order of the column blobs
+_COLUMNS = (
+    "positions",
+    "event_type_dict",
+    "event_type",
+    "submission_id_dict",
+    "submission_id",
+    "session_id_dict",
+    "session_id",
+    "timestamp",
+)
+
+
+def _pack_array(values: array) -> bytes:
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _unpack_array(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values
+
+
+class _Dictionary:
+    """Assigns dense integer codes to distinct strings in first-seen order."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+@dataclass
+class ColumnarSegment:
+    """Filter columns of one closed ledger segment."""
+
+    source_bytes: int
+    last_hash: str
+    positions: array  # flattened (offset, length) pairs, typecode "Q"
+    event_type_dict: List[str]
+    event_type: array  # codes into event_type_dict, typecode "I"
+    submission_id_dict: List[str]
+    submission_id: array  # codes into submission_id_dict, typecode "I"
+    session_id_dict: List[str]
+    session_id: array  # codes into session_id_dict or -1, typecode "i"
+    timestamp: List[str]
+
+    @property
+    def rows(self) -> int:
+        return len(self.timestamp)
+
+    def position(self, row: int) -> Tuple[int, int]:
+        """Return (byte offset, byte length) of a row's JSONL line."""
+        return self.positions[2 * row], self.positions[2 * row + 1]
+
+    def select(
+        self,
+        event_types: Optional[Iterable[str]] = None,
+        submission_id: Optional[str] = None,
+        session_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+    ) -> List[int]:
+        """Return the row numbers matching every given filter, in order."""
+        rows: Iterable[int] = range(self.rows)
+        if event_types is not None:
+            wanted = {self.event_type_dict.index(t) for t in set(event_types) if t in self.event_type_dict}
+            if not wanted:
+                return []
+            codes = self.event_type
+            rows = [r for r in rows if codes[r] in wanted]
+        if submission_id is not None:
+            if submission_id not in self.submission_id_dict:
+                return []
+            code = self.submission_id_dict.index(submission_id)
+            codes = self.submission_id
+            rows = [r for r in rows if codes[r] == code]
+        if session_id is not None:
+            if session_id not in self.session_id_dict:
+                return []
+            code = self.session_id_dict.index(session_id)
+            codes = self.session_id
+            rows = [r for r in rows if codes[r] == code]
+        if since or until:
+            ts = self.timestamp
+            rows = [
+                r for r in rows
+                if not (since and ts[r] < since) and not (until and ts[r] > until)
+            ]
+        return list(rows)
+
+
+def build_columns(segment: Path) -> ColumnarSegment:
+    """Parse a JSONL segment into filter columns.
+
+    Raises:
+        ValueError: if a non-blank line is not a JSON object
+    """
+    positions = array("Q")
+    event_types, submissions, sessions = _Dictionary(), _Dictionary(), _Dictionary()
+    event_codes, submission_codes, session_codes = array("I"), array("I"), array("i")
+    timestamps: List[str] = []
+    last_hash = ""
+    offset = 0
+    with open(segment, "rb") as f:
+        for raw in f:
+            length = len(raw)
+            if raw.strip():
+                try:
+                    data = json.loads(raw)
+                    metadata = data.get("metadata") or {}
+                    session = metadata.get("session_id") if isinstance(metadata, dict) else None
+                except (ValueError, AttributeError) as exc:
+                    raise ValueError(f"Malformed entry at byte {offset} of {segment.name}") from exc
+                positions.extend((offset, length))
+                event_codes.append(event_types.code(str(data.get("event_type", ""))))
+                submission_codes.append(submissions.code(str(data.get("submission_id", ""))))
+                session_codes.append(sessions.code(session) if isinstance(session, str) else _NO_VALUE)
+                timestamps.append(str(data.get("timestamp", "")))
+                last_hash = data.get("entry_hash", "") or last_hash
+            offset += length
+    return ColumnarSegment(
+        source_bytes=offset,
+        last_hash=last_hash,
+        positions=positions,
+        event_type_dict=event_types.values,
+        event_type=event_codes,
+        submission_id_dict=submissions.values,
+        submission_id=submission_codes,
+        session_id_dict=sessions.values,
+        session_id=session_codes,
+        timestamp=timestamps,
+    )
+
+
+def write_columns(cols: ColumnarSegment, path: Path) -> None:
+    """Write a columnar sidecar atomically (temp file + rename)."""
+    raw = {
+        "positions": _pack_array(cols.positions),
+        "event_type_dict": json.dumps(cols.event_type_dict, ensure_ascii=False).encode("utf-8"),
+        "event_type": _pack_array(cols.event_type),
+        "submission_id_dict": json.dumps(cols.submission_id_dict, ensure_ascii=False).encode("utf-8"),
+        "submission_id": _pack_array(cols.submission_id),
+        "session_id_dict": json.dumps(cols.session_id_dict, ensure_ascii=False).encode("utf-8"),
+        "session_id": _pack_array(cols.session_id),
+        "timestamp": "\n".join(cols.timestamp).encode("utf-8"),
+    }
+    blobs = [zlib.compress(raw[name]) for name in _COLUMNS]
+    header = json.dumps({
+        "version": 1,
+        "rows": cols.rows,
+        "source_bytes": cols.source_bytes,
+        "last_hash": cols.last_hash,
+        "columns": [[name, len(blob)] for name, blob in zip(_COLUMNS, blobs)],
+    }).encode("utf-8")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(MAGIC)
+        f.write(_HEADER_LEN.pack(len(header)))
+        f.write(header)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp, path)
+
+
+def load_columns(path: Path) -> Optional[ColumnarSegment]:
+    """Load a columnar sidecar, or None if it is missing or unreadable."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    try:
+        if not data.startswith(MAGIC):
+            return None
+        pos = len(MAGIC)
+        (header_len,) = _HEADER_LEN.unpack_from(data, pos)
+        pos += _HEADER_LEN.size
+        header = json.loads(data[pos:pos + header_len])
+        pos += header_len
+        if header.get("version") != 1:
+            return None
+        raw: Dict[str, bytes] = {}
+        for name, size in header["columns"]:
+            raw[name] = zlib.decompress(data[pos:pos + size])
+            pos += size
+        timestamps = raw["timestamp"].decode("utf-8").split("\n") if header["rows"] else []
+        cols = ColumnarSegment(
+            source_bytes=header["source_bytes"],
+            last_hash=header["last_hash"],
+            positions=_unpack_array("Q", raw["positions"]),
+            event_type_dict=json.loads(raw["event_type_dict"]),
+            event_type=_unpack_array("I", raw["event_type"]),
+            submission_id_dict=json.loads(raw["submission_id_dict"]),
+            submission_id=_unpack_array("I", raw["submission_id"]),
+            session_id_dict=json.loads(raw["session_id_dict"]),
+            session_id=_unpack_array("i", raw["session_id"]),
+            timestamp=timestamps,
+        )
+    except (KeyError, TypeError, ValueError, struct.error, zlib.error):
+        return None
+    if not (len(cols.positions) == 2 * cols.rows == 2 * header["rows"]
+            and len(cols.event_type) == len(cols.submission_id) == len(cols.session_id) == cols.rows):
+        return None
+    return cols
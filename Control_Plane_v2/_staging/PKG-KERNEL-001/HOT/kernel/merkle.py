@@ -20,7 +20,7 @@ Usage:
 
 import hashlib
 from pathlib import Path
-from typing import List, Union
+from typing import Any, Dict, List, Optional, Union
 
 from kernel.hashing import sha256_file as _sha256_file, sha256_string as _sha256_string
 
@@ -120,6 +120,68 @@ def merkle_root(hashes: List[str]) -> str:
     return merkle_root(next_level)
 
 
+class MerkleAccumulator:
+    """
+    Incremental Merkle root over an append-only sequence of hashes.
+
+    Keeps one pending node per tree level (O(log n) state), so leaves can
+    be added without holding the earlier ones. root() always equals
+    merkle_root() over the same leaves, including the duplicate-last rule.
+
+    Usage:
+        acc = MerkleAccumulator()
+        for h in hashes:
+            acc.add(h)
+        assert acc.root() == merkle_root(hashes)
+
+        # Persist and resume
+        acc = MerkleAccumulator.from_state(acc.to_state())
+    """
+
+    def __init__(self, count: int = 0, levels: Optional[List[Optional[str]]] = None):
+        self.count = count
+        self.levels: List[Optional[str]] = list(levels or [])
+
+    def add(self, leaf: str) -> None:
+        """Append one leaf hash."""
+        node, level = leaf, 0
+        while self.count & (1 << level):
+            node = hash_combine(self.levels[level], node)
+            level += 1
+        if level == len(self.levels):
+            self.levels.append(None)
+        self.levels[level] = node
+        self.count += 1
+
+    def root(self) -> str:
+        """Return the Merkle root of all leaves added so far ("" if none)."""
+        if not self.count:
+            return ""
+        level = 0
+        while not self.count & (1 << level):
+            level += 1
+        node = self.levels[level]
+        count = self.count
+        while count != (1 << level):
+            # Unpaired node: combine with itself, as merkle_root() does
+            node = hash_combine(node, node)
+            count += 1 << level
+            level += 1
+            while not count & (1 << level):
+                node = hash_combine(self.levels[level], node)
+                level += 1
+        return node
+
+    def to_state(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict."""
+        return {"count": self.count, "levels": list(self.levels)}
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "MerkleAccumulator":
+        """Restore from to_state() output."""
+        return cls(count=int(state.get("count", 0)), levels=state.get("levels", []))
+
+
 def verify_file_hash(path: Union[str, Path], expected_hash: str) -> bool:
     """
     Verify a file's content matches the expected hash.
@@ -143,5 +205,6 @@ __all__ = [
     "hash_string",
     "hash_combine",
     "merkle_root",
+    "MerkleAccumulator",
     "verify_file_hash",
 ]
@@ -0,0 +1,897 @@
+"""Tests for LedgerClient — hash chaining, sidecar indexes and fast readers.
+
+All tests use tmp_path ledgers — no shared state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+
+# Dual-context path detection: installed root vs staging packages
+_HERE = Path(__file__).resolve().parent
+_HOT = _HERE.parent
+
+if (_HOT / "kernel" / "ledger_client.py").exists():
+    _paths = [_HOT, _HOT / "kernel"]
+else:
+    _STAGING_ROOT = _HERE.parents[2]
+    _paths = [
+        _STAGING_ROOT / "PKG-KERNEL-001" / "HOT",
+        _STAGING_ROOT / "PKG-KERNEL-001" / "HOT" / "kernel",
+    ]
+
+for p in _paths:
+    s = str(p)
+    if s not in sys.path:
+        sys.path.insert(0, s)
+
+import ledger_client  # noqa: E402
+from ledger_client import LedgerClient, LedgerEntry, _iter_lines_reversed, _iter_mapped_lines  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _bypass_pristine():
+    """Bypass pristine boundary checks for tmp_path ledger writes."""
+    with patch("kernel.pristine.assert_append_only", return_value=None):
+        yield
+
+
+def _make_ledger(tmp_path: Path, **kwargs) -> LedgerClient:
+    """Create a fresh ledger in tmp_path."""
+    ledger_path = tmp_path / "ledger" / "governance.jsonl"
+    ledger_path.parent.mkdir(parents=True, exist_ok=True)
+    return LedgerClient(ledger_path=ledger_path, **kwargs)
+
+
+def _entry(i: int, event_type: str = "EVENT", **metadata) -> LedgerEntry:
+    return LedgerEntry(
+        event_type=event_type,
+        submission_id=f"SUB-{i:04d}",
+        decision="OK",
+        reason=f"entry {i}",
+        metadata=metadata,
+    )
+
+
+def _fill(client: LedgerClient, n: int) -> None:
+    for i in range(n):
+        event_type = "EVEN" if i % 2 == 0 else "ODD"
+        client.write(_entry(i, event_type, _dedupe_key=f"key-{i}"))
+
+
+class TestEntryIndex:
+    """Sidecar entry index answers reads without parsing the whole ledger."""
+
+    def test_readers_match_full_scan(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 25)
+        full = client.read_all()
+
+        assert client.count() == 25
+        assert [e.id for e in client.read_recent(5)] == [e.id for e in full[-5:]]
+        assert [e.id for e in client.read_entries_range(3, 9)] == [e.id for e in full[3:9]]
+        assert [e.id for e in client.read_entries_range(-4, 25)] == [e.id for e in full[-4:25]]
+        assert [e.id for e in client.read_by_event_type("ODD")] == [
+            e.id for e in full if e.event_type == "ODD"
+        ]
+        assert client.has_dedupe_key("key-17") is True
+        assert client.has_dedupe_key("key-99") is False
+        assert client.get_last_entry_hash_value() == full[-1].entry_hash
+
+    def test_index_written_on_flush(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 3)
+        pos = client.index_dir / "governance.pos"
+        keys = client.index_dir / "governance.keys"
+        assert pos.stat().st_size == 3 * 16
+        assert len(keys.read_text().splitlines()) == 3
+
+    def test_legacy_segment_indexed_lazily(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 4)
+        for p in client.index_dir.iterdir():
+            p.unlink()
+
+        reopened = LedgerClient(ledger_path=client.ledger_path)
+        assert reopened.count() == 4
+        assert (reopened.index_dir / "governance.pos").exists()
+        assert [e.id for e in reopened.read_recent(2)] == [e.id for e in client.read_all()[-2:]]
+
+    def test_catches_up_with_other_writers(self, tmp_path: Path) -> None:
+        first = _make_ledger(tmp_path)
+        second = LedgerClient(ledger_path=first.ledger_path)
+        _fill(first, 2)
+        assert second.count() == 2
+        second.write(_entry(9, "LATE", _dedupe_key="late"))
+        first.write(_entry(10, "LATER"))
+
+        assert first.count() == 4
+        assert first.has_dedupe_key("late")
+        assert [e.event_type for e in first.read_recent(2)] == ["LATE", "LATER"]
+
+    def test_reader_sync_races_writer_flush(self, tmp_path: Path) -> None:
+        writer = _make_ledger(tmp_path)
+        reader = LedgerClient(ledger_path=writer.ledger_path)
+        done = threading.Event()
+
+        def poll() -> None:
+            while not done.is_set():
+                reader.count()
+
+        poller = threading.Thread(target=poll)
+        poller.start()
+        try:
+            for i in range(2000):
+                writer.write(_entry(i))
+        finally:
+            done.set()
+            poller.join()
+
+        assert writer.count() == reader.count() == 2000
+        assert (writer.index_dir / "governance.pos").stat().st_size == 2000 * 16
+        assert [e.submission_id for e in reader.read_entries_range(1995, 2000)] == [
+            f"SUB-{i:04d}" for i in range(1995, 2000)
+        ]
+
+    def test_truncated_segment_rebuilds_index(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 5)
+        lines = client.ledger_path.read_bytes().splitlines(keepends=True)
+        client.ledger_path.write_bytes(b"".join(lines[:2]))
+
+        assert client.count() == 2
+        assert client.has_dedupe_key("key-4") is False
+
+    def test_non_ascii_offsets(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        client.write(_entry(0, "NOTE", text="héllo — ✓"))
+        client.write(_entry(1, "NOTE", text="plain"))
+
+        assert [e.metadata["text"] for e in client.read_recent(2)] == ["héllo — ✓", "plain"]
+        assert len(client.read_by_submission("SUB-0001")) == 1
+
+    def test_malformed_lines_skipped(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 2)
+        with open(client.ledger_path, "a", encoding="utf-8") as f:
+            f.write("not json\n")
+        client.write(_entry(5, "AFTER"))
+
+        assert client.count() == len(client.read_all()) == 3
+        assert client.read_recent(1)[0].event_type == "AFTER"
+
+    def test_disabled_index_uses_full_scan(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path, enable_index=False)
+        _fill(client, 6)
+        assert client.count() == 6
+        assert len(client.read_by_event_type("EVEN")) == 3
+        assert client.has_dedupe_key("key-5")
+        assert not client.index_dir.exists()
+
+
+class TestTailReader:
+    """Backward block reader serves tail reads without a full scan."""
+
+    @pytest.mark.parametrize("block_size", [1, 7, 64, 4096])
+    def test_reverse_lines_across_block_boundaries(self, tmp_path: Path, block_size: int) -> None:
+        path = tmp_path / "lines.txt"
+        lines = [f"line-{i}-" + "x" * (i % 13) for i in range(40)]
+        path.write_text("\n".join(lines) + "\n")
+
+        got = [l.decode() for l in _iter_lines_reversed(path, block_size) if l]
+        assert got == lines[::-1]
+
+    def test_reverse_lines_without_trailing_newline(self, tmp_path: Path) -> None:
+        path = tmp_path / "lines.txt"
+        path.write_text("a\nb\nc")
+        assert [l for l in _iter_lines_reversed(path, 2) if l] == [b"c", b"b", b"a"]
+
+    def test_read_recent_spans_segments(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 3)
+        rotated = client.ledger_path.parent / "governance-20260101-000000.jsonl"
+        rotated.write_text("".join(_entry(i).to_json() + "\n" for i in range(3, 5)))
+        reader = LedgerClient(ledger_path=client.ledger_path)
+        full = reader.read_all()
+
+        assert [e.id for e in reader.read_recent(4)] == [e.id for e in full[-4:]]
+        assert [e.id for e in reader.read_recent(50)] == [e.id for e in full]
+
+    def test_iter_entries_reversed_filters_newest_first(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 6)
+        client._start_new_segment()
+        client.write(_entry(1, "ODD"))
+
+        got = [e.reason for e in client.iter_entries_reversed(event_types=("ODD",), submission_id="SUB-0001")]
+        assert got == ["entry 1", "entry 1"]
+        assert [e.submission_id for e in client.iter_entries_reversed(event_types=("EVEN",))] == [
+            "SUB-0004", "SUB-0002", "SUB-0000",
+        ]
+
+    def test_init_state_reads_tail_only(self, tmp_path: Path, monkeypatch) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 200)
+        last = client.read_all()[-1]
+        monkeypatch.setattr(ledger_client, "DEFAULT_TAIL_BLOCK_BYTES", 512)
+
+        reads = []
+        real_open = open
+
+        def counting_open(path, mode="r", *args, **kwargs):
+            f = real_open(path, mode, *args, **kwargs)
+            if "b" in mode and str(path).endswith("governance.jsonl"):
+                real_read = f.read
+
+                def read(n=-1):
+                    data = real_read(n)
+                    reads.append(len(data))
+                    return data
+                f.read = read
+            return f
+
+        with patch("builtins.open", counting_open):
+            reopened = LedgerClient(ledger_path=client.ledger_path)
+            recent = reopened.read_recent(1)
+
+        assert reopened._last_hash == last.entry_hash
+        assert recent[0].id == last.id
+        assert sum(reads) < client.ledger_path.stat().st_size // 10
+
+
+class TestIterEntries:
+    """Streaming reader with predicate pushdown."""
+
+    def test_filters_match_full_scan(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 12)
+        full = client.read_all()
+
+        odd = list(client.iter_entries(event_types=["ODD"]))
+        assert [e.id for e in odd] == [e.id for e in full if e.event_type == "ODD"]
+        assert [e.id for e in client.iter_entries(submission_id="SUB-0004")] == [full[4].id]
+        assert list(client.iter_entries(event_types=["ODD"], submission_id="SUB-0004")) == []
+        assert list(client.iter_entries(event_types=[])) == []
+
+    def test_is_lazy(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 5)
+        it = client.iter_entries()
+        assert next(it).submission_id == "SUB-0000"
+
+    def test_substring_prefilter_never_drops_matches(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        client.ledger_path.write_text(
+            json.dumps(_entry_dict("A/B", "SUB-1"), separators=(",", ":")) + "\n"
+            + json.dumps(_entry_dict("ÜBER", "SUB-2"), ensure_ascii=True) + "\n"
+            + json.dumps(_entry_dict("PLAIN", "SUB-3"), separators=(",", ":")) + "\n"
+        )
+        assert [e.submission_id for e in client.iter_entries(event_types=["A/B"])] == ["SUB-1"]
+        assert [e.submission_id for e in client.iter_entries(event_types=["ÜBER"])] == ["SUB-2"]
+        assert [e.submission_id for e in client.iter_entries(event_types=["PLAIN"])] == ["SUB-3"]
+
+    def test_time_window(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        client.ledger_path.write_text("".join(
+            json.dumps(_entry_dict("E", f"SUB-{d}", timestamp=f"2026-01-0{d}T00:00:00+00:00")) + "\n"
+            for d in range(1, 6)
+        ))
+        got = client.iter_entries(since="2026-01-02T00:00:00+00:00", until="2026-01-04T00:00:00+00:00")
+        assert [e.submission_id for e in got] == ["SUB-2", "SUB-3", "SUB-4"]
+
+    def test_segments_outside_window_not_opened(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        old = client.ledger_path.parent / "governance-20250101-000000.jsonl"
+        old.write_text(json.dumps(_entry_dict("E", "OLD", timestamp="2025-01-01T00:00:00+00:00")) + "\n")
+        client.ledger_path.write_text(
+            json.dumps(_entry_dict("E", "NEW", timestamp="2026-01-01T00:00:00+00:00")) + "\n"
+        )
+
+        scanned = []
+        real_open = open
+
+        def tracking_open(path, mode="r", *args, **kwargs):
+            if mode == "rb":
+                scanned.append(Path(path).name)
+            return real_open(path, mode, *args, **kwargs)
+
+        with patch("builtins.open", tracking_open):
+            got = list(client.iter_entries(since="2025-06-01T00:00:00+00:00"))
+
+        assert [e.submission_id for e in got] == ["NEW"]
+        # Each segment is probed for its tail; only the in-window one is then scanned
+        assert scanned.count(old.name) == 1
+        assert scanned.count("governance.jsonl") == 2
+
+
+def _entry_dict(event_type: str, submission_id: str, **overrides) -> dict:
+    data = {
+        "event_type": event_type,
+        "submission_id": submission_id,
+        "decision": "OK",
+        "reason": "",
+        "prompts_used": [],
+        "metadata": {},
+        "id": f"LED-{submission_id}",
+        "timestamp": "2026-01-01T00:00:00+00:00",
+        "previous_hash": "",
+        "entry_hash": "",
+    }
+    data.update(overrides)
+    return data
+
+
+class TestIncrementalVerify:
+    """verify_chain(incremental=True) resumes from persisted checkpoints."""
+
+    def _hash_calls(self):
+        return patch.object(ledger_client, "_compute_entry_hash", wraps=ledger_client._compute_entry_hash)
+
+    def test_matches_full_verify(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 10)
+        assert client.verify_chain(incremental=True) == client.verify_chain() == (True, [])
+        assert client.checkpoint_path.exists()
+
+    def test_only_rehashes_appended_entries(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 20)
+        client.verify_chain(incremental=True)
+        client.write(_entry(99))
+        client.write(_entry(100))
+
+        with self._hash_calls() as spy:
+            valid, issues = client.verify_chain(incremental=True)
+        assert (valid, issues) == (True, [])
+        # Two new entries plus the checkpoint anchor
+        assert spy.call_count == 3
+
+        cp = client._load_verify_checkpoints()["governance.jsonl"]
+        assert cp.count == 22
+        assert cp.merkle_root == ledger_client.merkle_root([e.entry_hash for e in client.read_all()])
+
+    def test_tampered_append_detected(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 5)
+        client.verify_chain(incremental=True)
+        client.write(_entry(6))
+        lines = client.ledger_path.read_text().splitlines()
+        lines[-1] = lines[-1].replace("entry 6", "entry X")
+        client.ledger_path.write_text("\n".join(lines) + "\n")
+
+        valid, issues = client.verify_chain(incremental=True)
+        assert not valid
+        assert any("content tampered" in i for i in issues)
+        # Failure is not checkpointed, so it is reported again
+        assert not client.verify_chain(incremental=True)[0]
+
+    def test_anchor_tamper_detected(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 5)
+        client.verify_chain(incremental=True)
+        lines = client.ledger_path.read_text().splitlines()
+        lines[-1] = lines[-1].replace("entry 4", "entry Y")
+        client.ledger_path.write_text("\n".join(lines) + "\n")
+
+        valid, issues = client.verify_chain(incremental=True)
+        assert not valid
+        assert any("anchor mismatch" in i for i in issues)
+
+    def test_truncation_detected(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 5)
+        client.verify_chain(incremental=True)
+        lines = client.ledger_path.read_bytes().splitlines(keepends=True)
+        client.ledger_path.write_bytes(b"".join(lines[:3]))
+
+        valid, issues = client.verify_chain(incremental=True)
+        assert not valid
+        assert any("shrank" in i for i in issues)
+
+    def test_revalidate_closed_segments(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 4)
+        client._start_new_segment()
+        client.write(_entry(7))
+        assert client.verify_segment_roots() == (True, [])
+
+        lines = client.ledger_path.read_text().splitlines()
+        data = json.loads(lines[1])
+        data["reason"] = "rewritten"
+        data["entry_hash"] = ledger_client._compute_entry_hash(data)
+        lines[1] = json.dumps(data, ensure_ascii=False)
+        client.ledger_path.write_text("\n".join(lines) + "\n")
+
+        valid, issues = client.verify_chain(incremental=True, revalidate_closed=True)
+        assert not valid
+        assert any("Merkle root mismatch" in i for i in issues)
+
+
+class TestParallelVerify:
+    """Process backend splits segments into byte ranges and stitches the chain."""
+
+    def _tamper(self, client: LedgerClient) -> None:
+        lines = client.ledger_path.read_text().splitlines()
+        for k in (5, 21):
+            data = json.loads(lines[k])
+            data["entry_hash"] = "sha256:" + "0" * 64
+            lines[k] = json.dumps(data, ensure_ascii=False)
+        data = json.loads(lines[30])
+        data.pop("entry_hash")
+        lines[30] = json.dumps(data, ensure_ascii=False)
+        client.ledger_path.write_text("\n".join(lines) + "\n")
+
+    def test_split_ranges_on_line_boundaries(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 10)
+        data = client.ledger_path.read_bytes()
+        ranges = ledger_client._split_line_ranges(client.ledger_path, 300)
+
+        assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+        for (_, hi), (lo, _) in zip(ranges, ranges[1:]):
+            assert hi == lo and data[lo - 1:lo] == b"\n"
+
+    @pytest.mark.parametrize("range_bytes", [1, 700, 1 << 20])
+    def test_process_backend_matches_thread(self, tmp_path: Path, range_bytes: int) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 40)
+        assert client.verify_chain_parallel(backend="process", range_bytes=range_bytes) == (True, [])
+
+        self._tamper(client)
+        expected = client.verify_chain_parallel()
+        assert not expected[0]
+        assert any("Chain break" in i for i in expected[1])
+        assert client.verify_chain_parallel(
+            workers=2, backend="process", range_bytes=range_bytes
+        ) == expected
+
+    def test_unknown_backend(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        with pytest.raises(ValueError):
+            client.verify_chain_parallel(backend="gpu")
+
+    @pytest.mark.skipif(
+        not os.environ.get("CP_LEDGER_BENCH"),
+        reason="set CP_LEDGER_BENCH=1 to run the verify scaling benchmark",
+    )
+    def test_benchmark_process_scaling(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 20000)
+        size = client.ledger_path.stat().st_size
+        cores = os.cpu_count() or 1
+        timings = {}
+        for workers in sorted({1, 2, cores}):
+            start = time.perf_counter()
+            valid, _ = client.verify_chain_parallel(
+                workers=workers, backend="process", range_bytes=max(1, size // (workers * 4))
+            )
+            timings[workers] = time.perf_counter() - start
+            assert valid
+            print(f"verify workers={workers}: {size / timings[workers] / 1e6:.1f} MB/s")
+        if cores >= 2:
+            assert timings[2] < timings[1] * 0.8
+
+
+class TestGroupCommit:
+    """Transactions and the background flusher coalesce appends safely."""
+
+    def test_transaction_commits_once(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        with patch("kernel.pristine.assert_append_only") as guard:
+            with client.transaction():
+                _fill(client, 10)
+                assert client.ledger_path.read_bytes() == b""
+        assert guard.call_count == 1
+        assert client.count() == 10
+        assert client.verify_chain() == (True, [])
+
+    @pytest.mark.parametrize("policy,expected", [("none", 0), ("per-batch", 1), ("per-entry", 5)])
+    def test_fsync_policy(self, tmp_path: Path, policy: str, expected: int) -> None:
+        client = _make_ledger(tmp_path, fsync_policy=policy)
+        with patch.object(ledger_client.os, "fsync") as fsync:
+            with client.transaction():
+                _fill(client, 5)
+        assert fsync.call_count == expected
+
+    def test_unknown_fsync_policy(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            _make_ledger(tmp_path, fsync_policy="sometimes")
+
+    def test_concurrent_writers_keep_chain(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path, group_commit=True, group_commit_interval_sec=0.001)
+
+        def worker(t: int) -> None:
+            for i in range(50):
+                client.write(_entry(t * 1000 + i, f"T{t}"))
+
+        threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        client.close()
+
+        assert client._flusher is None
+        assert client.count() == 200
+        assert client.verify_chain() == (True, [])
+        for t in range(4):
+            ids = [e.submission_id for e in client.read_by_event_type(f"T{t}")]
+            assert ids == [f"SUB-{t * 1000 + i:04d}" for i in range(50)]
+
+    def test_background_flush_error_surfaces(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path, group_commit=True, group_commit_interval_sec=0.001)
+        real_flush = client._flush_locked
+        failed = threading.Event()
+
+        def flaky_flush() -> None:
+            if not failed.is_set():
+                failed.set()
+                raise OSError("disk full")
+            real_flush()
+
+        with patch.object(client, "_flush_locked", side_effect=flaky_flush):
+            client.write(_entry(1))
+            assert failed.wait(5)
+            deadline = time.monotonic() + 5
+            while client._flush_error is None and time.monotonic() < deadline:
+                time.sleep(0.001)
+            with pytest.raises(OSError, match="disk full"):
+                client.write(_entry(2))
+            client.write(_entry(3))  # raised once; the buffered entry is retried
+            client.close()
+        assert [e.submission_id for e in client.read_all()] == ["SUB-0001", "SUB-0003"]
+        assert client.verify_chain() == (True, [])
+
+
+class TestAsyncLedgerWriter:
+    """Coroutine writes go through one writer task and keep the chain."""
+
+    def test_concurrent_coroutines_single_writer(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        writer = ledger_client.AsyncLedgerWriter(client)
+        writer_threads = set()
+        append = writer._append
+
+        def _append(batch):
+            writer_threads.add(threading.current_thread().name)
+            append(batch)
+
+        writer._append = _append
+
+        async def session(t: int) -> list:
+            ids = []
+            for i in range(25):
+                entry = _entry(t * 1000 + i, f"T{t}")
+                assert writer.write(entry) == entry.id
+                ids.append(entry.id)
+                await asyncio.sleep(0)
+            return ids
+
+        async def run() -> list:
+            results = await asyncio.gather(*(session(t) for t in range(8)))
+            await writer.aclose()
+            return results
+
+        results = asyncio.run(run())
+
+        assert writer.queue_depth == 0
+        assert len(writer_threads) == 1
+        assert client.count() == 200
+        assert client.verify_chain() == (True, [])
+        for t, ids in enumerate(results):
+            assert [e.id for e in client.read_by_event_type(f"T{t}")] == ids
+
+    def test_write_outside_loop_is_direct(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        writer = ledger_client.AsyncLedgerWriter(client)
+        writer.write(_entry(1))
+        assert client.count() == 1
+        assert writer.read_all()[0].submission_id == "SUB-0001"
+
+    def test_append_failure_raised_on_drain(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        writer = ledger_client.AsyncLedgerWriter(client)
+
+        async def run() -> None:
+            with patch.object(client, "write", side_effect=OSError("disk full")):
+                writer.write(_entry(1))
+                with pytest.raises(OSError):
+                    await writer.drain()
+            await writer.aclose()
+
+        asyncio.run(run())
+
+    def test_worker_thread_writes_routed_to_loop(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        writer = ledger_client.AsyncLedgerWriter(client)
+        direct = []
+        real_write = client.write
+
+        def write(entry):
+            if not threading.current_thread().name.startswith("ledger-writer"):
+                direct.append(entry.id)
+            return real_write(entry)
+
+        def worker(t: int) -> None:
+            for i in range(25):
+                writer.write(_entry(t * 1000 + i, f"W{t}"))
+
+        async def run() -> None:
+            writer.write(_entry(0, "LOOP"))  # binds the writer task to this loop
+            loop = asyncio.get_running_loop()
+            await asyncio.gather(*(loop.run_in_executor(None, worker, t) for t in range(4)))
+            await writer.aclose()
+
+        with patch.object(client, "write", side_effect=write):
+            asyncio.run(run())
+
+        assert direct == []
+        assert client.count() == 101
+        assert client.verify_chain() == (True, [])
+        for t in range(4):
+            ids = [e.submission_id for e in client.read_by_event_type(f"W{t}")]
+            assert ids == [f"SUB-{t * 1000 + i:04d}" for i in range(25)]
+
+
+def _legacy_seal(entry: LedgerEntry, previous_hash: str) -> bytes:
+    """Pre-seal() write path: asdict + hash dump + line dump + byte-count dump."""
+    from dataclasses import asdict
+
+    len(entry.to_json())
+    entry.previous_hash = previous_hash
+    entry.entry_hash = ledger_client._compute_entry_hash(asdict(entry))
+    return (entry.to_json() + "\n").encode("utf-8")
+
+
+class TestCanonicalSerialization:
+    """seal() serializes once and stays hash-compatible with existing ledgers."""
+
+    def test_seal_matches_legacy_hash(self) -> None:
+        entry = _entry(1, note="naïve ✓", nested={"b": [1, 2], "a": None})
+        line = entry.seal("abc")
+        data = json.loads(line)
+
+        assert line.endswith(b"\n")
+        assert data["entry_hash"] == entry.entry_hash
+        assert entry.entry_hash == ledger_client._compute_entry_hash(data)
+        assert LedgerEntry(**data) == entry
+        legacy = _entry(1, note="naïve ✓", nested={"b": [1, 2], "a": None})
+        legacy.id, legacy.timestamp = entry.id, entry.timestamp
+        _legacy_seal(legacy, "abc")
+        assert legacy.entry_hash == entry.entry_hash
+
+    def test_entries_use_slots(self) -> None:
+        with pytest.raises(AttributeError):
+            _entry(1).unexpected = True
+
+    def test_unserializable_entry_rejected_at_write(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        client.write(_entry(0))
+        with pytest.raises(TypeError):
+            client.write(_entry(1, handle=object()))
+        client.write(_entry(2))
+        assert [e.reason for e in client.read_all()] == ["entry 0", "entry 2"]
+        assert client.verify_chain() == (True, [])
+
+    def test_failed_append_leaves_chain_state_untouched(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path, batch_size=3)
+        client.write(_entry(0))
+        client.write(_entry(1))
+        real_open = open
+
+        class _FullDisk:
+            def __init__(self, f):
+                self._f = f
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+            def tell(self):
+                return self._f.tell()
+
+            def write(self, data):
+                raise OSError("disk full")
+
+        def failing_open(path, mode="r", *args, **kwargs):
+            f = real_open(path, mode, *args, **kwargs)
+            return _FullDisk(f) if mode == "ab" else f
+
+        with patch("builtins.open", failing_open), pytest.raises(OSError):
+            client.write(_entry(2))
+        client.flush()
+        client.write(_entry(3))
+        client.flush()
+        assert [e.reason for e in client.read_all()] == ["entry 0", "entry 1", "entry 2", "entry 3"]
+        assert client.verify_chain() == (True, [])
+
+    @pytest.mark.skipif(
+        not os.environ.get("CP_LEDGER_BENCH"),
+        reason="set CP_LEDGER_BENCH=1 to run the serialization micro-benchmark",
+    )
+    def test_benchmark_seal(self) -> None:
+        n = 20000
+        rates = {}
+        for name, fn in (("legacy", _legacy_seal), ("seal", LedgerEntry.seal)):
+            entries = [_entry(i, session_id=f"SES-{i % 7}", tokens=i) for i in range(n)]
+            start = time.perf_counter()
+            prev = ""
+            for entry in entries:
+                fn(entry, prev)
+                prev = entry.entry_hash
+            rates[name] = n / (time.perf_counter() - start)
+            print(f"{name}: {rates[name]:,.0f} entries/sec")
+        assert rates["seal"] > rates["legacy"]
+
+
+class TestColumnarCompaction:
+    """Columnar sidecars answer filters for closed segments transparently."""
+
+    def _rotated(self, tmp_path: Path) -> LedgerClient:
+        """Ledger with one closed rotated segment (the base file and the
+        newest rotated segment both count as active)."""
+        client = _make_ledger(tmp_path)
+        names = iter(["governance-20250101-000000.jsonl", "governance-20250102-000000.jsonl"])
+        client._segment_name = lambda: next(names)
+        client.write(_entry(98, "ODD"))
+        client._start_new_segment()
+        for i in range(30):
+            client.write(_entry(i, "EVEN" if i % 2 == 0 else "ODD", session_id=f"SES-{i % 3}"))
+        client._start_new_segment()
+        client.write(_entry(99, "EVEN", session_id="SES-0"))
+        self.closed = client.ledger_path.parent / "governance-20250101-000000.jsonl"
+        return client
+
+    def test_filters_match_jsonl_scan(self, tmp_path: Path) -> None:
+        client = self._rotated(tmp_path)
+        full = client.read_all()
+        queries = [
+            {},
+            {"event_types": ["ODD"]},
+            {"submission_id": "SUB-0004"},
+            {"session_id": "SES-1"},
+            {"event_types": ["EVEN"], "session_id": "SES-0"},
+            {"since": full[10].timestamp, "until": full[20].timestamp},
+            {"event_types": ["MISSING"]},
+        ]
+        before = [[e.id for e in client.iter_entries(**q)] for q in queries]
+
+        written = client.compact_closed_segments()
+        assert [p.name for p in written] == ["governance-20250101-000000.cols"]
+        with patch.object(LedgerClient, "_iter_filtered_lines", wraps=LedgerClient._iter_filtered_lines) as scan:
+            after = [[e.id for e in client.iter_entries(**q)] for q in queries]
+        assert after == before
+        # The compacted segment is never scanned line by line
+        assert self.closed.name not in {c.args[0].name for c in scan.call_args_list}
+        assert client.compact_closed_segments() == []
+
+    def test_stale_sidecar_ignored(self, tmp_path: Path) -> None:
+        client = self._rotated(tmp_path)
+        client.compact_closed_segments()
+        with open(self.closed, "ab") as f:
+            f.write((_entry(500, "ODD").to_json() + "\n").encode("utf-8"))
+
+        ids = [e.submission_id for e in client.iter_entries(event_types=["ODD"])]
+        assert "SUB-0500" in ids
+
+    def test_refuses_active_or_unverified_segment(self, tmp_path: Path) -> None:
+        client = self._rotated(tmp_path)
+        for active in (client._current_segment_path, client.ledger_path):
+            with pytest.raises(ValueError, match="active"):
+                client.compact_segment(active)
+
+        lines = self.closed.read_text().splitlines()
+        data = json.loads(lines[3])
+        data["reason"] = "rewritten"
+        lines[3] = json.dumps(data, ensure_ascii=False)
+        self.closed.write_text("\n".join(lines) + "\n")
+        with pytest.raises(ValueError, match="unverified"):
+            client.compact_segment(self.closed)
+        assert not client._columns_path(self.closed).exists()
+
+
+class TestMappedReader:
+    """mmap reader copies and decodes only lines that pass the filter."""
+
+    @pytest.mark.parametrize("needles", [
+        [],
+        [[b'"ODD"']],
+        [[b'"EVEN"', b'"ODD"']],
+        [[b'"ODD"'], [b'"SUB-0003"', b'"SUB-0007"']],
+        [[b'"SUB-0010"'], [b'"ODD"']],
+        [[b'"NOPE"']],
+    ])
+    def test_matches_naive_filter(self, tmp_path: Path, needles) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 12)
+        data = client.ledger_path.read_bytes() + b"\n  \n" + b'{"partial": "ODD"}'
+        expected = [
+            line.strip() for line in data.splitlines()
+            if line.strip() and all(any(n in line for n in group) for group in needles)
+        ]
+        assert list(_iter_mapped_lines(data, needles)) == expected
+        assert list(_iter_mapped_lines(b"", needles)) == []
+
+    def test_read_by_submission_fast_paths(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 10)
+        client.write(_entry(3, "ODD"))
+        expected = [e.id for e in client.read_all() if e.submission_id == "SUB-0003"]
+
+        # Active segment has no submission index yet: needle scan
+        with patch.object(ledger_client, "LedgerEntry", wraps=LedgerEntry) as built:
+            assert [e.id for e in client.read_by_submission_fast("SUB-0003")] == expected
+        assert built.call_count == 2
+
+        client._start_new_segment()
+        assert [e.id for e in client.read_by_submission_fast("SUB-0003")] == expected
+        assert client.read_by_submission_fast("SUB-9999") == []
+
+
+class TestSubmissionIndex:
+    """Binary submission index is binary-searched in place and cached."""
+
+    def test_lookup_and_authoritative_miss(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 50)
+        client.write(_entry(7, "ODD"))
+        closed = client._current_segment_path
+        client._start_new_segment()
+        client.write(_entry(7, "EVEN"))
+
+        index = client._open_submission_index(closed)
+        assert index.complete and index.records == 51
+        assert len(index.lookup("SUB-0007")) == 2
+        assert index.lookup("SUB-0777") == []
+
+        expected = [e.id for e in client.read_all() if e.submission_id == "SUB-0007"]
+        assert [e.id for e in client.read_by_submission_fast("SUB-0007")] == expected
+        assert len(expected) == 3
+        with patch.object(LedgerClient, "_iter_filtered_lines", wraps=LedgerClient._iter_filtered_lines) as scan:
+            assert client.read_by_submission_fast("SUB-0777") == []
+        # Closed segment answered by the index; only the active one was scanned
+        assert [c.args[0] for c in scan.call_args_list] == [client._current_segment_path]
+
+    def test_hit_also_scans_bytes_past_index(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        _fill(client, 10)
+        closed = client._current_segment_path
+        client._start_new_segment()
+        late = _entry(3, "LATE")
+        with open(closed, "ab") as f:
+            f.write(late.seal(""))  # appended after the index was written
+
+        assert client._open_submission_index(closed).lookup("SUB-0003")
+        found = client.read_by_submission_fast("SUB-0003")
+        assert [e.event_type for e in found] == ["ODD", "LATE"]
+
+    def test_key_collisions_filtered(self, tmp_path: Path) -> None:
+        client = _make_ledger(tmp_path)
+        with patch.object(ledger_client, "_submission_key", return_value=b"\0" * 8):
+            _fill(client, 6)
+            client._start_new_segment()
+            assert [e.submission_id for e in client.read_by_submission_fast("SUB-0002")] == ["SUB-0002"]
+
+    def test_lru_bounded(self, tmp_path: Path, monkeypatch) -> None:
+        monkeypatch.setattr(ledger_client, "DEFAULT_SUBMISSION_INDEX_CACHE", 2)
+        client = _make_ledger(tmp_path)
+        names = iter(f"governance-2025010{i}-000000.jsonl" for i in range(1, 6))
+        client._segment_name = lambda: next(names)
+        for i in range(4):
+            client.write(_entry(i))
+            client._start_new_segment()
+
+        assert [e.submission_id for e in client.read_by_submission_fast("SUB-0002")] == ["SUB-0002"]
+        assert len(client._submission_indexes) == 2
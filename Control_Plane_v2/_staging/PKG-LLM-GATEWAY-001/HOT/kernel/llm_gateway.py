@@ -3,16 +3,29 @@
 Dumb router: validate → auth → budget → dispatch marker → send →
 exchange record → debit → validate output → return.
 Every path (success or error) logs to the ledger. No silent failures.
+
+route() and route_async() run the same pipeline; only the provider send
+and the retry backoff differ between the blocking and the asyncio path.
+
+With a ResponseCache, temperature == 0 requests that match an earlier
+successful exchange are answered from the cache: no dispatch marker, no
+provider call, and an EXCHANGE entry marked cache_hit with zero tokens
+(nothing is debited).
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
 import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Generator, Optional
+
+# Pipeline I/O requests yielded by LLMGateway._route_steps()
+_SEND = "send"
+_SLEEP = "sleep"
 
 
 class RouteOutcome(str, Enum):
@@ -82,6 +95,11 @@ class PromptResponse:
     budget_remaining: Optional[int] = None
     finish_reason: str = "stop"
     content_blocks: Optional[tuple] = None
+    cache_hit: bool = False
+    # Parts of latency_ms: queue_wait_ms (waiting for a provider slot),
+    # provider_ms (the successful send, excluding queue wait), overhead_ms
+    # (ledger writes, budget, retries and backoff).
+    latency_breakdown: dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -165,8 +183,10 @@ class LLMGateway:
         auth_provider: Any = None,
         dev_mode: bool = False,
         budget_mode: str = "enforce",
+        response_cache: Any = None,
     ):
         self._ledger = ledger_client
+        self._response_cache = response_cache
         self._budgeter = budgeter
         self._config = config or RouterConfig()
         self._auth_provider = auth_provider
@@ -187,7 +207,12 @@ class LLMGateway:
         budgeter: Any = None,
         dev_mode: bool = False,
     ) -> LLMGateway:
-        """Create router from a JSON config file."""
+        """Create router from a JSON config file.
+
+        An optional "response_cache" object ({"max_entries", "store_dir"})
+        enables the response cache; a relative store_dir is resolved
+        against the config file's directory.
+        """
         with open(path) as f:
             data = json.load(f)
         cb_data = data.get("circuit_breaker", {})
@@ -205,11 +230,22 @@ class LLMGateway:
             retry_backoff_ms=data.get("retry_backoff_ms", 0),
             domain_tag_routes=data.get("domain_tag_routes", {}),
         )
+        response_cache = None
+        cache_data = data.get("response_cache")
+        if isinstance(cache_data, dict):
+            from response_cache import ResponseCache
+
+            store_dir = cache_data.get("store_dir")
+            response_cache = ResponseCache(
+                max_entries=cache_data.get("max_entries", 256),
+                store_dir=Path(path).parent / store_dir if store_dir else None,
+            )
         return cls(
             ledger_client=ledger_client,
             budgeter=budgeter,
             config=config,
             dev_mode=dev_mode,
+            response_cache=response_cache,
         )
 
     def register_provider(self, provider_id: str, provider: Any) -> None:
@@ -236,6 +272,62 @@ class LLMGateway:
 
     def route(self, request: PromptRequest) -> PromptResponse:
         """Route a prompt through the 10-step pipeline."""
+        steps = self._route_steps(request)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            if op == _SLEEP:
+                time.sleep(arg)
+                continue
+            provider, send_kwargs = arg
+            try:
+                reply = provider.send(**send_kwargs)
+            except Exception as e:
+                error = e
+
+    async def route_async(self, request: PromptRequest) -> PromptResponse:
+        """Awaitable route(): same pipeline, provider I/O does not block the loop.
+
+        Uses the provider's send_async() when it has one, otherwise runs
+        send() in the default executor.
+        """
+        steps = self._route_steps(request)
+        reply: Any = None
+        error: Optional[BaseException] = None
+        while True:
+            try:
+                op, arg = steps.throw(error) if error is not None else steps.send(reply)
+            except StopIteration as done:
+                return done.value
+            reply, error = None, None
+            if op == _SLEEP:
+                await asyncio.sleep(arg)
+                continue
+            provider, send_kwargs = arg
+            try:
+                send_async = getattr(provider, "send_async", None)
+                if asyncio.iscoroutinefunction(send_async):
+                    reply = await send_async(**send_kwargs)
+                else:
+                    loop = asyncio.get_running_loop()
+                    reply = await loop.run_in_executor(None, lambda: provider.send(**send_kwargs))
+            except Exception as e:
+                error = e
+
+    def _route_steps(
+        self, request: PromptRequest,
+    ) -> Generator[tuple[str, Any], Any, PromptResponse]:
+        """The routing pipeline, suspended at each provider send and backoff.
+
+        Yields (_SEND, (provider, kwargs)) and expects the provider response
+        (or the send exception thrown back in), and (_SLEEP, seconds).
+        Returns the PromptResponse.
+        """
         from hashing import sha256_string
 
         start_time = time.time()
@@ -278,6 +370,20 @@ class LLMGateway:
         # Step 4: Compute context hash
         context_hash = sha256_string(request.prompt)
 
+        # Step 4b: Replay a deterministic exchange from the response cache
+        cache_key = None
+        if self._response_cache is not None and request.temperature == 0:
+            cache_key = self._response_cache.key(
+                provider_id, model_id, request.max_tokens, context_hash,
+                request.structured_output, request.tools,
+            )
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return self._cached_response(
+                    request, cached, context_hash, start_time, timestamp,
+                    model_id, provider_id,
+                )
+
         # Step 5: Check circuit breaker
         if not self._circuit_breaker.allow_request():
             return self._reject(
@@ -327,8 +433,9 @@ class LLMGateway:
         retry_count = 0
         provider_response = None
         while True:
+            send_start = time.time()
             try:
-                provider_response = provider.send(
+                provider_response = yield _SEND, (provider, dict(
                     model_id=model_id,
                     prompt=request.prompt,
                     max_tokens=request.max_tokens,
@@ -336,7 +443,8 @@ class LLMGateway:
                     timeout_ms=timeout_ms,
                     structured_output=request.structured_output,
                     tools=request.tools,
-                )
+                ))
+                send_ms = self._elapsed_ms(send_start)
                 break
             except Exception as e:
                 self._circuit_breaker.record_failure()
@@ -378,10 +486,13 @@ class LLMGateway:
                 retry_count += 1
                 if retry_backoff_ms > 0:
                     # Simple bounded linear backoff keeps behavior deterministic.
-                    time.sleep((retry_backoff_ms * retry_count) / 1000.0)
+                    yield _SLEEP, (retry_backoff_ms * retry_count) / 1000.0
 
         # Success path
         self._circuit_breaker.record_success()
+        if cache_key is not None:
+            self._response_cache.put(cache_key, provider_response)
+        queue_wait_ms = float(getattr(provider_response, "queue_wait_ms", 0.0) or 0.0)
 
         # Step 8: Write exchange record
         exchange_entry_id = self._write_exchange(
@@ -392,6 +503,7 @@ class LLMGateway:
             model_id=model_id,
             latency_ms=self._elapsed_ms(start_time),
             retry_count=retry_count,
+            queue_wait_ms=queue_wait_ms,
         )
 
         # Step 9: Debit budget
@@ -423,6 +535,8 @@ class LLMGateway:
             )
 
         # Step 11: Return
+        latency_ms = self._elapsed_ms(start_time)
+        provider_ms = max(0.0, send_ms - queue_wait_ms)
         return PromptResponse(
             content=provider_response.content,
             outcome=RouteOutcome.SUCCESS,
@@ -430,7 +544,7 @@ class LLMGateway:
             output_tokens=provider_response.output_tokens,
             model_id=model_id,
             provider_id=provider_id,
-            latency_ms=self._elapsed_ms(start_time),
+            latency_ms=latency_ms,
             timestamp=timestamp,
             exchange_entry_id=exchange_entry_id,
             dispatch_entry_id=dispatch_entry_id,
@@ -441,6 +555,11 @@ class LLMGateway:
             budget_remaining=budget_remaining,
             finish_reason=getattr(provider_response, "finish_reason", "stop"),
             content_blocks=getattr(provider_response, "content_blocks", None),
+            latency_breakdown={
+                "queue_wait_ms": queue_wait_ms,
+                "provider_ms": provider_ms,
+                "overhead_ms": max(0.0, latency_ms - queue_wait_ms - provider_ms),
+            },
         )
 
     # ── Internal pipeline steps ──
@@ -543,8 +662,14 @@ class LLMGateway:
         model_id: str,
         latency_ms: float,
         retry_count: int = 0,
+        cache_hit: bool = False,
+        queue_wait_ms: float = 0.0,
     ) -> str:
-        """Write EXCHANGE record for successful round-trip."""
+        """Write EXCHANGE record for successful round-trip.
+
+        A cache hit records zero tokens; the replayed exchange's token counts
+        go to cached_input_tokens/cached_output_tokens.
+        """
         from ledger_client import LedgerEntry
 
         # Tool-use observability
@@ -569,8 +694,8 @@ class LLMGateway:
                 "response": provider_response.content,
                 "outcome": "success",
                 # Cost
-                "input_tokens": provider_response.input_tokens,
-                "output_tokens": provider_response.output_tokens,
+                "input_tokens": 0 if cache_hit else provider_response.input_tokens,
+                "output_tokens": 0 if cache_hit else provider_response.output_tokens,
                 # Context
                 "context_hash": context_hash,
                 # Correlation
@@ -580,6 +705,7 @@ class LLMGateway:
                 "finish_reason": provider_response.finish_reason,
                 # Timing
                 "latency_ms": latency_ms,
+                "queue_wait_ms": queue_wait_ms,
                 # Tool observability
                 "tools_offered": tools_offered,
                 "tool_use_in_response": tool_use_in_response,
@@ -588,6 +714,12 @@ class LLMGateway:
                 "attempts_total": retry_count + 1,
             },
         )
+        if cache_hit:
+            entry.metadata.update({
+                "cache_hit": True,
+                "cached_input_tokens": provider_response.input_tokens,
+                "cached_output_tokens": provider_response.output_tokens,
+            })
         return self._ledger.write(entry)
 
     def _write_exchange_error(
@@ -691,6 +823,46 @@ class LLMGateway:
 
         return (len(errors) == 0, errors)
 
+    def _cached_response(
+        self, request: PromptRequest, cached: Any, context_hash: str,
+        start_time: float, timestamp: str, model_id: str, provider_id: str,
+    ) -> PromptResponse:
+        """Answer from the response cache: log the exchange, debit nothing."""
+        exchange_entry_id = self._write_exchange(
+            request=request,
+            dispatch_entry_id="",
+            provider_response=cached,
+            context_hash=context_hash,
+            model_id=model_id,
+            latency_ms=self._elapsed_ms(start_time),
+            cache_hit=True,
+        )
+        output_valid = None
+        output_errors: list[str] = []
+        if request.output_schema:
+            output_valid, output_errors = self._validate_output(
+                cached.content, request.output_schema
+            )
+        latency_ms = self._elapsed_ms(start_time)
+        return PromptResponse(
+            content=cached.content,
+            outcome=RouteOutcome.SUCCESS,
+            input_tokens=0,
+            output_tokens=0,
+            model_id=model_id,
+            provider_id=provider_id,
+            latency_ms=latency_ms,
+            timestamp=timestamp,
+            exchange_entry_id=exchange_entry_id,
+            output_valid=output_valid,
+            output_validation_errors=output_errors,
+            context_hash=context_hash,
+            finish_reason=cached.finish_reason,
+            content_blocks=cached.content_blocks,
+            cache_hit=True,
+            latency_breakdown={"queue_wait_ms": 0.0, "provider_ms": 0.0, "overhead_ms": latency_ms},
+        )
+
     def _reject(
         self, request: PromptRequest, error_code: str, error_message: str,
         start_time: float, timestamp: str, model_id: str, provider_id: str,
@@ -6,6 +6,7 @@ configurable MockProvider for testing without real LLM calls.
 
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
 from dataclasses import dataclass, field
@@ -24,6 +25,7 @@ class ProviderResponse:
     provider_id: str
     cached: bool = False
     finish_reason: str = "stop"
+    queue_wait_ms: float = 0.0  # time spent waiting for an in-flight slot
 
 
 @dataclass
@@ -59,6 +61,14 @@ class LLMProvider(Protocol):
         ...
 
 
+# Providers may also implement an awaitable twin of send():
+#
+#     async def send_async(self, model_id, prompt, ...) -> ProviderResponse
+#
+# It is optional; LLMGateway.route_async() runs send() in a worker thread
+# for providers that only implement the blocking call.
+
+
 class MockProvider:
     """Configurable mock LLM provider for testing."""
 
@@ -97,6 +107,46 @@ class MockProvider:
         tools: Optional[list[dict[str, Any]]] = None,
     ) -> ProviderResponse:
         """Send a mock prompt — returns configured response or raises configured error."""
+        call_number = self._record_call(
+            model_id, prompt, max_tokens, temperature, timeout_ms, structured_output, tools,
+        )
+
+        # Simulate latency
+        if self._latency_ms > 0:
+            time.sleep(self._latency_ms / 1000.0)
+
+        return self._respond(model_id, call_number)
+
+    async def send_async(
+        self,
+        model_id: str,
+        prompt: str,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        timeout_ms: int = 30000,
+        structured_output: Optional[dict[str, Any]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> ProviderResponse:
+        """Awaitable send() — simulated latency yields to the event loop."""
+        call_number = self._record_call(
+            model_id, prompt, max_tokens, temperature, timeout_ms, structured_output, tools,
+        )
+
+        if self._latency_ms > 0:
+            await asyncio.sleep(self._latency_ms / 1000.0)
+
+        return self._respond(model_id, call_number)
+
+    def _record_call(
+        self,
+        model_id: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        timeout_ms: int,
+        structured_output: Optional[dict[str, Any]],
+        tools: Optional[list[dict[str, Any]]],
+    ) -> int:
         self.calls.append(
             {
                 "model_id": model_id,
@@ -109,13 +159,11 @@ class MockProvider:
             }
         )
         self.call_count += 1
+        return self.call_count
 
-        # Simulate latency
-        if self._latency_ms > 0:
-            time.sleep(self._latency_ms / 1000.0)
-
+    def _respond(self, model_id: str, call_number: int) -> ProviderResponse:
         # Check if we should fail
-        if self._fail_after is not None and self.call_count > self._fail_after:
+        if self._fail_after is not None and call_number > self._fail_after:
             raise self._fail_with or ProviderError(
                 message="Mock failure",
                 code="SERVER_ERROR",
@@ -123,8 +171,8 @@ class MockProvider:
             )
 
         # Return from response queue or default
-        if self._responses and self.call_count <= len(self._responses):
-            return self._responses[self.call_count - 1]
+        if self._responses and call_number <= len(self._responses):
+            return self._responses[call_number - 1]
 
         return ProviderResponse(
             content=self._default_response,
@@ -0,0 +1,133 @@
+"""Response Cache — reuse of deterministic LLM exchanges.
+
+LLMGateway consults the cache for temperature == 0 requests only. Entries
+are keyed on the provider, model, max_tokens, the prompt's context_hash and
+a hash of the structured_output/tools schemas, so a hit means the provider
+would have been sent the exact same request.
+
+Entries live in a bounded in-memory LRU. With store_dir set, every entry is
+also written there as <key>.json (temp file + rename), and memory misses
+fall back to the store, so cached responses survive a restart. The on-disk
+store is not size-bounded; delete the directory to reset it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+
+@dataclass
+class CachedResponse:
+    """A provider response as replayed from the cache."""
+
+    content: str
+    model: str
+    input_tokens: int
+    output_tokens: int
+    provider_id: str
+    finish_reason: str = "stop"
+    content_blocks: Optional[tuple] = None
+    request_id: str = ""
+    cached: bool = True
+
+
+class ResponseCache:
+    """Bounded LRU of provider responses with an optional on-disk store."""
+
+    def __init__(self, max_entries: int = 256, store_dir: Optional[Path] = None):
+        self._max_entries = max(1, int(max_entries))
+        self._store_dir = Path(store_dir) if store_dir is not None else None
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def key(
+        provider_id: str,
+        model_id: str,
+        max_tokens: int,
+        context_hash: str,
+        structured_output: Optional[dict[str, Any]] = None,
+        tools: Optional[list[dict[str, Any]]] = None,
+    ) -> str:
+        """Cache key for one request (hex SHA-256)."""
+        from hashing import sha256_string
+
+        schema_hash = sha256_string(json.dumps(
+            {"structured_output": structured_output, "tools": tools},
+            sort_keys=True, separators=(",", ":"), default=str,
+        ))
+        return sha256_string("\n".join(
+            (provider_id, model_id, str(max_tokens), context_hash, schema_hash)
+        ))
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for key, or None."""
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+                return cached
+        cached = self._read(key)
+        with self._lock:
+            if cached is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self._remember(key, cached)
+        return cached
+
+    def put(self, key: str, response: Any) -> None:
+        """Store a provider response (anything shaped like ProviderResponse)."""
+        blocks = getattr(response, "content_blocks", None)
+        cached = CachedResponse(
+            content=response.content,
+            model=response.model,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            provider_id=getattr(response, "provider_id", ""),
+            finish_reason=getattr(response, "finish_reason", "stop"),
+            content_blocks=tuple(blocks) if blocks is not None else None,
+            request_id=getattr(response, "request_id", ""),
+        )
+        with self._lock:
+            self._remember(key, cached)
+        if self._store_dir is not None:
+            self._write(key, cached)
+
+    def _remember(self, key: str, cached: CachedResponse) -> None:
+        self._entries[key] = cached
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key: str) -> Optional[CachedResponse]:
+        if self._store_dir is None:
+            return None
+        try:
+            data = json.loads((self._store_dir / f"{key}.json").read_text())
+            blocks = data.get("content_blocks")
+            data["content_blocks"] = tuple(blocks) if blocks is not None else None
+            data.pop("cached", None)
+            return CachedResponse(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _write(self, key: str, cached: CachedResponse) -> None:
+        try:
+            self._store_dir.mkdir(parents=True, exist_ok=True)
+            path = self._store_dir / f"{key}.json"
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            data = asdict(cached)
+            data.pop("cached")
+            tmp.write_text(json.dumps(data, default=str))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            pass  # The store is best-effort; the in-memory entry stands.
@@ -734,3 +734,289 @@ class TestTimeoutRetryPolicy29P:
         gw.route(self._request())
 
         assert observed["timeout_ms"] == 65432
+
+
+# ===========================================================================
+# Async Route Tests (3)
+# ===========================================================================
+
+class TestRouteAsync:
+    def _request(self, n=0):
+        from llm_gateway import PromptRequest
+
+        return PromptRequest(
+            prompt=f"async request {n}",
+            prompt_pack_id="PRM-CLASSIFY-001",
+            contract_id="PRC-CLASSIFY-001",
+            agent_id="admin-001.ho1",
+            agent_class="ADMIN",
+            framework_id="FMWK-000",
+            package_id="PKG-HO1-EXECUTOR-001",
+            work_order_id=f"WO-ASYNC-{n:03d}",
+            session_id=f"SES-ASYNC{n:04d}",
+            tier="ho1",
+        )
+
+    def _gateway(self, tmp_path, provider, **config):
+        from llm_gateway import LLMGateway, RouterConfig
+        from ledger_client import LedgerClient
+
+        ledger_path = tmp_path / "ledger" / "async.jsonl"
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        lc = LedgerClient(ledger_path=ledger_path)
+        gw = LLMGateway(
+            ledger_client=lc,
+            config=RouterConfig(default_provider=provider.provider_id, **config),
+            dev_mode=True,
+        )
+        gw.register_provider(provider.provider_id, provider)
+        return gw, lc
+
+    def test_concurrent_routes_overlap_provider_latency(self, tmp_path):
+        import asyncio
+        import time
+        from llm_gateway import RouteOutcome
+        from provider import MockProvider
+
+        provider = MockProvider(latency_ms=200)
+        gw, _ = self._gateway(tmp_path, provider)
+
+        async def _run():
+            return await asyncio.gather(*(gw.route_async(self._request(n)) for n in range(20)))
+
+        start = time.monotonic()
+        responses = asyncio.run(_run())
+        elapsed = time.monotonic() - start
+
+        assert [r.outcome for r in responses] == [RouteOutcome.SUCCESS] * 20
+        assert provider.call_count == 20
+        assert elapsed < 2.0  # sequential sends would take 4s
+
+    def test_sync_only_provider_retries_in_executor(self, tmp_path):
+        import asyncio
+        from llm_gateway import RouteOutcome
+        from provider import ProviderError, ProviderResponse
+
+        class FlakyProvider:
+            provider_id = "flaky"
+
+            def __init__(self):
+                self.calls = 0
+
+            def send(self, **kwargs):
+                self.calls += 1
+                if self.calls == 1:
+                    raise ProviderError("first call timed out", code="TIMEOUT", retryable=True)
+                return ProviderResponse(
+                    content="ok after retry",
+                    model=kwargs["model_id"],
+                    input_tokens=10,
+                    output_tokens=5,
+                    request_id="req-retry-ok",
+                    provider_id=self.provider_id,
+                )
+
+        provider = FlakyProvider()
+        gw, _ = self._gateway(tmp_path, provider, max_retries=1, retry_backoff_ms=1)
+
+        resp = asyncio.run(gw.route_async(self._request()))
+
+        assert resp.outcome == RouteOutcome.SUCCESS
+        assert resp.content == "ok after retry"
+        assert provider.calls == 2
+
+    def test_async_ledger_records_match_sync(self, tmp_path):
+        import asyncio
+        from provider import MockProvider
+
+        sync_gw, sync_lc = self._gateway(tmp_path / "sync", MockProvider())
+        async_gw, async_lc = self._gateway(tmp_path / "async", MockProvider())
+
+        sync_gw.route(self._request())
+        asyncio.run(async_gw.route_async(self._request()))
+
+        sync_entries, async_entries = sync_lc.read_all(), async_lc.read_all()
+        assert [e.event_type for e in async_entries] == [e.event_type for e in sync_entries]
+        assert [sorted(e.metadata) for e in async_entries] == [sorted(e.metadata) for e in sync_entries]
+
+
+# ===========================================================================
+# Response Cache Tests (4)
+# ===========================================================================
+
+class TestResponseCache:
+    def _request(self, **overrides):
+        from llm_gateway import PromptRequest
+
+        fields = dict(
+            prompt="hello there",
+            prompt_pack_id="PRM-CLASSIFY-001",
+            contract_id="PRC-CLASSIFY-001",
+            agent_id="admin-001.ho1",
+            agent_class="ADMIN",
+            framework_id="FMWK-000",
+            package_id="PKG-HO1-EXECUTOR-001",
+            work_order_id="WO-CACHE-001",
+            session_id="SES-CACHE0001",
+            tier="ho1",
+        )
+        fields.update(overrides)
+        return PromptRequest(**fields)
+
+    def _gateway(self, tmp_path, cache, budgeter=None):
+        from llm_gateway import LLMGateway
+        from ledger_client import LedgerClient
+        from provider import MockProvider
+
+        ledger_path = tmp_path / "ledger" / "cache.jsonl"
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        lc = LedgerClient(ledger_path=ledger_path)
+        gw = LLMGateway(ledger_client=lc, budgeter=budgeter, dev_mode=True, response_cache=cache)
+        provider = MockProvider()
+        gw.register_provider("mock", provider)
+        return gw, lc, provider
+
+    def test_repeat_exchange_is_cache_hit_with_zero_debit(self, tmp_path):
+        from llm_gateway import RouteOutcome
+        from response_cache import ResponseCache
+
+        budgeter = MagicMock()
+        budgeter.check.return_value = MagicMock(allowed=True)
+        budgeter.debit.return_value = MagicMock(cost_incurred=0.01, remaining=1000)
+        gw, lc, provider = self._gateway(tmp_path, ResponseCache(), budgeter)
+
+        first = gw.route(self._request())
+        second = gw.route(self._request(work_order_id="WO-CACHE-002"))
+
+        assert first.outcome == second.outcome == RouteOutcome.SUCCESS
+        assert second.content == first.content
+        assert (first.cache_hit, second.cache_hit) == (False, True)
+        assert (second.input_tokens, second.output_tokens, second.cost_incurred) == (0, 0, 0.0)
+        assert provider.call_count == 1
+        assert budgeter.debit.call_count == 1
+
+        entries = lc.read_all()
+        assert [e.event_type for e in entries] == ["DISPATCH", "EXCHANGE", "EXCHANGE"]
+        hit = entries[-1].metadata
+        assert hit["cache_hit"] is True
+        assert (hit["input_tokens"], hit["output_tokens"]) == (0, 0)
+        assert hit["cached_input_tokens"] == first.input_tokens
+        assert hit["work_order_id"] == "WO-CACHE-002"
+        assert "cache_hit" not in entries[1].metadata
+
+    def test_only_identical_deterministic_requests_hit(self, tmp_path):
+        from response_cache import ResponseCache
+
+        gw, _, provider = self._gateway(tmp_path, ResponseCache())
+        tools = [{"name": "read_file", "input_schema": {"type": "object"}}]
+
+        gw.route(self._request())
+        assert gw.route(self._request(temperature=0.7)).cache_hit is False
+        assert gw.route(self._request(tools=tools)).cache_hit is False
+        assert gw.route(self._request(max_tokens=100)).cache_hit is False
+        assert gw.route(self._request(prompt="hello again")).cache_hit is False
+        assert gw.route(self._request(tools=tools)).cache_hit is True
+        assert provider.call_count == 5
+
+    def test_disk_store_survives_new_cache(self, tmp_path):
+        from types import SimpleNamespace
+        from response_cache import ResponseCache
+
+        key = ResponseCache.key("anthropic", "m1", 4096, "ctx", None, [{"name": "t"}])
+        response = SimpleNamespace(
+            content="", model="m1", input_tokens=7, output_tokens=3,
+            request_id="req-1", provider_id="anthropic", finish_reason="tool_use",
+            content_blocks=({"type": "tool_use", "id": "tu1", "name": "t", "input": {}},),
+        )
+        ResponseCache(store_dir=tmp_path / "cache").put(key, response)
+
+        cached = ResponseCache(store_dir=tmp_path / "cache").get(key)
+
+        assert cached is not None
+        assert cached.finish_reason == "tool_use"
+        assert cached.content_blocks == response.content_blocks
+        assert (cached.input_tokens, cached.output_tokens) == (7, 3)
+        assert ResponseCache(store_dir=tmp_path / "cache").get("missing") is None
+
+    def test_memory_cache_is_bounded_lru(self):
+        from provider import ProviderResponse
+        from response_cache import ResponseCache
+
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, ProviderResponse(key, "m", 1, 1, "r", "mock"))
+        cache.get("a")
+        cache.put("c", ProviderResponse("c", "m", 1, 1, "r", "mock"))
+
+        assert cache.get("b") is None
+        assert cache.get("a").content == "a"
+        assert cache.get("c").content == "c"
+        assert cache.stats == {"hits": 3, "misses": 1}
+
+
+# ===========================================================================
+# Latency Breakdown Tests (2)
+# ===========================================================================
+
+class TestLatencyBreakdown:
+    def _request(self):
+        from llm_gateway import PromptRequest
+
+        return PromptRequest(
+            prompt="how long",
+            prompt_pack_id="PRM-CLASSIFY-001",
+            contract_id="PRC-CLASSIFY-001",
+            agent_id="admin-001.ho1",
+            agent_class="ADMIN",
+            framework_id="FMWK-000",
+            package_id="PKG-HO1-EXECUTOR-001",
+            work_order_id="WO-LAT-001",
+            session_id="SES-LAT00001",
+            tier="ho1",
+        )
+
+    def test_queue_wait_reported_in_breakdown_and_exchange(self, tmp_path):
+        import time
+        from llm_gateway import LLMGateway, RouterConfig
+        from ledger_client import LedgerClient
+        from provider import ProviderResponse
+
+        class QueuedProvider:
+            provider_id = "queued"
+
+            def send(self, **kwargs):
+                time.sleep(0.05)
+                return ProviderResponse(
+                    content="ok", model=kwargs["model_id"], input_tokens=3, output_tokens=2,
+                    request_id="req-q", provider_id=self.provider_id, queue_wait_ms=20.0,
+                )
+
+        ledger_path = tmp_path / "ledger" / "latency.jsonl"
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        lc = LedgerClient(ledger_path=ledger_path)
+        gw = LLMGateway(ledger_client=lc, config=RouterConfig(default_provider="queued"), dev_mode=True)
+        gw.register_provider("queued", QueuedProvider())
+
+        resp = gw.route(self._request())
+
+        parts = resp.latency_breakdown
+        assert parts["queue_wait_ms"] == 20.0
+        assert parts["provider_ms"] >= 25.0
+        assert abs(sum(parts.values()) - resp.latency_ms) < 1.0
+        exchange = [e for e in lc.read_all() if e.event_type == "EXCHANGE"][0]
+        assert exchange.metadata["queue_wait_ms"] == 20.0
+
+    def test_providers_without_queue_report_zero_wait(self, tmp_path):
+        from llm_gateway import LLMGateway
+        from ledger_client import LedgerClient
+        from provider import MockProvider
+
+        ledger_path = tmp_path / "ledger" / "latency.jsonl"
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        gw = LLMGateway(ledger_client=LedgerClient(ledger_path=ledger_path), dev_mode=True)
+        gw.register_provider("mock", MockProvider())
+
+        resp = gw.route(self._request())
+
+        assert resp.latency_breakdown["queue_wait_ms"] == 0.0
+        assert set(resp.latency_breakdown) == {"queue_wait_ms", "provider_ms", "overhead_ms"}
@@ -7,6 +7,7 @@ All state changes are logged to the ledger for auditability and cold-start recon
 from __future__ import annotations
 
 import json
+import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
@@ -192,7 +193,11 @@ class _ScopeState:
 
 
 class TokenBudgeter:
-    """Hierarchical token budget manager with rate limiting and ledger integration."""
+    """Hierarchical token budget manager with rate limiting and ledger integration.
+
+    Scope state is guarded by one lock, so work orders running on several
+    threads can check and debit the same parent scopes.
+    """
 
     def __init__(
         self,
@@ -204,6 +209,7 @@ class TokenBudgeter:
         self._config = config
         self._rate_config = rate_limit_config
         self._scopes: dict[str, _ScopeState] = {}
+        self._lock = threading.RLock()
 
     @classmethod
     def from_config_file(cls, path: Path, ledger_client: Any) -> TokenBudgeter:
@@ -229,10 +235,9 @@ class TokenBudgeter:
         budgeter = cls(ledger_client=ledger_client, config=config)
 
         # Replay BUDGET_ALLOCATE and BUDGET_DEBIT entries
-        all_entries = ledger_client.read_all()
-        budget_entries = [
-            e for e in all_entries if e.event_type in ("BUDGET_ALLOCATE", "BUDGET_DEBIT")
-        ]
+        budget_entries = list(
+            ledger_client.iter_entries(event_types=("BUDGET_ALLOCATE", "BUDGET_DEBIT"))
+        )
         # Sort by timestamp for correct replay order
         budget_entries.sort(key=lambda e: e.timestamp)
 
@@ -275,7 +280,8 @@ class TokenBudgeter:
             turn_limit=allocation.turn_limit,
             timeout_seconds=allocation.timeout_seconds,
         )
-        self._scopes[scope.scope_key] = state
+        with self._lock:
+            self._scopes[scope.scope_key] = state
 
         entry = LedgerEntry(
             event_type="BUDGET_ALLOCATE",
@@ -312,6 +318,10 @@ class TokenBudgeter:
 
     def check(self, scope: BudgetScope) -> BudgetCheckResult:
         """Check if a request is within budget (read-only)."""
+        with self._lock:
+            return self._check_locked(scope)
+
+    def _check_locked(self, scope: BudgetScope) -> BudgetCheckResult:
         resolved_key, state = self._resolve_scope(scope)
         if state is None:
             return BudgetCheckResult(
@@ -371,43 +381,47 @@ class TokenBudgeter:
         """Debit token usage from the budget. Returns DebitResult."""
         from ledger_client import LedgerEntry
 
-        resolved_key, state = self._resolve_scope(scope)
-        if state is None:
-            return DebitResult(
-                success=False,
-                remaining=0,
-                total_consumed=0,
-                cost_incurred=0.0,
-                ledger_entry_id="",
-            )
+        with self._lock:
+            resolved_key, state = self._resolve_scope(scope)
+            if state is None:
+                return DebitResult(
+                    success=False,
+                    remaining=0,
+                    total_consumed=0,
+                    cost_incurred=0.0,
+                    ledger_entry_id="",
+                )
 
-        # Record timestamp for rate limiting
-        now = time.time()
-        state.request_timestamps.append(now)
-        state.consumed_input += usage.input_tokens
-        state.consumed_output += usage.output_tokens
-        state.request_count += 1
-
-        timestamp_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
-        state.last_request_at = timestamp_iso
-
-        # Debit parent scopes (walk up from the resolved key, not the original)
-        resolved_parts = resolved_key.split("/")
-        parent_key = "/".join(resolved_parts[:-1]) if len(resolved_parts) > 1 else None
-        parent_scope_key = None
-        while parent_key:
-            parent_state = self._scopes.get(parent_key)
-            if parent_state:
-                parent_state.consumed_input += usage.input_tokens
-                parent_state.consumed_output += usage.output_tokens
-                parent_state.request_count += 1
-                parent_state.request_timestamps.append(now)
-                parent_state.last_request_at = timestamp_iso
-                if parent_scope_key is None:
-                    parent_scope_key = parent_key
-            # Walk up
-            parts = parent_key.split("/")
-            parent_key = "/".join(parts[:-1]) if len(parts) > 1 else None
+            # Record timestamp for rate limiting
+            now = time.time()
+            state.request_timestamps.append(now)
+            state.consumed_input += usage.input_tokens
+            state.consumed_output += usage.output_tokens
+            state.request_count += 1
+
+            timestamp_iso = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now))
+            state.last_request_at = timestamp_iso
+
+            # Debit parent scopes (walk up from the resolved key, not the original)
+            resolved_parts = resolved_key.split("/")
+            parent_key = "/".join(resolved_parts[:-1]) if len(resolved_parts) > 1 else None
+            parent_scope_key = None
+            while parent_key:
+                parent_state = self._scopes.get(parent_key)
+                if parent_state:
+                    parent_state.consumed_input += usage.input_tokens
+                    parent_state.consumed_output += usage.output_tokens
+                    parent_state.request_count += 1
+                    parent_state.request_timestamps.append(now)
+                    parent_state.last_request_at = timestamp_iso
+                    if parent_scope_key is None:
+                        parent_scope_key = parent_key
+                # Walk up
+                parts = parent_key.split("/")
+                parent_key = "/".join(parts[:-1]) if len(parts) > 1 else None
+
+            remaining = state.remaining
+            total_consumed = state.consumed_total
 
         cost = self.estimate_cost(usage.model_id, usage.input_tokens, usage.output_tokens)
 
@@ -427,21 +441,25 @@ class TokenBudgeter:
                 "total_tokens": usage.total,
                 "model_id": usage.model_id,
                 "cost_incurred": cost,
-                "remaining": state.remaining,
+                "remaining": remaining,
             },
         )
         entry_id = self._ledger.write(entry)
 
         return DebitResult(
             success=True,
-            remaining=state.remaining,
-            total_consumed=state.consumed_total,
+            remaining=remaining,
+            total_consumed=total_consumed,
             cost_incurred=cost,
             ledger_entry_id=entry_id,
         )
 
     def get_status(self, scope: BudgetScope) -> BudgetStatus:
         """Get current status of a budget scope."""
+        with self._lock:
+            return self._status_locked(scope)
+
+    def _status_locked(self, scope: BudgetScope) -> BudgetStatus:
         state = self._scopes.get(scope.scope_key)
         if state is None:
             return BudgetStatus(
@@ -480,27 +498,28 @@ class TokenBudgeter:
         total_output = 0
         total_cost = 0.0
 
-        for key, state in self._scopes.items():
-            if not key.startswith(session_id):
-                continue
-            # Skip the session-level scope itself
-            parts = key.split("/")
-            if len(parts) < 2:
-                continue
-            wo_id = parts[1]
-            wo_input = state.consumed_input
-            wo_output = state.consumed_output
-            wo_summaries.append(
-                {
-                    "work_order_id": wo_id,
-                    "consumed_input": wo_input,
-                    "consumed_output": wo_output,
-                    "consumed_total": state.consumed_total,
-                    "request_count": state.request_count,
-                }
-            )
-            total_input += wo_input
-            total_output += wo_output
+        with self._lock:
+            for key, state in self._scopes.items():
+                if not key.startswith(session_id):
+                    continue
+                # Skip the session-level scope itself
+                parts = key.split("/")
+                if len(parts) < 2:
+                    continue
+                wo_id = parts[1]
+                wo_input = state.consumed_input
+                wo_output = state.consumed_output
+                wo_summaries.append(
+                    {
+                        "work_order_id": wo_id,
+                        "consumed_input": wo_input,
+                        "consumed_output": wo_output,
+                        "consumed_total": state.consumed_total,
+                        "request_count": state.request_count,
+                    }
+                )
+                total_input += wo_input
+                total_output += wo_output
 
         return SessionSummary(
             session_id=session_id,
@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
 import time
 from pathlib import Path
 from unittest.mock import patch
@@ -337,3 +338,36 @@ class TestTokenBudgeter:
         assert reconstructed_status.remaining == original_status.remaining
         assert reconstructed_status.request_count == original_status.request_count
         assert reconstructed_status.turn_limit == original_status.turn_limit
+
+    def test_concurrent_debits_share_parent_scope(self, tmp_path: Path) -> None:
+        """Debits from several threads all land on the shared session scope."""
+        ledger = _make_ledger(tmp_path)
+        budgeter = TokenBudgeter(ledger_client=ledger, config=_default_config())
+        session = BudgetScope(session_id="SES-TEST0001")
+        budgeter.allocate(session, BudgetAllocation(token_limit=10_000_000))
+        scopes = [
+            BudgetScope(session_id="SES-TEST0001", work_order_id=f"WO-20260210-00{i}")
+            for i in range(4)
+        ]
+        for scope in scopes:
+            budgeter.allocate(scope, BudgetAllocation(token_limit=1_000_000))
+
+        def worker(scope: BudgetScope) -> None:
+            for _ in range(100):
+                budgeter.debit(scope, TokenUsage(input_tokens=3, output_tokens=2, model_id="claude-opus-4-6"))
+
+        switch = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=worker, args=(scope,)) for scope in scopes]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(switch)
+
+        status = budgeter.get_status(session)
+        assert status.consumed_total == 4 * 100 * 5
+        assert status.request_count == 400
+        assert budgeter.get_session_summary("SES-TEST0001").total_consumed == 2000